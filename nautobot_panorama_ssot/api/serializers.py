@@ -1,8 +1,8 @@
 """API serializers for nautobot_ssot panorama."""
 
-from nautobot.apps.api import NautobotModelSerializer
+from nautobot.apps.api import BaseModelSerializer, NautobotModelSerializer
 
-from nautobot_panorama_ssot.models import SSOTPanoramaConfig
+from nautobot_panorama_ssot.models import PanoramaDriftRecord, SSOTPanoramaConfig
 
 
 class SSOTPanoramaConfigSerializer(NautobotModelSerializer):  # pylint: disable=too-many-ancestors
@@ -13,3 +13,13 @@ class SSOTPanoramaConfigSerializer(NautobotModelSerializer):  # pylint: disable=
 
         model = SSOTPanoramaConfig
         fields = "__all__"
+
+
+class PanoramaDriftRecordSerializer(BaseModelSerializer):  # pylint: disable=too-many-ancestors
+    """Read-only REST API serializer for PanoramaDriftRecord history."""
+
+    class Meta:
+        """Meta attributes."""
+
+        model = PanoramaDriftRecord
+        fields = "__all__"
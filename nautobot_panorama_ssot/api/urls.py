@@ -1,12 +1,22 @@
 """Django urlpatterns declaration for nautobot_ssot panorama API."""
 
+from django.urls import path
 from rest_framework import routers
 
-from nautobot_panorama_ssot.api.views import SSOTPanoramaConfigView
+from nautobot_panorama_ssot.api.views import (
+    PanoramaDriftRecordView,
+    PanoramaMetricsView,
+    SSOTPanoramaConfigView,
+)
 
 router = routers.DefaultRouter()
 
 router.register("SSOTPanoramaConfig", SSOTPanoramaConfigView)
+router.register("drift-records", PanoramaDriftRecordView)
 app_name = "nautobot_panorama_ssot"  # pylint: disable=invalid-name
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("metrics/", PanoramaMetricsView.as_view(), name="metrics"),
+]
+
+urlpatterns += router.urls
@@ -1,11 +1,15 @@
 """API views for nautobot_ssot panorama."""
 
-from nautobot.apps.api import NautobotModelViewSet
+from django.http import HttpResponse
+from nautobot.apps.api import NautobotModelViewSet, ReadOnlyModelViewSet
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
 
-from nautobot_panorama_ssot.filters import SSOTPanoramaConfigFilterSet
-from nautobot_panorama_ssot.models import SSOTPanoramaConfig
+from nautobot_panorama_ssot.filters import PanoramaDriftRecordFilterSet, SSOTPanoramaConfigFilterSet
+from nautobot_panorama_ssot.models import PanoramaDriftRecord, SSOTPanoramaConfig
 
-from .serializers import SSOTPanoramaConfigSerializer
+from .serializers import PanoramaDriftRecordSerializer, SSOTPanoramaConfigSerializer
 
 
 class SSOTPanoramaConfigView(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
@@ -14,3 +18,38 @@ class SSOTPanoramaConfigView(NautobotModelViewSet):  # pylint: disable=too-many-
     queryset = SSOTPanoramaConfig.objects.all()
     filterset_class = SSOTPanoramaConfigFilterSet
     serializer_class = SSOTPanoramaConfigSerializer
+
+
+class DriftRecordPagination(CursorPagination):
+    """Keyset pagination; stays fast on deep pages of a large history."""
+
+    ordering = ("-recorded", "-id")
+    page_size = 100
+    page_size_query_param = "limit"
+    max_page_size = 1000
+
+
+class PanoramaDriftRecordView(ReadOnlyModelViewSet):  # pylint: disable=too-many-ancestors
+    """API read operations for drift history, restricted by object permissions."""
+
+    queryset = PanoramaDriftRecord.objects.all()
+    serializer_class = PanoramaDriftRecordSerializer
+    filterset_class = PanoramaDriftRecordFilterSet
+    pagination_class = DriftRecordPagination
+
+
+class PanoramaMetricsView(APIView):
+    """Prometheus metrics for Panorama SSOT operations."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        from nautobot_panorama_ssot.utils.metrics import render_metrics
+
+        rendered = render_metrics()
+
+        if rendered is None:
+            return HttpResponse("prometheus_client is not installed\n", status=501, content_type="text/plain")
+
+        payload, content_type = rendered
+        return HttpResponse(payload, content_type=content_type)
@@ -18,6 +18,30 @@ DEFAULT_STATUS_NAME = "Active"
 PANORAMA_API_VERSION = "v11.1"
 PANORAMA_API_PATH = "/api/"
 
+# Native address entry keys (<ip-netmask>, <ip-range>, ...)
+ADDRESS_TYPES = ("ip-netmask", "ip-range", "ip-wildcard", "fqdn")
+
+# In-flight request ceiling for AsyncPanoramaClient
+DEFAULT_ASYNC_CONCURRENCY = 100
+
+# ==========================================================
+# CLIENT FLOW CONTROL
+# ==========================================================
+
+DEFAULT_MAX_CONCURRENCY = 10
+# Responses slower than this (seconds) count as overload
+DEFAULT_LATENCY_TARGET = 5.0
+OVERLOAD_STATUS_CODES = (429, 503)
+
+# Retries on transient failures (per request, not counting the first try)
+DEFAULT_MAX_RETRIES = 3
+# Backoff is factor * 2**attempt seconds, plus jitter, capped at the max
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+DEFAULT_RETRY_BACKOFF_MAX = 30.0
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+# Safe to repeat when the outcome of the first attempt is unknown
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
 # ==========================================================
 # ENV VARS
 # ==========================================================
@@ -40,3 +64,80 @@ DEFAULT_AUTO_REORDER = False
 
 DEFAULT_SAFE_COMMIT_MODE = "advisory"
 DEFAULT_SAFE_COMMIT_THRESHOLD = 70
+
+# ==========================================================
+# HIT COUNT TIME-SERIES
+# ==========================================================
+
+HIT_COUNT_RESOLUTION_RAW = "raw"
+HIT_COUNT_RESOLUTION_HOURLY = "hourly"
+HIT_COUNT_RESOLUTION_DAILY = "daily"
+
+# Age after which samples are rolled into the next resolution
+HIT_COUNT_RAW_RETENTION_HOURS = 48
+HIT_COUNT_HOURLY_RETENTION_DAYS = 30
+HIT_COUNT_DAILY_RETENTION_DAYS = 365
+
+DEFAULT_HIT_COUNT_WINDOW_DAYS = 30
+
+# ==========================================================
+# ADAPTER STATE CACHE
+# ==========================================================
+
+# Reuse cached state without contacting Panorama (seconds)
+DEFAULT_STATE_CACHE_TTL = 300
+# Reuse cached state if the config version still matches (seconds)
+DEFAULT_STATE_CACHE_MAX_AGE = 86400
+
+# ==========================================================
+# DRIFT AUDIT
+# ==========================================================
+
+# Records buffered before a flush to the audit sinks
+DEFAULT_AUDIT_BATCH_SIZE = 1000
+# Most recent records kept in memory for export()
+DEFAULT_AUDIT_TAIL = 1000
+
+# ==========================================================
+# PROFILING
+# ==========================================================
+
+PROFILER_CPROFILE = "cprofile"
+PROFILER_PYINSTRUMENT = "pyinstrument"
+
+PROFILER_CHOICES = (
+    ("", "Disabled"),
+    (PROFILER_CPROFILE, "cProfile"),
+    (PROFILER_PYINSTRUMENT, "pyinstrument (sampling)"),
+)
+
+# ==========================================================
+# SHARDED / FLEET JOBS
+# ==========================================================
+
+DEFAULT_SHARD_SIZE = 10
+DEFAULT_SHARD_TIMEOUT = 4 * 3600
+
+# Child sync jobs running at once across a fleet run, and per Panorama
+DEFAULT_FLEET_BUDGET = 4
+DEFAULT_PER_PANORAMA_LIMIT = 1
+DEFAULT_FLEET_TIMEOUT = 8 * 3600
+
+# ==========================================================
+# SYNC PHASES
+# ==========================================================
+
+# DataSyncBaseJob methods timed (and optionally profiled) as phases
+SYNC_PHASES = (
+    "load_source_adapter",
+    "load_target_adapter",
+    "calculate_diff",
+    "execute_sync",
+)
+
+# ==========================================================
+# BOOTSTRAP
+# ==========================================================
+
+# Bump when nautobot_database_ready_callback creates something new
+BOOTSTRAP_VERSION = "1"
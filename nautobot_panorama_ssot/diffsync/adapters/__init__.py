@@ -1,9 +1,23 @@
-"""Initialize Adapter classes for loading DiffSyncModels with data from Panorama or Nautobot."""
+"""Initialize Adapter classes for loading DiffSyncModels with data from Panorama or Nautobot.
 
-from .panorama import PanoramaAdapter
-from .nautobot import NautobotAdapter
+Adapters are imported on first attribute access, so importing one of
+them does not load the other.
+"""
+
+import importlib
+
+_ADAPTERS = {
+    "PanoramaAdapter": ".panorama",
+    "NautobotAdapter": ".nautobot",
+}
 
 __all__ = [
     "PanoramaAdapter",
     "NautobotAdapter",
 ]
+
+
+def __getattr__(name):
+    if name not in _ADAPTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_ADAPTERS[name], __name__), name)
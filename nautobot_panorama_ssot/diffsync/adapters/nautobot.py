@@ -24,12 +24,26 @@ from nautobot_firewall_models.models import (
 )
 
 from nautobot_panorama_ssot.constant import DEFAULT_ALLOW_DELETE, TAG_COLOR
-from nautobot_panorama_ssot.diffsync.models.base import *
+from nautobot_panorama_ssot.diffsync.models.base import (
+    AddressGroupModel,
+    AddressModel,
+    ApplicationGroupModel,
+    ApplicationModel,
+    ControlPlaneModel,
+    LogicalGroupModel,
+    NatRuleModel,
+    RuleModel,
+    ServiceGroupModel,
+    ServiceModel,
+    TagModel,
+)
+from nautobot_panorama_ssot.utils.partition import PARTITION_MODEL_TYPES, PartitionedDiffMixin
+from nautobot_panorama_ssot.utils.symbols import resolve_symbol_table
 
 logger = logging.getLogger(__name__)
 
 
-class NautobotAdapter(DiffSync):
+class NautobotAdapter(PartitionedDiffMixin, DiffSync):
     """
     Pure DiffSync Nautobot Adapter
     Enterprise-grade:
@@ -52,11 +66,35 @@ class NautobotAdapter(DiffSync):
     nat_rule = NatRuleModel
     tag = TagModel
 
-    top_level = ["control_plane"]
+    # Same order as PanoramaAdapter.top_level
+    top_level = ["control_plane"] + list(PARTITION_MODEL_TYPES)
 
-    def __init__(self, job=None):
+    def __init__(self, job=None, skip=None, symbols=None, device_groups=None):
         super().__init__()
         self.job = job
+        # Logical groups to load; None loads all of them
+        self.device_groups = device_groups
+        # Shared with PanoramaAdapter when both run in the same job
+        self.symbols = resolve_symbol_table(symbols)
+        # {(model_type, logical_group): {name, ...}} left out of the load
+        self.skip = skip or {}
+
+        instrumentation = getattr(job, "instrumentation", None)
+        if instrumentation:
+            instrumentation.instrument_adapter(self)
+
+    def _without_skipped(self, queryset, model_type, logical_group):
+        """
+        Narrow `queryset` to the objects not skipped as unchanged. Only
+        names are read to find them, so deletions are still seen while
+        the full load scales with the number of changed objects.
+        """
+        skipped = self.skip.get((model_type, logical_group))
+        if not skipped:
+            return queryset
+
+        names = [name for name in queryset.values_list("name", flat=True) if name not in skipped]
+        return queryset.filter(name__in=names)
 
     # ============================================================
     # LOAD
@@ -72,108 +110,128 @@ class NautobotAdapter(DiffSync):
             )
             self.add(cp_model)
 
-            for lg in LogicalGroup.objects.filter(control_plane=cp):
+            logical_groups = LogicalGroup.objects.filter(control_plane=cp)
+            if self.device_groups is not None:
+                logical_groups = logical_groups.filter(name__in=self.device_groups)
+
+            for lg in logical_groups:
+
+                lg_name = self.symbols.intern(lg.name)
 
-                lg_model = self.logical_group(name=lg.name)
-                self.add(lg_model)
-                cp_model.add_child(lg_model)
+                self.add(self.logical_group(
+                    name=lg_name,
+                    virtual_system="shared",
+                    scope="shared" if lg_name == "shared" else "device-group",
+                ))
 
                 # Addresses
-                for obj in AddressObject.objects.filter(logical_group=lg):
+                for obj in self._without_skipped(
+                        AddressObject.objects.filter(logical_group=lg), "address", lg.name
+                ):
                     self.add(self.address(
                         name=obj.name,
-                        logical_group=lg.name,
+                        logical_group=lg_name,
                         value=obj.value,
                         address_type=obj.address_type,
                         description=obj.description or "",
-                        tags=list(obj.tags.values_list("name", flat=True)),
+                        tags=self.symbols.intern_all(obj.tags.values_list("name", flat=True)),
                     ))
                 # Address Groups
-                for obj in AddressObjectGroup.objects.filter(logical_group=lg).prefetch_related("members", "tags"):
+                for obj in self._without_skipped(
+                        AddressObjectGroup.objects.filter(logical_group=lg), "address_group", lg.name
+                ).prefetch_related("members", "tags"):
                     self.add(
                         self.address_group(
                             name=obj.name,
-                            logical_group=obj.logical_group.name,
+                            logical_group=lg_name,
                             description=obj.description,
-                            members=[m.name for m in obj.members.all()],
-                            tags=[t.name for t in obj.tags.all()],
+                            members=self.symbols.intern_all(m.name for m in obj.members.all()),
+                            tags=self.symbols.intern_all(t.name for t in obj.tags.all()),
                         )
                     )
                 # Services
-                for obj in ServiceObject.objects.filter(logical_group=lg):
+                for obj in self._without_skipped(
+                        ServiceObject.objects.filter(logical_group=lg), "service", lg.name
+                ):
                     self.add(self.service(
                         name=obj.name,
-                        logical_group=lg.name,
+                        logical_group=lg_name,
                         protocol=obj.protocol,
                         port=obj.port,
                         description=obj.description or "",
-                        tags=list(obj.tags.values_list("name", flat=True)),
+                        tags=self.symbols.intern_all(obj.tags.values_list("name", flat=True)),
                     ))
                 # Service Groups
-                for obj in ServiceObjectGroup.objects.filter(logical_group=lg).prefetch_related("members", "tags"):
+                for obj in self._without_skipped(
+                        ServiceObjectGroup.objects.filter(logical_group=lg), "service_group", lg.name
+                ).prefetch_related("members", "tags"):
                 
                     self.add(
                         self.service_group(
                             name=obj.name,
-                            logical_group=obj.logical_group.name,
+                            logical_group=lg_name,
                             description=obj.description,
-                            members=[m.name for m in obj.members.all()],
-                            tags=[t.name for t in obj.tags.all()],
+                            members=self.symbols.intern_all(m.name for m in obj.members.all()),
+                            tags=self.symbols.intern_all(t.name for t in obj.tags.all()),
                         )
                     )
                 # Applications
-                for obj in ApplicationObject.objects.filter(logical_group=lg):
+                for obj in self._without_skipped(
+                        ApplicationObject.objects.filter(logical_group=lg), "application", lg.name
+                ):
                     self.add(self.application(
                         name=obj.name,
-                        logical_group=lg.name,
+                        logical_group=lg_name,
                         description=obj.description,
-                        tags=[t.name for t in obj.tags.all()],
+                        tags=self.symbols.intern_all(t.name for t in obj.tags.all()),
                         )
                     )
                 # Application Groups
-                for obj in ApplicationObjectGroup.objects.filter(logical_group=lg).prefetch_related("members", "tags"):
+                for obj in self._without_skipped(
+                        ApplicationObjectGroup.objects.filter(logical_group=lg), "application_group", lg.name
+                ).prefetch_related("members", "tags"):
                 
                     self.add(
                         self.application_group(
                             name=obj.name,
-                            logical_group=obj.logical_group.name,
+                            logical_group=lg_name,
                             description=obj.description,
-                            members=[m.name for m in obj.members.all()],
-                            tags=[t.name for t in obj.tags.all()],
+                            members=self.symbols.intern_all(m.name for m in obj.members.all()),
+                            tags=self.symbols.intern_all(t.name for t in obj.tags.all()),
                         )
                     )
                 # Rules
-                for rule in PolicyRule.objects.filter(
-                        logical_group=lg
+                for rule in self._without_skipped(
+                        PolicyRule.objects.filter(logical_group=lg), "rule", lg.name
                 ).order_by("index"):
 
                     self.add(self.rule(
                         name=rule.name,
-                        logical_group=lg.name,
+                        logical_group=lg_name,
                         rulebase=rule.rulebase,
                         index=rule.index,
                         action=rule.action,
                         description=rule.description or "",
-                        tags=list(rule.tags.values_list("name", flat=True)),
+                        tags=self.symbols.intern_all(rule.tags.values_list("name", flat=True)),
                     ))
                 # NAT Rules
-                for nat in NatPolicyRule.objects.filter(
-                        policy__logical_group=lg
+                for nat in self._without_skipped(
+                        NatPolicyRule.objects.filter(policy__logical_group=lg), "nat_rule", lg.name
                 ).order_by("index"):
                 
                     self.add(self.nat_rule(
                         name=nat.name,
-                        logical_group=lg.name,
+                        logical_group=lg_name,
                         index=nat.index,
                         destination_zone=nat.destination_zone,
                         source_zone=nat.source_zone,
                         remark=nat.remark or "",
                         log=nat.log,
                         status=nat.status,
-                        original_source_addresses=[o.name for o in nat.original_source_addresses.all()],
-                        original_destination_addresses=[o.name for o in nat.original_destination_addresses.all()],
-                        translated_source_addresses=[o.name for o in nat.translated_source_addresses.all()],
-                        translated_destination_addresses=[o.name for o in nat.translated_destination_addresses.all()],
+                        original_source_addresses=self.symbols.intern_all(o.name for o in nat.original_source_addresses.all()),
+                        original_destination_addresses=self.symbols.intern_all(o.name for o in nat.original_destination_addresses.all()),
+                        translated_source_addresses=self.symbols.intern_all(o.name for o in nat.translated_source_addresses.all()),
+                        translated_destination_addresses=self.symbols.intern_all(o.name for o in nat.translated_destination_addresses.all()),
                     ))
 
     # ============================================================
@@ -8,22 +8,40 @@ import time
 from diffsync import DiffSync
 from concurrent.futures import ThreadPoolExecutor
 
-from nautobot_panorama_ssot.diffsync.models.base import *
+from nautobot_panorama_ssot.diffsync.models.base import (
+    AddressGroupModel,
+    AddressModel,
+    ApplicationGroupModel,
+    ApplicationModel,
+    ControlPlaneModel,
+    LogicalGroupModel,
+    NatRuleModel,
+    RuleModel,
+    ServiceGroupModel,
+    ServiceModel,
+    TagModel,
+)
 from nautobot_panorama_ssot.utils.client import PanoramaClient
-from nautobot_panorama_ssot.utils.forward import ForwardClient
 from nautobot_panorama_ssot.constant import (
+    ADDRESS_TYPES,
     DEFAULT_SAFE_COMMIT_THRESHOLD,
     DEFAULT_ALLOWED_HOURS,
 )
 
-from nautobot_panorama_ssot.utils.compliance import COMPLIANCE_QUERY_MAP
-from nautobot_panorama_ssot.utils.diffsync import (
-    DriftAudit,
-    calculate_rule_risk,
+from nautobot_panorama_ssot.utils.audit import DriftAudit
+from nautobot_panorama_ssot.utils.partition import (
+    PARTITION_MODEL_TYPES,
+    PartitionedDiffMixin,
+)
+from nautobot_panorama_ssot.utils.symbols import resolve_symbol_table
+from nautobot_panorama_ssot.utils.state import (
+    load_device_group_states,
+    save_device_group_states,
+    snapshot_device_group_records,
 )
 
 
-class PanoramaAdapter(DiffSync):
+class PanoramaAdapter(PartitionedDiffMixin, DiffSync):
 
     model_priority = {
         "tag": 100,
@@ -50,7 +68,9 @@ class PanoramaAdapter(DiffSync):
     rule = RuleModel
     nat_rule = NatRuleModel
 
-    top_level = ["control_plane"]
+    # Every object type is top level, in sync order, so the serial diff
+    # covers the same models as the partitioned one
+    top_level = ["control_plane"] + list(PARTITION_MODEL_TYPES)
 
     # ===========================================================
     # INIT
@@ -73,21 +93,44 @@ class PanoramaAdapter(DiffSync):
         enable_blast_radius=True,
         enable_risk_scoring=True,
         enable_rule_optimizer=True,
+        use_stored_hit_counts=False,
+        skip_unchanged_device_groups=False,
+        state_cache=None,
+        cache_policy=None,
+        symbols=None,
+        async_client=None,
+        client_options=None,
+        instrumentation=None,
+        audit_sinks=(),
+        device_groups=None,
     ):
         super().__init__()
 
         self.control_plane_obj = control_plane
         self.logger = logger
+        self.symbols = resolve_symbol_table(symbols)
 
         self.client = PanoramaClient(
             base_url=base_url,
             api_key=api_key,
             verify_ssl=verify_ssl,
             timeout=timeout,
+            **(client_options or {}),
         )
+        self.client.observer = instrumentation
+
+        # Optional AsyncPanoramaClient used to fetch all scopes concurrently
+        # and to send writes, queued until finalize
+        self.async_client = async_client
+        if async_client:
+            async_client.observer = instrumentation
+        self._prefetched = {}
+        self._queued_kind = None
 
 #        self.forward = None
         if forward_creds:
+            from nautobot_panorama_ssot.utils.forward import ForwardClient
+
             self.forward = ForwardClient(
                 base_url=forward_creds["base_url"],
                 token=forward_creds["token"],
@@ -100,7 +143,10 @@ class PanoramaAdapter(DiffSync):
         self._forward_snapshot_timestamp = None
 
         self.touched_device_groups = set()
-        self.audit = DriftAudit()
+        self.audit = DriftAudit(sinks=audit_sinks)
+
+        # (device_group, rulebase) -> rules, valid for one finalize pass
+        self._rulebase_cache = {}
 
         # Runtime flags ONLY (no constants)
         self.simulation_mode = simulation_mode
@@ -112,6 +158,30 @@ class PanoramaAdapter(DiffSync):
         self.enable_blast_radius = enable_blast_radius
         self.enable_risk_scoring = enable_risk_scoring
         self.enable_rule_optimizer = enable_rule_optimizer
+        self.use_stored_hit_counts = use_stored_hit_counts
+        self.skip_unchanged_device_groups = skip_unchanged_device_groups
+
+        # Config version tracking for the state cache and unchanged
+        # device group reuse
+        self._config_version = None
+        self._config_version_checked = False
+        self._device_group_versions = {}
+        self._stored_states = {}
+        self._loaded_scopes = []
+        self._reloaded_device_groups = set()
+        self._device_group_snapshot = {}
+
+        # Scopes to load; None loads shared and every device group
+        self.device_groups = set(device_groups) if device_groups is not None else None
+
+        # On-disk cache of the loaded state (AdapterStateCache + FreshnessPolicy).
+        # It always holds the whole control plane, so a scoped load bypasses it.
+        self.state_cache = state_cache if device_groups is None else None
+        # Any write to Panorama makes the cache stale, scoped load or not
+        self._writes_cache = state_cache
+        self._state_cache_cleared = False
+        self.cache_policy = cache_policy
+        self.loaded_from_cache = False
 
 
     # ===========================================================
@@ -140,7 +210,9 @@ class PanoramaAdapter(DiffSync):
         return snapshot_id
 
     def _run_compliance_checks(self):
-    
+
+        from nautobot_panorama_ssot.utils.compliance import COMPLIANCE_QUERY_MAP
+
         failures = {}
     
         for framework, queries in COMPLIANCE_QUERY_MAP.items():
@@ -153,8 +225,8 @@ class PanoramaAdapter(DiffSync):
 
     def _simulate_policy_diff(self, dg):
     
-        before_rules = self.client.get_security_rules(dg, "pre")
-        after_rules = self.client.get_security_rules(dg, "post")
+        before_rules = self._get_cached_rules(dg, "pre")
+        after_rules = self._get_cached_rules(dg, "post")
     
         before_names = {r["@name"] for r in before_rules}
         after_names = {r["@name"] for r in after_rules}
@@ -197,6 +269,18 @@ class PanoramaAdapter(DiffSync):
             },
         )
 
+    def _get_hit_counts(self, dg):
+        """
+        Hit counts from the local time-series store when enabled,
+        otherwise live from Panorama.
+        """
+        if self.use_stored_hit_counts and self.control_plane_obj:
+            from nautobot_panorama_ssot.utils.hitcounts import get_stored_hit_counts
+
+            return get_stored_hit_counts(self.control_plane_obj.name, dg)
+
+        return self.client.get_rule_hit_counts(dg)
+
     def _create_commit_approval_ticket(self, dg, score):
         self.logger.warning(
             "Commit for %s requires approval (Safe Score: %s)",
@@ -223,23 +307,59 @@ class PanoramaAdapter(DiffSync):
 
     def load(self):
 
+        if self.state_cache and self._load_from_state_cache():
+            return
+
+        self._load_from_panorama()
+
+        if self.state_cache:
+            self._write_state_cache()
+
+    def _load_from_panorama(self):
+
         cp = self.control_plane(
-            name=self.client.name,
+            name=self.control_plane_obj.name,
             description="Panorama Control Plane",
         )
         self.add(cp)
 
+        # Version first, so a commit landing mid-load is seen next run
+        if self.state_cache:
+            self._current_config_version()
+
         device_groups = self.client.get_device_groups()
         scopes = ["shared"] + [dg["name"] for dg in device_groups]
 
+        if self.device_groups is not None:
+            scopes = [dg for dg in scopes if dg in self.device_groups]
+
+        self._loaded_scopes = scopes
+
+        if self.skip_unchanged_device_groups and self.control_plane_obj:
+            self._device_group_versions = self._fetch_device_group_versions(scopes)
+            self._stored_states = load_device_group_states(self.control_plane_obj.name)
+
+        to_load = []
+
         for dg in scopes:
 
             lg = self.logical_group(
                 name=dg,
                 virtual_system="shared",
+                scope=self._scope(dg),
             )
             self.add(lg)
-            cp.add_child(lg)
+
+            if self._restore_device_group(lg):
+                continue
+
+            self._reloaded_device_groups.add(lg.name)
+            to_load.append(lg)
+
+        if self.async_client:
+            self._prefetch([lg.name for lg in to_load])
+
+        for lg in to_load:
 
             self._load_tags(lg)
             self._load_addresses(lg)
@@ -251,6 +371,190 @@ class PanoramaAdapter(DiffSync):
             self._load_security_rules(lg)
             self._load_nat_rules(lg)
 
+        # Taken now: incremental syncs prune unchanged objects after load
+        if self.skip_unchanged_device_groups and self._device_group_versions:
+            self._device_group_snapshot = snapshot_device_group_records(
+                self, self._reloaded_device_groups & set(self._device_group_versions)
+            )
+
+    # -----------------------------------------------------------
+    # Concurrent Fetch (async transport)
+    # -----------------------------------------------------------
+
+    LOAD_GETTERS = (
+        "get_tags",
+        "get_address_objects",
+        "get_address_groups",
+        "get_service_objects",
+        "get_service_groups",
+        "get_application_objects",
+        "get_application_groups",
+    )
+
+    def _run_async(self, make_coro):
+        """
+        Run async client work from sync code, inside one client session.
+        """
+
+        from nautobot_panorama_ssot.utils.async_client import run_sync
+
+        async def runner():
+            async with self.async_client:
+                return await make_coro()
+
+        return run_sync(runner())
+
+    def _prefetch(self, scopes):
+        """
+        Fetch every collection of every scope concurrently up front.
+        """
+
+        keys = []
+        for dg in scopes:
+            keys.extend((getter, dg) for getter in self.LOAD_GETTERS)
+            for rulebase in ("pre", "post"):
+                keys.append(("get_security_rules", dg, rulebase))
+                keys.append(("get_nat_rules", dg, rulebase))
+
+        results = self._run_async(
+            lambda: self.async_client.gather(
+                [getattr(self.async_client, key[0])(*key[1:]) for key in keys]
+            )
+        )
+
+        self._prefetched = dict(zip(keys, results))
+
+    def _fetch(self, getter, *args):
+        """
+        Prefetched result if available, otherwise a synchronous call.
+        """
+
+        key = (getter,) + args
+        if key in self._prefetched:
+            return self._prefetched.pop(key)
+
+        return getattr(self.client, getter)(*args)
+
+    # -----------------------------------------------------------
+    # On-Disk State Cache
+    # -----------------------------------------------------------
+
+    def _current_config_version(self):
+        """
+        Control-plane config version, fetched once per adapter. None
+        when unavailable or when there are uncommitted changes.
+        """
+
+        if not self._config_version_checked:
+            self._config_version_checked = True
+            try:
+                self._config_version = self.client.get_config_version()
+            except Exception as exc:
+                self.logger.warning("Config version unavailable: %s", exc)
+
+        return self._config_version
+
+    def _load_from_state_cache(self):
+
+        payload = self.state_cache.read()
+        if not payload:
+            return False
+
+        if not self.cache_policy.is_fresh(payload):
+
+            if not self.cache_policy.needs_version_check(payload):
+                return False
+
+            version = self._current_config_version()
+            if not version or version != payload.get("config_version"):
+                return False
+
+        for modelname, data in payload["records"]:
+            self.add(getattr(self, modelname)(**data))
+
+        self.loaded_from_cache = True
+        self.logger.info(
+            "Loaded %s records from state cache (age %ss)",
+            len(payload["records"]),
+            int(self.cache_policy.age(payload)),
+        )
+        return True
+
+    def _write_state_cache(self):
+
+        try:
+            count = self.state_cache.write(
+                self,
+                ("control_plane",) + PARTITION_MODEL_TYPES,
+                config_version=self._current_config_version(),
+            )
+        except OSError as exc:
+            self.logger.warning("State cache write failed: %s", exc)
+            return
+
+        self.logger.info("Wrote %s records to state cache", count)
+
+    # -----------------------------------------------------------
+    # Unchanged Device Group Reuse
+    # -----------------------------------------------------------
+
+    def _fetch_device_group_versions(self, scopes):
+        """
+        {scope: version} fetched before any data, concurrently with the
+        async client. Scopes whose version is unavailable are left out
+        and always reloaded.
+        """
+
+        try:
+            if self.async_client:
+                versions = self._run_async(
+                    lambda: self.async_client.gather(
+                        [self.async_client.get_device_group_version(dg) for dg in scopes]
+                    )
+                )
+            else:
+                versions = [self.client.get_device_group_version(dg) for dg in scopes]
+        except Exception as exc:
+            self.logger.warning("Device group config versions unavailable: %s", exc)
+            return {}
+
+        return dict(zip(scopes, versions))
+
+    def _restore_device_group(self, lg):
+        """
+        Rebuild a device group from the stored state when its config
+        version has not changed since the previous successful run.
+        """
+
+        if not self.skip_unchanged_device_groups or not self.control_plane_obj:
+            return False
+
+        version = self._device_group_versions.get(lg.name)
+        state = self._stored_states.get(lg.name)
+        if not version or not state or state.config_version != version:
+            return False
+
+        for modelname, data in state.records:
+            self.add(getattr(self, modelname)(**data))
+
+        self.logger.info("Device group %s unchanged — rebuilt from stored state", lg.name)
+        return True
+
+    def save_device_group_state(self):
+        """
+        Persist device group versions and load-time records for the next run.
+        """
+
+        if not self.skip_unchanged_device_groups or not self.control_plane_obj:
+            return
+
+        save_device_group_states(
+            self.control_plane_obj.name,
+            self._device_group_versions,
+            self._device_group_snapshot,
+            keep=self._loaded_scopes if self.device_groups is None else None,
+        )
+
     # -----------------------------------------------------------
     # Load Helpers
     # -----------------------------------------------------------
@@ -258,33 +562,71 @@ class PanoramaAdapter(DiffSync):
     def _extract_members(self, block):
 
         if not block:
-            return []
+            return ()
 
         if isinstance(block, str):
-            return [block]
+            return (self.symbols.intern(block),)
 
         if isinstance(block, list):
-            return block
+            return self.symbols.intern_all(block)
 
         if isinstance(block, dict):
             members = block.get("member", [])
             if isinstance(members, str):
-                return [members]
+                return (self.symbols.intern(members),)
             if isinstance(members, list):
-                return members
+                return self.symbols.intern_all(members)
+
+        return ()
 
-        return []
+    def _scope(self, logical_group):
+        return "shared" if logical_group == "shared" else "device-group"
+
+    def _address_value(self, obj):
+        """
+        (type, value) of a native entry (<ip-netmask> etc.) or of a
+        flattened {"type": ..., "value": ...} one.
+        """
+        for address_type in ADDRESS_TYPES:
+            if address_type in obj:
+                return address_type, obj[address_type]
+        return obj.get("type", "ip-netmask"), obj.get("value", "")
+
+    def _service_port(self, obj):
+        """
+        (protocol, port) of a native {"protocol": {"tcp": {"port": ...}}}
+        entry or of a flattened {"protocol": "tcp", "port": ...} one.
+        """
+        protocol = obj.get("protocol")
+        if isinstance(protocol, dict):
+            for name, block in protocol.items():
+                return name, str((block or {}).get("port", ""))
+        return protocol or "", str(obj.get("port", ""))
+
+    def _translation(self, block):
+        """
+        Translated address(es) of a NAT translation block, as one string.
+        """
+        if not block:
+            return None
+        if isinstance(block, dict):
+            for key in ("translated-address", "static-ip", "dynamic-ip-and-port", "dynamic-ip"):
+                if key in block:
+                    return self._translation(block[key])
+        members = self._extract_members(block)
+        return ",".join(members) if members else None
 
     # ---------------- TAG ----------------
 
     def _load_tags(self, lg):
 
-        for obj in self.client.get_tags(lg.name):
+        for obj in self._fetch("get_tags", lg.name):
             self.add(
                 self.tag(
                     name=obj["name"],
                     logical_group=lg.name,
                     color=obj.get("color"),
+                    scope=lg.scope,
                 )
             )
 
@@ -292,28 +634,32 @@ class PanoramaAdapter(DiffSync):
 
     def _load_addresses(self, lg):
 
-        for obj in self.client.get_address_objects(lg.name):
+        for obj in self._fetch("get_address_objects", lg.name):
+            address_type, value = self._address_value(obj)
             self.add(
                 self.address(
                     name=obj["name"],
                     logical_group=lg.name,
-                    value=obj["value"],
-                    address_type=obj.get("type", "ip-netmask"),
+                    value=value,
+                    type=address_type,
                     description=obj.get("description", ""),
-                    tags=obj.get("tag", []),
+                    tags=self._extract_members(obj.get("tag")),
+                    scope=lg.scope,
                 )
             )
 
     def _load_address_groups(self, lg):
 
-        for obj in self.client.get_address_groups(lg.name):
+        for obj in self._fetch("get_address_groups", lg.name):
             self.add(
                 self.address_group(
                     name=obj["name"],
                     logical_group=lg.name,
                     description=obj.get("description", ""),
-                    members=obj.get("static", []),
-                    tags=obj.get("tag", []),
+                    members=self._extract_members(obj.get("static")),
+                    dynamic_filter=(obj.get("dynamic") or {}).get("filter"),
+                    tags=self._extract_members(obj.get("tag")),
+                    scope=lg.scope,
                 )
             )
 
@@ -321,28 +667,31 @@ class PanoramaAdapter(DiffSync):
 
     def _load_services(self, lg):
 
-        for obj in self.client.get_service_objects(lg.name):
+        for obj in self._fetch("get_service_objects", lg.name):
+            protocol, port = self._service_port(obj)
             self.add(
                 self.service(
                     name=obj["name"],
                     logical_group=lg.name,
-                    protocol=obj["protocol"],
-                    port=obj["port"],
+                    protocol=protocol,
+                    destination_port=port,
                     description=obj.get("description", ""),
-                    tags=obj.get("tag", []),
+                    tags=self._extract_members(obj.get("tag")),
+                    scope=lg.scope,
                 )
             )
 
     def _load_service_groups(self, lg):
 
-        for obj in self.client.get_service_groups(lg.name):
+        for obj in self._fetch("get_service_groups", lg.name):
             self.add(
                 self.service_group(
                     name=obj["name"],
                     logical_group=lg.name,
                     description=obj.get("description", ""),
-                    members=obj.get("members", []),
-                    tags=obj.get("tag", []),
+                    members=self._extract_members(obj.get("members")),
+                    tags=self._extract_members(obj.get("tag")),
+                    scope=lg.scope,
                 )
             )
 
@@ -350,30 +699,32 @@ class PanoramaAdapter(DiffSync):
 
     def _load_applications(self, lg):
 
-        for obj in self.client.get_application_objects(lg.name):
+        for obj in self._fetch("get_application_objects", lg.name):
             self.add(
                 self.application(
                     name=obj["name"],
                     logical_group=lg.name,
                     description=obj.get("description", ""),
-                    category=obj.get("category"),
-                    subcategory=obj.get("subcategory"),
-                    technology=obj.get("technology"),
+                    category=obj.get("category") or "",
+                    subcategory=obj.get("subcategory") or "",
+                    technology=obj.get("technology") or "",
                     risk=int(obj.get("risk", 0) or 0),
-                    tags=obj.get("tag", []),
+                    tags=self._extract_members(obj.get("tag")),
+                    scope=lg.scope,
                 )
             )
 
     def _load_application_groups(self, lg):
 
-        for obj in self.client.get_application_groups(lg.name):
+        for obj in self._fetch("get_application_groups", lg.name):
             self.add(
                 self.application_group(
                     name=obj["name"],
                     logical_group=lg.name,
                     description=obj.get("description", ""),
-                    members=obj.get("members", []),
-                    tags=obj.get("tag", []),
+                    members=self._extract_members(obj.get("members")),
+                    tags=self._extract_members(obj.get("tag")),
+                    scope=lg.scope,
                 )
             )
 
@@ -383,10 +734,7 @@ class PanoramaAdapter(DiffSync):
 
         for rulebase in ["pre", "post"]:
 
-            rules = self.client.get_security_rules(
-                device_group=lg.name,
-                rulebase=rulebase,
-            )
+            rules = self._fetch("get_security_rules", lg.name, rulebase)
 
             for position, entry in enumerate(rules):
 
@@ -396,13 +744,16 @@ class PanoramaAdapter(DiffSync):
                         logical_group=lg.name,
                         rulebase=rulebase,
                         position=position,
-                        action=entry.get("action"),
+                        action=entry.get("action") or "allow",
                         description=entry.get("description", ""),
-                        source=self._extract_members(entry.get("source")),
-                        destination=self._extract_members(entry.get("destination")),
-                        service=self._extract_members(entry.get("service")),
-                        application=self._extract_members(entry.get("application")),
+                        source_zones=self._extract_members(entry.get("from")),
+                        destination_zones=self._extract_members(entry.get("to")),
+                        sources=self._extract_members(entry.get("source")),
+                        destinations=self._extract_members(entry.get("destination")),
+                        services=self._extract_members(entry.get("service")),
+                        disabled=entry.get("disabled") == "yes",
                         tags=self._extract_members(entry.get("tag")),
+                        scope=lg.scope,
                     )
                 )
 
@@ -412,20 +763,33 @@ class PanoramaAdapter(DiffSync):
 
         for rulebase in ["pre", "post"]:
 
-            rules = self.client.get_nat_rules(
-                device_group=lg.name,
-                rulebase=rulebase,
-            )
+            rules = self._fetch("get_nat_rules", lg.name, rulebase)
 
             for position, entry in enumerate(rules):
 
+                # Native PAN-OS keys, falling back to the flattened model field names
+                def field(native, flat):
+                    return entry.get(native, entry.get(flat))
+
                 self.add(
                     self.nat_rule(
                         name=entry.get("@name") or entry.get("name"),
-                        logical_group=lg.name,
+                        device_group=lg.name,
                         rulebase=rulebase,
+                        scope=lg.scope,
                         position=position,
-                        **entry
+                        description=entry.get("description", ""),
+                        from_zones=self._extract_members(field("from", "from_zones")),
+                        to_zones=self._extract_members(field("to", "to_zones")),
+                        sources=self._extract_members(field("source", "sources")),
+                        destinations=self._extract_members(field("destination", "destinations")),
+                        services=self._extract_members(field("service", "services")),
+                        source_translation=self._translation(field("source-translation", "source_translation")),
+                        destination_translation=self._translation(
+                            field("destination-translation", "destination_translation")
+                        ),
+                        disabled=entry.get("disabled") == "yes",
+                        tags=self._extract_members(field("tag", "tags")),
                     )
                 )
 
@@ -456,6 +820,18 @@ class PanoramaAdapter(DiffSync):
         if hasattr(model, "logical_group"):
             self.touched_device_groups.add(model.logical_group)
 
+        if not self._state_cache_cleared:
+            self._invalidate_state_cache()
+
+    def _invalidate_state_cache(self):
+        """
+        Drop the on-disk state cache once Panorama is written to.
+        """
+
+        self._state_cache_cleared = True
+        if self._writes_cache:
+            self._writes_cache.clear()
+
     def _create(self, method, model, object_type):
 
         if self.drift_only:
@@ -466,8 +842,12 @@ class PanoramaAdapter(DiffSync):
             self.logger.info(f"[SIMULATION] Would create {object_type} {model.name}")
             return
 
-        scope = self.client.resolve_write_scope(object_type, model)
-        method(model, scope=scope)
+        if self.async_client:
+            write = getattr(self.async_client, method.__name__)
+            self._queue_write("create", object_type, self._create_async, write, object_type, model)
+        else:
+            scope = self.client.resolve_write_scope(object_type, model)
+            method(model, scope=scope)
         self._mark_touched(model)
 
     def _update(self, method, model, diffs, object_type):
@@ -480,7 +860,11 @@ class PanoramaAdapter(DiffSync):
             self.logger.info(f"[SIMULATION] Would update {object_type} {model.name}")
             return
 
-        method(model, diffs)
+        if self.async_client:
+            write = getattr(self.async_client, method.__name__)
+            self._queue_write("update", object_type, write, model, diffs)
+        else:
+            method(model, diffs)
         self._mark_touched(model)
 
     def _delete(self, method, model, object_type):
@@ -499,9 +883,29 @@ class PanoramaAdapter(DiffSync):
         if not self._delete_guard(model, object_type):
             return
 
-        method(model)
+        if self.async_client:
+            write = getattr(self.async_client, method.__name__)
+            self._queue_write("delete", object_type, write, model)
+        else:
+            method(model)
         self._mark_touched(model)
 
+    def _queue_write(self, action, object_type, func, *args):
+        """
+        Queue an async client write for finalize. Each run of same-kind
+        writes completes before the next one starts.
+        """
+
+        if self._queued_kind != (action, object_type):
+            self.async_client.barrier()
+            self._queued_kind = (action, object_type)
+
+        self.async_client.queue(func, *args)
+
+    async def _create_async(self, write, object_type, model):
+        scope = await self.async_client.resolve_write_scope(object_type, model)
+        await write(model, scope=scope)
+
     # ===========================================================
     # CRUD WRAPPERS (COMPLETE)
     # ===========================================================
@@ -541,13 +945,38 @@ class PanoramaAdapter(DiffSync):
     def update_nat_rule(self, m, d): self._update(self.client.update_nat_rule, m, d, "nat_rule")
     def delete_nat_rule(self, m): self._delete(self.client.delete_nat_rule, m, "nat_rule")
 
+    # ===========================================================
+    # RULEBASE SNAPSHOT CACHE
+    # ===========================================================
+    def _get_cached_rules(self, logical_group, rulebase):
+        """
+        Fetch a rulebase once per finalize pass and reuse it.
+        """
+        key = (logical_group, rulebase)
+
+        if key not in self._rulebase_cache:
+            self._rulebase_cache[key] = self.client.get_security_rules(
+                logical_group, rulebase
+            )
+
+        return self._rulebase_cache[key]
+
+    def _invalidate_rulebase(self, logical_group, rulebase):
+        self._rulebase_cache.pop((logical_group, rulebase), None)
+
+    def _reset_rulebase_cache(self):
+        self._rulebase_cache = {}
+
     # ===========================================================
     # RULE ORDER OPTIMIZATION
     # ===========================================================
     def optimize_rule_moves(self, logical_group, rulebase):
         if self.drift_only:
             return
-        current_order = self.client.get_rule_order(logical_group, rulebase)
+        current_order = [
+            r.get("@name")
+            for r in self._get_cached_rules(logical_group, rulebase)
+        ]
         desired = sorted(
             [
                 r for r in self.get_all("rule")
@@ -556,6 +985,7 @@ class PanoramaAdapter(DiffSync):
             key=lambda x: x.position,
         )
         desired_order = [r.name for r in desired]
+        moved = False
         for index, rule_name in enumerate(desired_order):
             if index >= len(current_order) or current_order[index] != rule_name:
                 self.client.move_rule_by_position(
@@ -564,12 +994,27 @@ class PanoramaAdapter(DiffSync):
                     rulebase=rulebase,
                     position=index,
                 )
+                moved = True
+
+        # Only rulebases that received moves need a fresh fetch
+        if moved:
+            self._invalidate_rulebase(logical_group, rulebase)
 
     # ===========================================================
     # FINALIZE (SAFE + FIXED)
     # ===========================================================
     def finalize(self):
 
+        # Rule analytics are only needed once a sync reaches the commit phase
+        from nautobot_panorama_ssot.utils.compliance import COMPLIANCE_QUERY_MAP
+        from nautobot_panorama_ssot.utils.diffsync import (
+            analyze_hit_counts,
+            calculate_rule_risk,
+            detect_rule_shadowing,
+            suggest_rule_consolidation,
+            suggest_rule_reordering,
+        )
+
         if self.drift_only:
             self.logger.info("Drift-only mode: skipping commit phase")
             snapshot_id = self._get_forward_snapshot()
@@ -587,6 +1032,12 @@ class PanoramaAdapter(DiffSync):
 
         # 1 Execute writes
         self.client.execute_batch()
+        if self.async_client:
+            self._run_async(self.async_client.execute_batch)
+        self._invalidate_state_cache()
+
+        # Rulebases fetched from here on reflect the committed writes
+        self._reset_rulebase_cache()
 
         # 2 Build fresh Forward snapshot
         snapshot_id = self._get_forward_snapshot()
@@ -605,8 +1056,8 @@ class PanoramaAdapter(DiffSync):
         # 5 Advisory + Risk + Blast
         for dg in self.touched_device_groups:
     
-            rules = self.client.get_security_rules(dg, "pre")
-            hits = self.client.get_rule_hit_counts(dg)
+            rules = self._get_cached_rules(dg, "pre")
+            hits = self._get_hit_counts(dg)
     
             unused = analyze_hit_counts(hits)
             shadowed = detect_rule_shadowing(rules)
@@ -666,7 +1117,7 @@ class PanoramaAdapter(DiffSync):
         risk_scores = []
         if self.enable_risk_scoring:
             for dg in self.touched_device_groups:
-                rules = self.client.get_security_rules(dg, "pre")
+                rules = self._get_cached_rules(dg, "pre")
                 for rule in rules:
                     risk_scores.append(calculate_rule_risk(rule))
 
@@ -682,12 +1133,16 @@ class PanoramaAdapter(DiffSync):
             raise Exception("Safe-to-Commit threshold failed")
 
 
-        for dg in self.touched_device_groups:
+        try:
+            for dg in self.touched_device_groups:
 
-            job_id = self.client.commit_device_group(dg)
-            status = self.client.monitor_commit(job_id)
+                job_id = self.client.commit_device_group(dg)
+                status = self.client.monitor_commit(job_id)
 
-            if status != "FIN":
-                self.logger.error("Commit failed in %s — initiating rollback", dg)
-                self.client.rollback_device_group(dg)
-                raise Exception("Commit failed and rollback executed")
+                if status != "FIN":
+                    self.logger.error("Commit failed in %s — initiating rollback", dg)
+                    self.client.rollback_device_group(dg)
+                    raise Exception("Commit failed and rollback executed")
+        finally:
+            # A load racing the writes above may have re-cached old state
+            self._invalidate_state_cache()
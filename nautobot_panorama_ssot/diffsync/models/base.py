@@ -1,13 +1,159 @@
 """DiffSyncModel subclasses for Nautobot-to-Panorama data sync."""
 from diffsync import DiffSyncModel
-from typing import Optional, List
+from diffsync.enum import DiffSyncStatus
+from diffsync.exceptions import ObjectNotCreated, ObjectNotDeleted, ObjectNotUpdated
+from pydantic import model_validator
+from typing import Optional, List, Tuple
+
+from nautobot_panorama_ssot.utils.symbols import intern_symbol
+
+
+# ============================================================
+# ADAPTER WRITES
+# ============================================================
+
+_CRUD_ERRORS = {
+    "create": ObjectNotCreated,
+    "update": ObjectNotUpdated,
+    "delete": ObjectNotDeleted,
+}
+
+
+def _apply_to_adapter(adapter, action, model, *args):
+    """
+    Hand a sync write to the adapter's `<action>_<modelname>` method, if
+    it has one. Failures become diffsync CRUD errors, so the sync logs
+    them and the model is left with an error status. Callables in the
+    adapter's `write_listeners` hear about every write that succeeded.
+    """
+    handler = getattr(adapter, f"{action}_{model.get_type()}", None)
+
+    if handler is not None:
+        try:
+            handler(model, *args)
+        except Exception as exc:
+            message = f"{action} {model.get_type()} {model.get_unique_id()} failed: {exc}"
+            model.set_status(DiffSyncStatus.ERROR, message)
+            raise _CRUD_ERRORS[action](message) from exc
+
+    for listener in getattr(adapter, "write_listeners", ()):
+        listener(action, model)
+
+
+# ============================================================
+# COMPACT STORAGE
+# ============================================================
+
+# Name, tag and member-reference fields; their values repeat across
+# objects and between both adapters. Values, descriptions and the like
+# are mostly unique and are left alone.
+INTERNED_FIELDS = frozenset({
+    "name",
+    "control_plane",
+    "virtual_system",
+    "logical_group",
+    "device_group",
+    "scope",
+    "rulebase",
+    "tags",
+    "members",
+    "source_zones",
+    "destination_zones",
+    "from_zones",
+    "to_zones",
+    "sources",
+    "destinations",
+    "services",
+})
+
+
+def _compact(value, intern=False):
+    """Freeze string lists into tuples, interning names if asked."""
+    if isinstance(value, str):
+        return intern_symbol(value) if intern else value
+    if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+        return tuple(intern_symbol(v) for v in value) if intern else tuple(value)
+    return value
+
+
+# frozenset(field names) -> the fields-set shared by records built from them
+_FIELDS_SETS = {}
+
+# Loaders use a handful of field combinations per model; past this,
+# records simply keep their own fields-set
+_FIELDS_SETS_MAX = 256
+
+# Set by diffsync on every stored record; bookkeeping, not loaded data
+_UNTRACKED_FIELDS = frozenset({"adapter", "model_flags"})
+
+
+class CompactModel(DiffSyncModel):
+    """
+    Base for loaded firewall objects.
+
+    Names, scopes and member lists repeat across hundreds of thousands
+    of objects, so INTERNED_FIELDS are interned (through the job's
+    symbol table when one is active) and every string list is stored
+    as a tuple. Records built from the same keys share one pydantic
+    fields-set. Models still compare, hash and serialize like
+    any other DiffSyncModel.
+
+    diffsync only calls the model's create/update/delete while syncing;
+    they pass each write on to the target adapter's CRUD methods.
+    """
+
+    @model_validator(mode="before")
+    @classmethod
+    def _compact_fields(cls, data):
+        if isinstance(data, dict):
+            return {key: _compact(value, key in INTERNED_FIELDS) for key, value in data.items()}
+        return data
+
+    def __init__(self, **data):
+        super().__init__(**data)
+
+        # Records built from the same keys share one fields-set object
+        fields_set = self.__pydantic_fields_set__
+        key = frozenset(fields_set)
+        if key in _FIELDS_SETS or len(_FIELDS_SETS) < _FIELDS_SETS_MAX:
+            object.__setattr__(
+                self,
+                "__pydantic_fields_set__",
+                _FIELDS_SETS.setdefault(key, fields_set),
+            )
+
+    @classmethod
+    def create(cls, adapter, ids, attrs):
+        model = super().create(adapter, ids, attrs)
+        _apply_to_adapter(adapter, "create", model)
+        return model
+
+    def update(self, attrs):
+        model = super().update(attrs)
+        _apply_to_adapter(self.adapter, "update", self, attrs)
+        return model
+
+    def delete(self):
+        _apply_to_adapter(self.adapter, "delete", self)
+        return super().delete()
+
+    def __setattr__(self, name, value):
+        # Stored without touching the fields-set, so Adapter.add keeps it shared
+        if name in _UNTRACKED_FIELDS:
+            self.__dict__[name] = value
+            return
+
+        # Copy the shared fields-set before pydantic adds a field to it
+        if name in type(self).model_fields and name not in self.__pydantic_fields_set__:
+            object.__setattr__(self, "__pydantic_fields_set__", set(self.__pydantic_fields_set__))
+        super().__setattr__(name, value)
 
 
 # ============================================================
 # CONTROL PLANE
 # ============================================================
 
-class ControlPlaneModel(DiffSyncModel):
+class ControlPlaneModel(CompactModel):
     _modelname = "control_plane"
     _identifiers = ("name",)
     _attributes = ("description",)
@@ -22,7 +168,7 @@ class ControlPlaneModel(DiffSyncModel):
 # VIRTUAL SYSTEM (vsys)
 # ============================================================
 
-class VirtualSystemModel(DiffSyncModel):
+class VirtualSystemModel(CompactModel):
     _modelname = "virtual_system"
     _identifiers = ("name", "control_plane",)
     _attributes = ("description",)
@@ -38,7 +184,7 @@ class VirtualSystemModel(DiffSyncModel):
 # LOGICAL GROUP (device_group abstraction)
 # ============================================================
 
-class LogicalGroupModel(DiffSyncModel):
+class LogicalGroupModel(CompactModel):
     _modelname = "logical_group"
     _identifiers = ("name", "virtual_system", "scope")
     _attributes = ("description",)
@@ -60,7 +206,7 @@ class LogicalGroupModel(DiffSyncModel):
 # TAG
 # ============================================================
 
-class TagModel(DiffSyncModel):
+class TagModel(CompactModel):
     _modelname = "tag"
     _identifiers = ("name", "logical_group", "scope")
     _attributes = ("color",)
@@ -74,7 +220,7 @@ class TagModel(DiffSyncModel):
 # ADDRESS OBJECT
 # ============================================================
 
-class AddressModel(DiffSyncModel):
+class AddressModel(CompactModel):
     _modelname = "address"
     _identifiers = ("name", "logical_group", "scope")
     _attributes = ("value", "type", "description", "tags")
@@ -85,14 +231,14 @@ class AddressModel(DiffSyncModel):
     value: str
     type: str  # ip-netmask, ip-range, fqdn
     description: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
     scope: str  # "shared" or "device-group"
 
 # ============================================================
 # ADDRESS GROUP
 # ============================================================
 
-class AddressGroupModel(DiffSyncModel):
+class AddressGroupModel(CompactModel):
     _modelname = "address_group"
     _identifiers = ("name", "logical_group", "scope")
     _attributes = ("members", "dynamic_filter", "description", "tags")
@@ -100,17 +246,17 @@ class AddressGroupModel(DiffSyncModel):
     name: str
     logical_group: str
 
-    members: List[str] = []
+    members: Tuple[str, ...] = ()
     dynamic_filter: Optional[str] = None
     description: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
     scope: str  # "shared" or "device-group"
 
 # ============================================================
 # SERVICE
 # ============================================================
 
-class ServiceModel(DiffSyncModel):
+class ServiceModel(CompactModel):
     _modelname = "service"
     _identifiers = ("name", "logical_group", "scope")
     _attributes = ("protocol", "destination_port", "description", "tags")
@@ -121,14 +267,14 @@ class ServiceModel(DiffSyncModel):
     protocol: str
     destination_port: str
     description: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
     scope: str  # "shared" or "device-group"
 
 # ============================================================
 # SERVICE GROUP
 # ============================================================
 
-class ServiceGroupModel(DiffSyncModel):
+class ServiceGroupModel(CompactModel):
     _modelname = "service_group"
     _identifiers = ("name", "logical_group", "scope")
     _attributes = ("members", "description", "tags")
@@ -136,16 +282,16 @@ class ServiceGroupModel(DiffSyncModel):
     name: str
     logical_group: str
 
-    members: List[str] = []
+    members: Tuple[str, ...] = ()
     description: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
     scope: str  # "shared" or "device-group"
 
 # ============================================================
 # APPLICATION
 # ============================================================
 
-class ApplicationModel(DiffSyncModel):
+class ApplicationModel(CompactModel):
     """Application Object model for Panorama"""
 
     _modelname = "application"
@@ -161,13 +307,13 @@ class ApplicationModel(DiffSyncModel):
     technology: str
     risk: int
     description: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
 
 # ============================================================
 # APPLICATION-GROUP
 # ============================================================
 
-class ApplicationGroupModel(DiffSyncModel):
+class ApplicationGroupModel(CompactModel):
     _modelname = "application_group"
     _identifiers = ("name", "logical_group", "scope")
     _attributes = ("members", "description", "tags")
@@ -176,16 +322,16 @@ class ApplicationGroupModel(DiffSyncModel):
     logical_group: str
     scope: str  # "shared" or "device-group"
 
-    members: List[str] = []
+    members: Tuple[str, ...] = ()
     description: Optional[str] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
 
 
 # ============================================================
 # SECURITY RULE
 # ============================================================
 
-class RuleModel(DiffSyncModel):
+class RuleModel(CompactModel):
     _modelname = "rule"
     _identifiers = ("name", "logical_group", "rulebase", "scope")
     _attributes = (
@@ -206,22 +352,22 @@ class RuleModel(DiffSyncModel):
     rulebase: str  # "pre" or "post"
 
     description: Optional[str] = None
-    source_zones: List[str] = []
-    destination_zones: List[str] = []
-    sources: List[str] = []
-    destinations: List[str] = []
-    services: List[str] = []
+    source_zones: Tuple[str, ...] = ()
+    destination_zones: Tuple[str, ...] = ()
+    sources: Tuple[str, ...] = ()
+    destinations: Tuple[str, ...] = ()
+    services: Tuple[str, ...] = ()
     action: str = "allow"
     disabled: bool = False
     position: int = 0
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
     scope: str  # "shared" or "device-group"
 
 # ============================================================
 # NAT RULE
 # ============================================================
 
-class NatRuleModel(DiffSyncModel):
+class NatRuleModel(CompactModel):
     _modelname = "nat_rule"
 
     _identifiers = ("name", "device_group", "rulebase", "scope")
@@ -256,16 +402,16 @@ class NatRuleModel(DiffSyncModel):
 
     description: Optional[str] = None
 
-    from_zones: List[str] = []
-    to_zones: List[str] = []
+    from_zones: Tuple[str, ...] = ()
+    to_zones: Tuple[str, ...] = ()
 
-    sources: List[str] = []
-    destinations: List[str] = []
-    services: List[str] = []
+    sources: Tuple[str, ...] = ()
+    destinations: Tuple[str, ...] = ()
+    services: Tuple[str, ...] = ()
 
     source_translation: Optional[str] = None
     destination_translation: Optional[str] = None
 
     disabled: bool = False
     position: Optional[int] = None
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
@@ -2,9 +2,9 @@
 
 import django_filters
 from django.db.models import Q
-from nautobot.apps.filters import NautobotFilterSet
+from nautobot.apps.filters import BaseFilterSet, NautobotFilterSet
 
-from .models import SSOTPanoramaConfig
+from .models import PanoramaDriftRecord, SSOTPanoramaConfig
 
 
 class SSOTPanoramaConfigFilterSet(NautobotFilterSet):
@@ -24,3 +24,17 @@ class SSOTPanoramaConfigFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
         return queryset.filter(Q(name__icontains=value))  # pylint: disable=unsupported-binary-operation
+
+
+class PanoramaDriftRecordFilterSet(BaseFilterSet):
+    """FilterSet for PanoramaDriftRecord history."""
+
+    since = django_filters.IsoDateTimeFilter(field_name="recorded", lookup_expr="gte")
+    until = django_filters.IsoDateTimeFilter(field_name="recorded", lookup_expr="lt")
+
+    class Meta:
+        """Meta attributes for filter."""
+
+        model = PanoramaDriftRecord
+
+        fields = ["control_plane", "logical_group", "object_type", "name", "action", "run"]
@@ -2,37 +2,59 @@
 from __future__ import annotations
 from typing import Tuple
 
+import hashlib
+import json
 import logging
+import os
+from contextlib import nullcontext
+
+from django.utils import timezone
 
 from nautobot.apps.jobs import (
     BooleanVar,
+    IntegerVar,
+    MultiChoiceVar,
+    MultiObjectVar,
     ObjectVar,
     ChoiceVar,
+    Job,
+    StringVar,
     register_jobs,
 )
 
-from nautobot_firewall_models.models import LogicalGroup, ControlPlaneSystem
-from nautobot.dcim.models import Controller
+# Models, Job/Var classes and constants only: adapters, HTTP clients and
+# analytics are imported where they are first used so that registering
+# these jobs at Nautobot and worker startup stays cheap.
+from nautobot_firewall_models.models import ControlPlaneSystem
 from nautobot.extras.models import ExternalIntegration
 from nautobot.extras.choices import (
+    JobResultStatusChoices,
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
 from nautobot_ssot.jobs import DataSource, DataTarget
 
-from nautobot_panorama_ssot.diffsync.adapters.nautobot import NautobotAdapter
-from nautobot_panorama_ssot.diffsync.adapters.panorama import PanoramaAdapter
-from nautobot_panorama_ssot.utils.client import PanoramaClient
+from nautobot_panorama_ssot.models import PanoramaSyncLog, SSOTPanoramaConfig
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_FLEET_BUDGET,
+    DEFAULT_FLEET_TIMEOUT,
+    DEFAULT_PER_PANORAMA_LIMIT,
+    DEFAULT_SHARD_SIZE,
+    DEFAULT_SHARD_TIMEOUT,
+    DEFAULT_STATE_CACHE_TTL,
+    PROFILER_CHOICES,
+    SYNC_PHASES,
+)
 
 logger = logging.getLogger(__name__)
 
 name = "SSoT - Palo Alto Panorama"
 
 # ============================================================
-# Shared Runtime Options
+# Shared Connection Handling
 # ============================================================
 
-class PanoramaJobMixin:
+class PanoramaConnectionMixin:
 
     control_plane = ObjectVar(
         model=ControlPlaneSystem,
@@ -45,6 +67,105 @@ class PanoramaJobMixin:
     def selected_control_plane(self):
         return self.kwargs["control_plane"]
 
+    # ========================================================
+    # Credential Resolution
+    # ========================================================
+
+    def _get_creds_from_integration(
+
+        self, ei: ExternalIntegration
+    ) -> Tuple[str, str, bool, int]:
+
+        if not ei.secrets_group:
+            raise ValueError(f"ExternalIntegration '{ei}' has no SecretsGroup")
+
+        sg = ei.secrets_group
+
+        api_key = sg.get_secret_value(
+            access_type=SecretsGroupAccessTypeChoices.TYPE_HTTP,
+            secret_type=SecretsGroupSecretTypeChoices.TYPE_TOKEN,
+        )
+
+        if not api_key:
+            raise ValueError("API token not found in SecretsGroup")
+
+        base_url = getattr(ei, "remote_url", None) or getattr(ei, "url", None)
+        if not base_url:
+            raise ValueError("ExternalIntegration missing remote_url")
+
+        verify_ssl = bool(getattr(ei, "verify_ssl", True))
+        timeout = int(getattr(ei, "timeout", 30))
+
+        return base_url, api_key, verify_ssl, timeout
+
+    def _get_panorama_creds(self):
+
+        cp = self.kwargs["control_plane"]
+
+        if not cp:
+            raise ValueError("ControlPlaneSystem selection is required")
+
+        ei = cp.external_integration
+
+        if not ei:
+            raise ValueError(f"ControlPlaneSystem '{cp}' has no ExternalIntegration")
+
+        return cp, self._get_creds_from_integration(ei)
+
+    def get_panorama_config(self, cp):
+        return SSOTPanoramaConfig.objects.filter(
+            panorama_instance=cp.external_integration,
+        ).first()
+
+    def get_client_options(self, cp):
+        """
+        Per-Panorama client ceilings from the matching SSOTPanoramaConfig.
+        """
+
+        config = self.get_panorama_config(cp)
+
+        if not config:
+            return {}
+
+        return {
+            "rate_limit": config.max_requests_per_second,
+            "max_concurrency": config.max_concurrency,
+        }
+
+    def build_panorama_client(self):
+
+        from nautobot_panorama_ssot.utils.client import PanoramaClient
+
+        cp, (base_url, api_key, verify_ssl, timeout) = self._get_panorama_creds()
+
+        return PanoramaClient(
+            base_url=base_url,
+            api_key=api_key,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            **self.get_client_options(cp),
+        )
+
+    def log_client_stats(self, client):
+        """
+        Report request and retry counters of a PanoramaClient or
+        AsyncPanoramaClient.
+        """
+
+        stats = dict(getattr(client, "retry_stats", None) or {})
+        if not stats:
+            return
+
+        log = self.logger.warning if stats.get("retries_exhausted") else self.logger.info
+        log("Panorama client requests: %s", stats)
+
+
+# ============================================================
+# Shared Runtime Options
+# ============================================================
+
+class PanoramaJobMixin(PanoramaConnectionMixin):
+
     forward_integration = ObjectVar(
         model=ExternalIntegration,
         required=False,
@@ -56,6 +177,14 @@ class PanoramaJobMixin:
     def selected_forward_integration(self):
         return self.kwargs.get("forward_integration")
 
+    @property
+    def selected_device_groups(self):
+        """
+        Device groups this run is limited to, or None for all of them.
+        """
+        value = self.kwargs.get("device_groups") or ""
+        return [dg.strip() for dg in value.split(",") if dg.strip()] or None
+
     simulation_mode = BooleanVar(default=False)
     drift_only = BooleanVar(default=False)
     change_window_only = BooleanVar(default=False)
@@ -75,36 +204,67 @@ class PanoramaJobMixin:
     enable_risk_scoring = BooleanVar(default=True)
     enable_rule_optimizer = BooleanVar(default=True)
 
-    # ========================================================
-    # Credential Resolution
-    # ========================================================
+    use_stored_hit_counts = BooleanVar(
+        default=False,
+        label="Use stored hit counts",
+        description="Run hit-count analysis from the local time-series store instead of querying Panorama",
+    )
 
-    def _get_creds_from_integration(
+    partitioned_diff = BooleanVar(
+        default=False,
+        label="Partitioned diff",
+        description="Diff each device group in a separate worker process (shared scope first)",
+    )
 
-        self, ei: ExternalIntegration
-    ) -> Tuple[str, str, bool, int]:
+    skip_unchanged_device_groups = BooleanVar(
+        default=False,
+        label="Skip unchanged device groups",
+        description="Reload only device groups whose Panorama config version changed since the last successful run",
+    )
 
-        if not ei.secrets_group:
-            raise ValueError(f"ExternalIntegration '{ei}' has no SecretsGroup")
+    use_state_cache = BooleanVar(
+        default=False,
+        label="Use state cache",
+        description="Reuse the last loaded Panorama state from disk when it is still fresh",
+    )
 
-        sg = ei.secrets_group
+    state_cache_ttl = IntegerVar(
+        default=DEFAULT_STATE_CACHE_TTL,
+        required=False,
+        label="State cache TTL (seconds)",
+        description="Age below which cached state is reused without checking the config version",
+    )
 
-        api_key = sg.get_secret_value(
-            access_type=SecretsGroupAccessTypeChoices.TYPE_HTTP,
-            secret_type=SecretsGroupSecretTypeChoices.TYPE_TOKEN,
-        )
+    async_transport = BooleanVar(
+        default=False,
+        label="Async transport",
+        description="Fetch Panorama collections concurrently over a pooled async HTTP client",
+    )
 
-        if not api_key:
-            raise ValueError("API token not found in SecretsGroup")
+    resume = BooleanVar(
+        default=False,
+        label="Resume",
+        description="Continue a failed run: skip partitions and write batches it already applied",
+    )
 
-        base_url = getattr(ei, "remote_url", None) or getattr(ei, "url", None)
-        if not base_url:
-            raise ValueError("ExternalIntegration missing remote_url")
+    profiler = ChoiceVar(
+        choices=PROFILER_CHOICES,
+        default="",
+        required=False,
+        label="Profiler",
+        description="Profile this run and attach the result to the job result",
+    )
 
-        verify_ssl = bool(getattr(ei, "verify_ssl", True))
-        timeout = int(getattr(ei, "timeout", 30))
+    profile_phases = MultiChoiceVar(
+        choices=[(phase, phase) for phase in SYNC_PHASES],
+        required=False,
+        label="Profiled phases",
+        description="Only profile these phases (default: the whole sync)",
+    )
 
-        return base_url, api_key, verify_ssl, timeout
+    def configure_partitioning(self, adapter):
+        adapter.partitioned_diff = bool(self.kwargs.get("partitioned_diff", False))
+        return adapter
 
     # ========================================================
     # Adapter Builder
@@ -112,17 +272,11 @@ class PanoramaJobMixin:
 
     def build_panorama_adapter(self):
 
-        cp = self.kwargs["control_plane"]
-
-        if not cp:
-            raise ValueError("ControlPlaneSystem selection is required")
+        from nautobot_panorama_ssot.diffsync.adapters.panorama import PanoramaAdapter
+        from nautobot_panorama_ssot.utils.async_client import AsyncPanoramaClient
+        from nautobot_panorama_ssot.utils.cache import AdapterStateCache, FreshnessPolicy
 
-        ei = cp.external_integration
-
-        if not ei:
-            raise ValueError(f"ControlPlaneSystem '{cp}' has no ExternalIntegration")
-
-        base_url, api_key, verify_ssl, timeout = self._get_creds_from_integration(ei)
+        cp, (base_url, api_key, verify_ssl, timeout) = self._get_panorama_creds()
 
         # Optional Forward
         forward_creds = None
@@ -137,7 +291,28 @@ class PanoramaJobMixin:
                 "token": f_token,
             }
 
-        return PanoramaAdapter(
+        state_cache = None
+        cache_policy = None
+        if self.kwargs.get("use_state_cache"):
+            state_cache = AdapterStateCache(cp.name)
+            cache_policy = FreshnessPolicy(
+                ttl=self.kwargs.get("state_cache_ttl") or DEFAULT_STATE_CACHE_TTL,
+            )
+
+        # Same request-rate and concurrency ceilings on both transports
+        client_options = self.get_client_options(cp)
+
+        async_client = None
+        if self.kwargs.get("async_transport"):
+            async_client = AsyncPanoramaClient(
+                base_url=base_url,
+                api_key=api_key,
+                verify_ssl=verify_ssl,
+                timeout=timeout,
+                **client_options,
+            )
+
+        self.panorama_adapter = PanoramaAdapter(
             control_plane=cp,
             base_url=base_url,
             api_key=api_key,
@@ -154,7 +329,242 @@ class PanoramaJobMixin:
             enable_blast_radius=self.kwargs.get("enable_blast_radius", True),
             enable_risk_scoring=self.kwargs.get("enable_risk_scoring", True),
             enable_rule_optimizer=self.kwargs.get("enable_rule_optimizer", True),
+            use_stored_hit_counts=self.kwargs.get("use_stored_hit_counts", False),
+            skip_unchanged_device_groups=self.kwargs.get("skip_unchanged_device_groups", False),
+            state_cache=state_cache,
+            cache_policy=cache_policy,
+            symbols=getattr(self, "symbols", None),
+            async_client=async_client,
+            client_options=client_options,
+            instrumentation=getattr(self, "instrumentation", None),
+            audit_sinks=self.build_audit_sinks(cp),
+            device_groups=self.selected_device_groups,
         )
+        self.panorama_adapter.client.checkpoint = getattr(self, "checkpoint", None)
+
+        return self.panorama_adapter
+
+    # ========================================================
+    # Drift Audit
+    # ========================================================
+
+    def build_audit_sinks(self, cp):
+        """
+        Drift-only runs stream their audit to a JSON-lines file and, when
+        run as a job, to PanoramaDriftRecord history.
+        """
+
+        from nautobot_panorama_ssot.utils.audit import DriftRecordSink, JsonLinesSink, audit_path
+
+        if not self.kwargs.get("drift_only"):
+            return ()
+
+        job_result = getattr(self, "job_result", None)
+        run_id = job_result.pk if job_result else timezone.now().strftime("%Y%m%dT%H%M%S")
+
+        self.audit_file = JsonLinesSink(audit_path(cp.name, run_id))
+        self.logger.info("Drift audit streamed to %s", self.audit_file.path)
+
+        if job_result is None:
+            return (self.audit_file,)
+
+        return (self.audit_file, DriftRecordSink(cp.name, job_result.pk))
+
+    def save_audit(self, audit):
+
+        audit.close()
+        audit.log_summary(self.logger)
+
+        audit_file = getattr(self, "audit_file", None)
+        if audit_file and audit.total:
+            with open(audit_file.path, "rb") as handle:
+                self.create_file(os.path.basename(audit_file.path), handle.read())
+
+    # ========================================================
+    # Checkpoints
+    # ========================================================
+
+    def build_checkpoint(self):
+        """
+        SyncCheckpoint for this run, or None for dry runs. Without
+        resume, progress left by an earlier failed run is discarded.
+        """
+
+        from nautobot_panorama_ssot.utils.checkpoint import SyncCheckpoint
+
+        if self.dryrun:
+            return None
+
+        job = type(self).__name__
+        if self.selected_device_groups:
+            # Shards of one control plane keep separate progress
+            digest = hashlib.blake2b(",".join(sorted(self.selected_device_groups)).encode(), digest_size=6)
+            job = f"{job}:{digest.hexdigest()}"
+
+        checkpoint = SyncCheckpoint(self.selected_control_plane.name, job)
+
+        if not self.kwargs.get("resume"):
+            checkpoint.clear()
+        elif checkpoint.completed_partitions or checkpoint.applied_chunks:
+            self.logger.info(
+                "Resuming: %s partitions and %s write batches already applied",
+                len(checkpoint.completed_partitions),
+                checkpoint.applied_chunks,
+            )
+
+        return checkpoint
+
+    def calculate_diff(self):
+
+        if self.checkpoint and self.kwargs.get("resume"):
+            pruned = self.checkpoint.prune(self.source_adapter, self.target_adapter)
+            self.logger.info("Resume: %s objects of completed partitions skipped", pruned)
+
+        super().calculate_diff()
+
+    def execute_sync(self):
+
+        from nautobot_panorama_ssot.diffsync.adapters.nautobot import NautobotAdapter
+
+        # Nautobot writes are final once applied; Panorama writes only take
+        # effect with the finalize commit, and queued ones are checkpointed
+        # per execute_batch chunk
+        if self.checkpoint and isinstance(self.target_adapter, NautobotAdapter):
+            self.checkpoint.track(self.diff, self.target_adapter)
+
+        super().execute_sync()
+
+        panorama_adapter = getattr(self, "panorama_adapter", None)
+        if panorama_adapter and not self.dryrun:
+            panorama_adapter.save_device_group_state()
+
+    # ========================================================
+    # Instrumentation
+    # ========================================================
+
+    INSTRUMENTED_PHASES = SYNC_PHASES
+
+    def _instrument_phases(self):
+
+        after = {
+            "load_source_adapter": lambda: self.instrumentation.count_objects(
+                "source", getattr(self, "source_adapter", None)
+            ),
+            "load_target_adapter": lambda: self.instrumentation.count_objects(
+                "target", getattr(self, "target_adapter", None)
+            ),
+        }
+
+        for name in self.INSTRUMENTED_PHASES:
+            setattr(self, name, self.instrumentation.wrap(name, getattr(self, name), after.get(name)))
+
+    def record_sync_log(self, status, error_message=""):
+        """
+        Store the run's outcome and performance profile as a PanoramaSyncLog.
+        """
+
+        from nautobot_panorama_ssot.utils import metrics
+
+        config = self.get_panorama_config(self.selected_control_plane)
+        if not config:
+            return None
+
+        diff = getattr(self, "diff", None)
+        counts = diff.summary() if diff is not None else {}
+        summary = self.instrumentation.summary()
+
+        applied = {} if self.dryrun else counts
+        metrics.record_sync(
+            config.name,
+            self.selected_control_plane.name,
+            summary["duration"],
+            status,
+            created=applied.get("create", 0),
+            updated=applied.get("update", 0),
+            deleted=applied.get("delete", 0),
+        )
+
+        return PanoramaSyncLog.objects.create(
+            connection=config,
+            job_result=getattr(self, "job_result", None),
+            sync_end=timezone.now(),
+            status=status,
+            error_message=error_message,
+            objects_created=counts.get("create", 0),
+            objects_updated=counts.get("update", 0),
+            objects_deleted=counts.get("delete", 0),
+            duration=summary["duration"],
+            phase_timings=summary["phases"],
+            http_stats=summary["http"],
+            query_counts=summary["queries"],
+            object_counts=summary["objects"],
+        )
+
+    # ========================================================
+    # Profiling
+    # ========================================================
+
+    def _build_profiler(self):
+        """
+        RunProfiler for the selected profiler, with the chosen phases
+        wrapped, or None when profiling is off.
+        """
+
+        from nautobot_panorama_ssot.utils.profiling import RunProfiler
+
+        kind = self.kwargs.get("profiler")
+        if not kind:
+            return None
+
+        profiler = RunProfiler(kind)
+
+        for name in self.kwargs.get("profile_phases") or ():
+            setattr(self, name, profiler.wrap(getattr(self, name)))
+
+        return profiler
+
+    def save_profile(self, profiler):
+
+        for filename, content in profiler.artifacts():
+            self.create_file(filename, content)
+
+        self.logger.info("Profile (%s) attached to the job result", profiler.kind)
+
+    def sync_data(self, *args, **kwargs):
+
+        from nautobot_panorama_ssot.utils.instrumentation import SyncInstrumentation
+
+        self.instrumentation = SyncInstrumentation()
+        self._instrument_phases()
+        self.checkpoint = self.build_checkpoint()
+
+        profiler = self._build_profiler()
+        whole_run = profiler.section() if profiler and not self.kwargs.get("profile_phases") else nullcontext()
+
+        status, error_message = "failed", ""
+        try:
+            with self.instrumentation.capture_queries(), whole_run:
+                result = super().sync_data(*args, **kwargs)
+            status = "success"
+            if self.checkpoint:
+                self.checkpoint.clear()
+            return result
+        except Exception as exc:
+            error_message = str(exc)
+            raise
+        finally:
+            panorama_adapter = getattr(self, "panorama_adapter", None)
+            if panorama_adapter:
+                self.log_client_stats(panorama_adapter.client)
+                if panorama_adapter.async_client:
+                    self.log_client_stats(panorama_adapter.async_client)
+                self.save_audit(panorama_adapter.audit)
+
+            self.instrumentation.log_summary(self.logger)
+            self.record_sync_log(status, error_message)
+
+            if profiler:
+                self.save_profile(profiler)
 
 # ============================================================
 # Panorama → Nautobot
@@ -166,20 +576,70 @@ class PanoramaToNautobotSync(PanoramaJobMixin, DataSource, DataTarget):
     description = "Authoritative Panorama → Nautobot synchronization"
     dryrun_default = False
 
+    incremental_sync = BooleanVar(
+        default=False,
+        label="Incremental sync",
+        description="Skip objects whose content hash is unchanged since the last successful sync",
+    )
+
+    device_groups = StringVar(
+        required=False,
+        label="Device groups",
+        description="Comma-separated device groups (and/or 'shared') to sync; empty syncs all",
+    )
+
     def run(self, *args, **kwargs):
+        from nautobot_panorama_ssot.utils.symbols import SymbolTable, use_symbol_table
+
         self.kwargs = kwargs
-        return super().run(*args, **kwargs)
+        self.fingerprints = None
+        self.unchanged = {}
+        # One symbol table per run, shared by both adapters
+        self.symbols = SymbolTable()
+        with use_symbol_table(self.symbols):
+            return super().run(*args, **kwargs)
 
     def load_source_adapter(self):
-        self.source_adapter = self.build_panorama_adapter()
+        from nautobot_panorama_ssot.utils.fingerprint import FingerprintIndex
+
+        self.source_adapter = self.configure_partitioning(self.build_panorama_adapter())
         self.source_adapter.load()
 
+        if self.kwargs.get("incremental_sync"):
+            self.fingerprints = FingerprintIndex(
+                self.selected_control_plane.name,
+                logical_groups=self.selected_device_groups,
+            )
+            self.unchanged = self.fingerprints.scan(self.source_adapter)
+            skipped = FingerprintIndex.prune(self.source_adapter, self.unchanged)
+            self.logger.info("Incremental sync: %s unchanged objects skipped", skipped)
+
     def load_target_adapter(self):
+        from nautobot_panorama_ssot.diffsync.adapters.nautobot import NautobotAdapter
+
         self.target_adapter = NautobotAdapter(
             job=self,
+            skip=self.unchanged,
+            symbols=self.symbols,
+            device_groups=self.selected_device_groups,
         )
         self.target_adapter.load()
 
+    def execute_sync(self):
+        from nautobot_panorama_ssot.utils.fingerprint import failed_elements
+
+        super().execute_sync()
+
+        if self.fingerprints and not self.dryrun:
+            failed = failed_elements(self.diff, self.target_adapter)
+            changed, removed = self.fingerprints.save(failed)
+            self.logger.info(
+                "Fingerprints updated: %s changed, %s removed, %s failed objects kept for the next run",
+                changed,
+                removed,
+                len(failed),
+            )
+
 
 # ============================================================
 # Nautobot → Panorama
@@ -192,13 +652,23 @@ class NautobotToPanoramaSync(PanoramaJobMixin, DataSource, DataTarget):
     dryrun_default = False
 
     def run(self, *args, **kwargs):
+        from nautobot_panorama_ssot.utils.symbols import SymbolTable, use_symbol_table
+
         self.kwargs = kwargs
-        return super().run(*args, **kwargs)
+        # One symbol table per run, shared by both adapters
+        self.symbols = SymbolTable()
+        with use_symbol_table(self.symbols):
+            return super().run(*args, **kwargs)
 
     def load_source_adapter(self):
-        self.source_adapter = NautobotAdapter(
-            job=self,
-            sync=self,
+        from nautobot_panorama_ssot.diffsync.adapters.nautobot import NautobotAdapter
+
+        self.source_adapter = self.configure_partitioning(
+            NautobotAdapter(
+                job=self,
+                sync=self,
+                symbols=self.symbols,
+            )
         )
         self.source_adapter.load()
 
@@ -207,6 +677,313 @@ class NautobotToPanoramaSync(PanoramaJobMixin, DataSource, DataTarget):
         self.target_adapter.load()
 
 
+# ============================================================
+# Sharded Panorama → Nautobot
+# ============================================================
+
+class PanoramaShardedSync(PanoramaConnectionMixin, Job):
+    """
+    Run a Panorama → Nautobot sync as one child job per device-group
+    shard so that large control planes sync in parallel across Celery
+    workers. The shared scope is synced first, on its own.
+
+    The coordinator occupies a worker slot while it waits, so the worker
+    pool needs room for it plus the shards.
+    """
+
+    name = "Panorama ⟹  Nautobot Sync (sharded)"
+    description = "Panorama → Nautobot synchronization split into device-group shards"
+
+    dryrun = BooleanVar(default=False, description="Calculate the diff in every shard without applying it")
+
+    incremental_sync = BooleanVar(
+        default=False,
+        label="Incremental sync",
+        description="Skip objects whose content hash is unchanged since the last successful sync",
+    )
+
+    shard_size = IntegerVar(
+        default=DEFAULT_SHARD_SIZE,
+        min_value=1,
+        label="Device groups per shard",
+    )
+
+    shard_timeout = IntegerVar(
+        default=DEFAULT_SHARD_TIMEOUT,
+        min_value=60,
+        label="Shard timeout (seconds)",
+        description="Give up waiting for the shard jobs after this long",
+    )
+
+    def shard_kwargs(self, device_groups):
+        return {
+            "control_plane": self.selected_control_plane,
+            "device_groups": ",".join(device_groups),
+            "dryrun": self.kwargs.get("dryrun", False),
+            "memory_profiling": False,
+            "incremental_sync": self.kwargs.get("incremental_sync", False),
+        }
+
+    def dispatch(self, device_groups):
+        from nautobot_panorama_ssot.utils.sharding import enqueue_child_job
+
+        job_result = enqueue_child_job(PanoramaToNautobotSync, self.user, self.shard_kwargs(device_groups))
+        self.logger.info("Shard %s dispatched as %s", ",".join(device_groups), job_result.pk)
+        return device_groups, job_result
+
+    def run(self, *args, **kwargs):
+        from nautobot_panorama_ssot.utils.sharding import (
+            aggregate_sync_logs,
+            plan_shards,
+            shard_status,
+            wait_for_shards,
+        )
+
+        self.kwargs = kwargs
+        started = timezone.now()
+
+        cp = self.selected_control_plane
+        client = self.build_panorama_client()
+
+        shared, *shards = plan_shards(
+            [dg["name"] for dg in client.get_device_groups()],
+            kwargs.get("shard_size") or DEFAULT_SHARD_SIZE,
+        )
+        timeout = kwargs.get("shard_timeout") or DEFAULT_SHARD_TIMEOUT
+
+        self.logger.info("Syncing %s in %s shards", cp.name, len(shards) + 1)
+
+        dispatched = [self.dispatch(shared)]
+        wait_for_shards([dispatched[0][1]], timeout=timeout)
+
+        if dispatched[0][1].status == JobResultStatusChoices.STATUS_SUCCESS:
+            dispatched.extend(self.dispatch(device_groups) for device_groups in shards)
+            wait_for_shards([job_result for _, job_result in dispatched[1:]], timeout=timeout)
+        else:
+            self.logger.error("Shared scope shard failed; device-group shards were not dispatched")
+
+        config = self.get_panorama_config(cp)
+        sync_log = None
+        if config:
+            sync_log = aggregate_sync_logs(config, dispatched, job_result=self.job_result, started=started)
+
+        status = shard_status([job_result for _, job_result in dispatched])
+        self.logger.info(
+            "Sharded sync finished: %s (%s/%s shards dispatched)",
+            status,
+            len(dispatched),
+            len(shards) + 1,
+        )
+
+        if status != "success":
+            raise RuntimeError(f"Sharded sync of {cp.name} finished with status '{status}'")
+
+        return sync_log.pk if sync_log else None
+
+
+# ============================================================
+# Fleet (multiple control planes)
+# ============================================================
+
+class PanoramaFleetSync(Job):
+    """
+    Sync several control planes concurrently, each as its own child
+    job, under a global concurrency budget and a per-Panorama limit.
+    """
+
+    name = "Panorama Fleet Sync"
+    description = "Run Panorama syncs for several control planes under a shared concurrency budget"
+
+    control_planes = MultiObjectVar(
+        model=ControlPlaneSystem,
+        required=False,
+        label="Control Plane Systems",
+    )
+
+    configs = MultiObjectVar(
+        model=SSOTPanoramaConfig,
+        required=False,
+        label="SSOT Panorama Configs",
+        description="Sync every control plane mapped to these Panorama instances",
+    )
+
+    direction = ChoiceVar(
+        choices=[
+            ("panorama_to_nautobot", "Panorama → Nautobot"),
+            ("nautobot_to_panorama", "Nautobot → Panorama"),
+        ],
+        default="panorama_to_nautobot",
+    )
+
+    dryrun = BooleanVar(default=False, description="Calculate the diff for every control plane without applying it")
+
+    budget = IntegerVar(
+        default=DEFAULT_FLEET_BUDGET,
+        min_value=1,
+        label="Concurrent syncs",
+        description="Child sync jobs running at once across the fleet",
+    )
+
+    per_panorama_limit = IntegerVar(
+        default=DEFAULT_PER_PANORAMA_LIMIT,
+        min_value=1,
+        label="Concurrent syncs per Panorama",
+        description="Child sync jobs running at once against the same Panorama instance",
+    )
+
+    timeout = IntegerVar(
+        default=DEFAULT_FLEET_TIMEOUT,
+        min_value=60,
+        label="Timeout (seconds)",
+    )
+
+    def selected_control_planes(self):
+        """
+        Requested control planes in order, without duplicates or
+        control planes whose config is disabled for jobs.
+        """
+
+        selected = {cp.pk: cp for cp in self.kwargs.get("control_planes") or ()}
+
+        configs = [config for config in self.kwargs.get("configs") or () if config.job_enabled]
+        if configs:
+            for cp in ControlPlaneSystem.objects.filter(
+                external_integration__in=[config.panorama_instance for config in configs],
+            ):
+                selected.setdefault(cp.pk, cp)
+
+        control_planes = []
+        for cp in selected.values():
+            config = SSOTPanoramaConfig.objects.filter(panorama_instance=cp.external_integration).first()
+
+            if config and not config.job_enabled:
+                self.logger.warning("Skipping %s: its SSOT Panorama Config is disabled for jobs", cp.name)
+            elif config and self.job_class is PanoramaToNautobotSync and not config.enable_sync_to_nautobot:
+                self.logger.warning("Skipping %s: sync to Nautobot is disabled in its config", cp.name)
+            else:
+                control_planes.append(cp)
+
+        return control_planes
+
+    @property
+    def job_class(self):
+        if self.kwargs.get("direction") == "nautobot_to_panorama":
+            return NautobotToPanoramaSync
+        return PanoramaToNautobotSync
+
+    def dispatch(self, cp):
+        from nautobot_panorama_ssot.utils.sharding import enqueue_child_job
+
+        job_result = enqueue_child_job(
+            self.job_class,
+            self.user,
+            {
+                "control_plane": cp,
+                "dryrun": self.kwargs.get("dryrun", False),
+                "memory_profiling": False,
+            },
+        )
+        self.logger.info("%s sync dispatched as %s", cp.name, job_result.pk)
+        return job_result
+
+    def run(self, *args, **kwargs):
+        from nautobot_panorama_ssot.utils.fleet import FleetScheduler, fleet_summary, run_fleet
+
+        self.kwargs = kwargs
+
+        control_planes = self.selected_control_planes()
+        if not control_planes:
+            raise ValueError("Select at least one enabled control plane or SSOT Panorama Config")
+
+        scheduler = FleetScheduler(
+            control_planes,
+            budget=kwargs.get("budget") or DEFAULT_FLEET_BUDGET,
+            per_key_limit=kwargs.get("per_panorama_limit") or DEFAULT_PER_PANORAMA_LIMIT,
+            key=lambda cp: cp.external_integration_id,
+        )
+
+        self.logger.info(
+            "Syncing %s control planes, %s at a time (%s per Panorama)",
+            len(control_planes),
+            scheduler.budget,
+            scheduler.per_key_limit,
+        )
+
+        completed = run_fleet(scheduler, self.dispatch, timeout=kwargs.get("timeout") or DEFAULT_FLEET_TIMEOUT)
+        summary = fleet_summary(completed)
+
+        for name, row in summary["control_planes"].items():
+            log = self.logger.info if row["status"] == JobResultStatusChoices.STATUS_SUCCESS else self.logger.error
+            log(
+                "%s: %s (+%s ~%s -%s, %ss)",
+                name,
+                row["status"],
+                row["created"],
+                row["updated"],
+                row["deleted"],
+                row["duration"],
+            )
+
+        self.logger.info("Fleet totals: %s", summary["totals"])
+        self.create_file("panorama-fleet-summary.json", json.dumps(summary, indent=2, sort_keys=True))
+
+        failed = [
+            name
+            for name, row in summary["control_planes"].items()
+            if row["status"] != JobResultStatusChoices.STATUS_SUCCESS
+        ]
+        if failed:
+            raise RuntimeError(f"Sync failed for {len(failed)} control plane(s): {', '.join(failed)}")
+
+        return summary["totals"]
+
+
+# ============================================================
+# Hit Count Collector
+# ============================================================
+
+class PanoramaHitCountCollector(PanoramaConnectionMixin, Job):
+    """
+    Poll rule hit counters for every device group and store them as
+    delta-encoded samples. Intended to run as a scheduled job.
+    """
+
+    name = "Panorama Rule Hit Count Collector"
+    description = "Store Panorama rule hit counts in the local time-series store"
+
+    downsample = BooleanVar(
+        default=True,
+        description="Roll aged samples into hourly and daily buckets after collecting",
+    )
+
+    def run(self, *args, **kwargs):
+        from nautobot_panorama_ssot.utils.hitcounts import downsample_hit_counts, record_hit_counts
+
+        self.kwargs = kwargs
+
+        cp = self.selected_control_plane
+        client = self.build_panorama_client()
+
+        device_groups = ["shared"] + [dg["name"] for dg in client.get_device_groups()]
+
+        total = 0
+        for dg in device_groups:
+            hits = client.get_rule_hit_counts(dg)
+            total += record_hit_counts(cp.name, dg, hits)
+
+        self.logger.info(
+            "Stored %s hit count samples across %s device groups",
+            total,
+            len(device_groups),
+        )
+
+        if kwargs.get("downsample", True):
+            stats = downsample_hit_counts()
+            self.logger.info("Hit count downsampling: %s", stats)
+
+        self.log_client_stats(client)
+
+
 # ============================================================
 # Register
 # ============================================================
@@ -214,4 +991,7 @@ class NautobotToPanoramaSync(PanoramaJobMixin, DataSource, DataTarget):
 register_jobs(
     PanoramaToNautobotSync,
     NautobotToPanoramaSync,
+    PanoramaShardedSync,
+    PanoramaFleetSync,
+    PanoramaHitCountCollector,
 )
@@ -0,0 +1,69 @@
+"""Run the end-to-end sync benchmark and compare it to a stored baseline."""
+
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_panorama_ssot.utils.benchmark import (
+    BENCHMARK_PROFILES,
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+DEFAULT_BASELINE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "benchmarks")
+
+
+class Command(BaseCommand):
+    help = "Benchmark Panorama load, diff, sync and commit phases against simulated Panoramas"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profile", choices=sorted(BENCHMARK_PROFILES), default="small")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--latency", type=float, default=0.0, help="Simulated per-request latency (seconds)")
+        parser.add_argument("--baseline-dir", default=DEFAULT_BASELINE_DIR)
+        parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+        parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+        parser.add_argument("--output", help="Also write the results to this JSON file")
+
+    def handle(self, *args, **options):
+
+        profile = options["profile"]
+
+        results = run_benchmark(
+            profile=profile,
+            seed=options["seed"],
+            simulator_options={"latency": options["latency"]},
+        )
+
+        for phase, metrics in results["phases"].items():
+            self.stdout.write(
+                f"{phase:<20} {metrics['wall_s']:>9.3f}s "
+                f"{metrics['http_requests']:>8} http {metrics['peak_rss_mb']:>9.1f} MB"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump(results, handle, indent=2, sort_keys=True)
+
+        baseline_dir = os.path.abspath(options["baseline_dir"])
+        baseline = load_baseline(baseline_dir, profile)
+
+        if options["update_baseline"] or baseline is None:
+            path = save_baseline(baseline_dir, results)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {path}"))
+            return
+
+        regressions = compare_to_baseline(results, baseline, options["threshold"])
+
+        if regressions:
+            for phase, metric, old, new in regressions:
+                self.stderr.write(f"{phase}.{metric}: {old} -> {new}")
+            raise CommandError(
+                f"{len(regressions)} metric(s) regressed more than {options['threshold']:.0%} against the baseline"
+            )
+
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.26 on 2026-10-19 09:12
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0005_ssotpanoramaconfig_enable_sync_to_nautobot_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PanoramaRuleHitCount',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('control_plane', models.CharField(max_length=255)),
+                ('device_group', models.CharField(max_length=255)),
+                ('rule_name', models.CharField(max_length=255)),
+                ('resolution', models.CharField(choices=[('raw', 'Raw'), ('hourly', 'Hourly'), ('daily', 'Daily')], default='raw', max_length=10)),
+                ('bucket_start', models.DateTimeField(help_text='Sample time (raw) or start of the hourly/daily bucket')),
+                ('hit_delta', models.BigIntegerField(default=0, help_text='Hits observed since the previous sample')),
+                ('hit_total', models.BigIntegerField(default=0, help_text='Panorama counter value at the end of the bucket')),
+            ],
+            options={
+                'verbose_name': 'Panorama Rule Hit Count',
+                'verbose_name_plural': 'Panorama Rule Hit Counts',
+                'ordering': ['control_plane', 'device_group', 'rule_name', 'bucket_start'],
+                'unique_together': {('control_plane', 'device_group', 'rule_name', 'resolution', 'bucket_start')},
+                'indexes': [
+                    models.Index(fields=['control_plane', 'device_group', 'bucket_start'], name='panorama_hitcount_dg_idx'),
+                    models.Index(fields=['resolution', 'bucket_start'], name='panorama_hitcount_res_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.26 on 2026-10-19 10:02
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0006_panoramarulehitcount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PanoramaObjectFingerprint',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('control_plane', models.CharField(max_length=255)),
+                ('model_type', models.CharField(max_length=50)),
+                ('logical_group', models.CharField(max_length=255)),
+                ('name', models.CharField(max_length=255)),
+                ('identifier', models.CharField(help_text='DiffSync unique id of the object', max_length=1024)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('last_synced', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Panorama Object Fingerprint',
+                'verbose_name_plural': 'Panorama Object Fingerprints',
+                'ordering': ['control_plane', 'model_type', 'identifier'],
+                'unique_together': {('control_plane', 'model_type', 'identifier')},
+            },
+        ),
+    ]
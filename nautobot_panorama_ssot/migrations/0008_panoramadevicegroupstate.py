@@ -0,0 +1,32 @@
+# Generated by Django 4.2.26 on 2026-10-19 10:47
+
+import django.core.serializers.json
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0007_panoramaobjectfingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PanoramaDeviceGroupState',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('control_plane', models.CharField(max_length=255)),
+                ('device_group', models.CharField(max_length=255)),
+                ('config_version', models.CharField(max_length=64)),
+                ('records', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('last_loaded', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Panorama Device Group State',
+                'verbose_name_plural': 'Panorama Device Group States',
+                'ordering': ['control_plane', 'device_group'],
+                'unique_together': {('control_plane', 'device_group')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.26 on 2026-10-19 11:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0008_panoramadevicegroupstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ssotpanoramaconfig',
+            name='max_requests_per_second',
+            field=models.PositiveIntegerField(blank=True, help_text='Ceiling on Panorama API requests per second (empty for no limit)', null=True),
+        ),
+        migrations.AddField(
+            model_name='ssotpanoramaconfig',
+            name='max_concurrency',
+            field=models.PositiveIntegerField(default=10, help_text='Ceiling on in-flight Panorama API requests; the client adapts below it'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.26 on 2026-10-19 13:05
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extras', '0125_jobresult_date_started'),
+        ('nautobot_panorama_ssot', '0009_ssotpanoramaconfig_flow_control'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='panoramasynclog',
+            name='job_result',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='extras.jobresult'),
+        ),
+        migrations.AddField(
+            model_name='panoramasynclog',
+            name='duration',
+            field=models.FloatField(blank=True, help_text='Total sync time in seconds', null=True),
+        ),
+        migrations.AddField(
+            model_name='panoramasynclog',
+            name='phase_timings',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+        migrations.AddField(
+            model_name='panoramasynclog',
+            name='http_stats',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+        migrations.AddField(
+            model_name='panoramasynclog',
+            name='query_counts',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+        migrations.AddField(
+            model_name='panoramasynclog',
+            name='object_counts',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+    ]
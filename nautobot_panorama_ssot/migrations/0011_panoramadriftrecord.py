@@ -0,0 +1,39 @@
+# Generated by Django 4.2.26 on 2026-10-19 14:12
+
+import django.core.serializers.json
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0010_panoramasynclog_instrumentation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PanoramaDriftRecord',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('control_plane', models.CharField(max_length=255)),
+                ('logical_group', models.CharField(max_length=255)),
+                ('object_type', models.CharField(max_length=50)),
+                ('name', models.CharField(max_length=255)),
+                ('action', models.CharField(max_length=50)),
+                ('run', models.UUIDField(help_text='JobResult of the run that recorded the drift')),
+                ('recorded', models.DateTimeField(help_text='When the drift was detected')),
+                ('extra', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                'verbose_name': 'Panorama Drift Record',
+                'verbose_name_plural': 'Panorama Drift Records',
+                'ordering': ['-recorded'],
+                'indexes': [
+                    models.Index(fields=['control_plane', 'logical_group', 'object_type', 'name', 'run'], name='panorama_drift_object_idx'),
+                    models.Index(fields=['control_plane', 'logical_group', 'recorded'], name='panorama_drift_dg_idx'),
+                    models.Index(fields=['run'], name='panorama_drift_run_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.26 on 2026-10-19 15:03
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0011_panoramadriftrecord'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PanoramaSyncCheckpoint',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('control_plane', models.CharField(max_length=255)),
+                ('job', models.CharField(help_text='Sync job class', max_length=100)),
+                ('kind', models.CharField(choices=[('partition', 'Partition'), ('chunk', 'Batch Chunk')], max_length=20)),
+                ('key', models.CharField(max_length=255)),
+                ('completed', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Panorama Sync Checkpoint',
+                'verbose_name_plural': 'Panorama Sync Checkpoints',
+                'ordering': ['control_plane', 'job', 'completed'],
+                'unique_together': {('control_plane', 'job', 'kind', 'key')},
+            },
+        ),
+    ]
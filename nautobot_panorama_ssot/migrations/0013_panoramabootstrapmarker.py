@@ -0,0 +1,27 @@
+# Generated by Django 4.2.26 on 2026-10-19 16:21
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nautobot_panorama_ssot', '0012_panoramasynccheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PanoramaBootstrapMarker',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('version', models.CharField(max_length=50, unique=True)),
+                ('completed', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Panorama Bootstrap Marker',
+                'verbose_name_plural': 'Panorama Bootstrap Markers',
+                'ordering': ['-completed'],
+            },
+        ),
+    ]
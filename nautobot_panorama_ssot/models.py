@@ -1,6 +1,7 @@
 """Models for Nautobot Panorama SSOT App."""
 
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 try:
@@ -8,12 +9,19 @@ try:
 except ImportError:
     CHARFIELD_MAX_LENGTH = 255
 
-from nautobot.apps.models import PrimaryModel
+from nautobot.apps.models import BaseModel, PrimaryModel
 from nautobot.core.models.generics import OrganizationalModel
 
 from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
 from nautobot.extras.models import SecretsGroupAssociation, ExternalIntegration
 
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_MAX_CONCURRENCY,
+    HIT_COUNT_RESOLUTION_RAW,
+    HIT_COUNT_RESOLUTION_HOURLY,
+    HIT_COUNT_RESOLUTION_DAILY,
+)
+
 # class PanoramaConnection(PrimaryModel):
 class SSOTPanoramaConfig(PrimaryModel):
     """Model to store Panorama connection details using External Integration."""
@@ -62,6 +70,17 @@ class SSOTPanoramaConfig(PrimaryModel):
         help_text="Enable this config for use in jobs"
     )
 
+    max_requests_per_second = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Ceiling on Panorama API requests per second (empty for no limit)"
+    )
+
+    max_concurrency = models.PositiveIntegerField(
+        default=DEFAULT_MAX_CONCURRENCY,
+        help_text="Ceiling on in-flight Panorama API requests; the client adapts below it"
+    )
+
     class Meta:
         """Meta class for SSOTPanoramaConfig."""
 
@@ -147,6 +166,21 @@ class PanoramaSyncLog(OrganizationalModel):
         blank=True,
         help_text="Error details if sync failed"
     )
+
+    job_result = models.ForeignKey(
+        to="extras.JobResult",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    # Performance profile of the run, see utils.instrumentation
+    duration = models.FloatField(null=True, blank=True, help_text="Total sync time in seconds")
+    phase_timings = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    http_stats = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    query_counts = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    object_counts = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
     
     class Meta:
         ordering = ["-sync_start"]
@@ -155,3 +189,207 @@ class PanoramaSyncLog(OrganizationalModel):
     
     def __str__(self):
         return f"{self.connection} - {self.sync_start} - {self.status}"
+
+
+class PanoramaRuleHitCount(BaseModel):
+    """Delta-encoded rule hit count sample for one time bucket.
+
+    Raw samples are written by the hit count collector job and rolled up
+    into hourly and daily buckets as they age.
+    """
+
+    control_plane = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    device_group = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    rule_name = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+
+    resolution = models.CharField(
+        max_length=10,
+        choices=[
+            (HIT_COUNT_RESOLUTION_RAW, "Raw"),
+            (HIT_COUNT_RESOLUTION_HOURLY, "Hourly"),
+            (HIT_COUNT_RESOLUTION_DAILY, "Daily"),
+        ],
+        default=HIT_COUNT_RESOLUTION_RAW,
+    )
+
+    bucket_start = models.DateTimeField(
+        help_text="Sample time (raw) or start of the hourly/daily bucket"
+    )
+
+    hit_delta = models.BigIntegerField(
+        default=0,
+        help_text="Hits observed since the previous sample"
+    )
+
+    hit_total = models.BigIntegerField(
+        default=0,
+        help_text="Panorama counter value at the end of the bucket"
+    )
+
+    class Meta:
+        ordering = ["control_plane", "device_group", "rule_name", "bucket_start"]
+        verbose_name = "Panorama Rule Hit Count"
+        verbose_name_plural = "Panorama Rule Hit Counts"
+        unique_together = [
+            ("control_plane", "device_group", "rule_name", "resolution", "bucket_start"),
+        ]
+        indexes = [
+            models.Index(
+                fields=["control_plane", "device_group", "bucket_start"],
+                name="panorama_hitcount_dg_idx",
+            ),
+            models.Index(
+                fields=["resolution", "bucket_start"],
+                name="panorama_hitcount_res_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.device_group}/{self.rule_name} @ {self.bucket_start} (+{self.hit_delta})"
+
+
+class PanoramaObjectFingerprint(BaseModel):
+    """Content hash of a DiffSync model from the last successful sync.
+
+    Used by incremental sync to skip objects whose source attributes
+    have not changed since they were last written to Nautobot.
+    """
+
+    control_plane = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    model_type = models.CharField(max_length=50)
+    logical_group = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    name = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    identifier = models.CharField(
+        max_length=1024,
+        help_text="DiffSync unique id of the object"
+    )
+    content_hash = models.CharField(max_length=64)
+    last_synced = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["control_plane", "model_type", "identifier"]
+        verbose_name = "Panorama Object Fingerprint"
+        verbose_name_plural = "Panorama Object Fingerprints"
+        unique_together = [("control_plane", "model_type", "identifier")]
+
+    def __str__(self):
+        return f"{self.model_type} {self.identifier} ({self.content_hash[:8]})"
+
+
+class PanoramaDeviceGroupState(BaseModel):
+    """Loaded DiffSync records of one device group at a known config version.
+
+    Lets PanoramaAdapter rebuild device groups whose config has not
+    changed since the previous successful run instead of reloading them.
+    """
+
+    control_plane = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    device_group = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    config_version = models.CharField(max_length=64)
+    records = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    last_loaded = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["control_plane", "device_group"]
+        verbose_name = "Panorama Device Group State"
+        verbose_name_plural = "Panorama Device Group States"
+        unique_together = [("control_plane", "device_group")]
+
+    def __str__(self):
+        return f"{self.control_plane}/{self.device_group} @ {self.config_version[:8]}"
+
+
+class PanoramaDriftRecord(BaseModel):
+    """One drift finding of a drift-only sync run.
+
+    Written in batches from DriftAudit so drift history can be queried
+    per device group and time range without re-running the job.
+    """
+
+    control_plane = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    logical_group = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    object_type = models.CharField(max_length=50)
+    name = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    action = models.CharField(max_length=50)
+
+    run = models.UUIDField(
+        help_text="JobResult of the run that recorded the drift"
+    )
+
+    recorded = models.DateTimeField(
+        help_text="When the drift was detected"
+    )
+
+    extra = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        ordering = ["-recorded"]
+        verbose_name = "Panorama Drift Record"
+        verbose_name_plural = "Panorama Drift Records"
+        indexes = [
+            models.Index(
+                fields=["control_plane", "logical_group", "object_type", "name", "run"],
+                name="panorama_drift_object_idx",
+            ),
+            models.Index(
+                fields=["control_plane", "logical_group", "recorded"],
+                name="panorama_drift_dg_idx",
+            ),
+            models.Index(
+                fields=["run"],
+                name="panorama_drift_run_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.action} {self.object_type} {self.logical_group}/{self.name}"
+
+
+class PanoramaSyncCheckpoint(BaseModel):
+    """Progress marker of an interrupted sync job.
+
+    A "partition" checkpoint records a (model type, logical group) whose
+    changes were all applied; a "chunk" checkpoint records a Panorama
+    write batch chunk that was applied. A run started with resume skips
+    both; a successful run clears its checkpoints.
+    """
+
+    control_plane = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    job = models.CharField(max_length=100, help_text="Sync job class")
+    kind = models.CharField(
+        max_length=20,
+        choices=[
+            ("partition", "Partition"),
+            ("chunk", "Batch Chunk"),
+        ],
+    )
+    key = models.CharField(max_length=CHARFIELD_MAX_LENGTH)
+    completed = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["control_plane", "job", "completed"]
+        verbose_name = "Panorama Sync Checkpoint"
+        verbose_name_plural = "Panorama Sync Checkpoints"
+        unique_together = [("control_plane", "job", "kind", "key")]
+
+    def __str__(self):
+        return f"{self.control_plane} {self.job} {self.kind} {self.key}"
+
+
+class PanoramaBootstrapMarker(BaseModel):
+    """Records that the database-ready bootstrap of a given version ran.
+
+    Lets the nautobot_database_ready callback return after a single
+    query on every later migrate/post_upgrade.
+    """
+
+    version = models.CharField(max_length=50, unique=True)
+    completed = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-completed"]
+        verbose_name = "Panorama Bootstrap Marker"
+        verbose_name_plural = "Panorama Bootstrap Markers"
+
+    def __str__(self):
+        return f"bootstrap v{self.version}"
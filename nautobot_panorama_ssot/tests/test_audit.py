@@ -0,0 +1,67 @@
+"""Tests for the streaming drift audit"""
+
+import uuid
+
+from nautobot_panorama_ssot.utils.audit import DriftAudit, DriftRecordSink, JsonLinesSink
+
+
+class ListSink:
+
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def write(self, records):
+        self.batches.append(list(records))
+
+    def close(self):
+        self.closed = True
+
+
+def test_records_are_flushed_in_batches():
+    sink = ListSink()
+    audit = DriftAudit(sinks=[sink], batch_size=2, tail=1)
+
+    for index in range(5):
+        audit.record("create", "address", f"a{index}", "shared")
+
+    assert [len(batch) for batch in sink.batches] == [2, 2]
+    assert len(audit.operations) == 1
+
+    audit.close()
+
+    assert [len(batch) for batch in sink.batches] == [2, 2, 1]
+    assert sink.closed
+    assert audit.summary() == {"create": 5}
+
+
+def test_extra_is_kept(tmp_path):
+    sink = JsonLinesSink(str(tmp_path / "audit.jsonl.gz"))
+    audit = DriftAudit(sinks=[sink])
+
+    audit.record("blast_radius", "rule", "r1", "DG1", extra={"blast_size": 3})
+    audit.record("delete", "address", "a1", "DG1")
+    audit.close()
+
+    records = list(sink.read())
+
+    assert records[0]["extra"] == {"blast_size": 3}
+    assert "extra" not in records[1]
+    assert audit.detailed_summary()["scopes"] == {"DG1": 2}
+
+
+def test_drift_record_rows():
+    run = uuid.uuid4()
+    sink = DriftRecordSink("panorama-1", run)
+
+    row = sink._row({
+        "action": "update",
+        "type": "address",
+        "name": "a1",
+        "scope": "DG1",
+        "timestamp": "2026-10-19T12:00:00",
+    })
+
+    assert (row.control_plane, row.logical_group, row.object_type, row.run) == ("panorama-1", "DG1", "address", run)
+    assert row.recorded.tzinfo is not None
+    assert row.extra == {}
@@ -0,0 +1,68 @@
+"""Tests for benchmark baseline comparison"""
+
+from nautobot_panorama_ssot.utils.benchmark import (
+    compare_to_baseline,
+    drop_addresses,
+    run_benchmark,
+    simulated_panorama_adapter,
+)
+from nautobot_panorama_ssot.utils.datagen import dataset_size, generate_dataset
+from nautobot_panorama_ssot.utils.simulator import PanoramaSimulator
+
+
+def _results(**phase):
+    return {"phases": {"panorama_load": {"wall_s": 1.0, "http_requests": 100, "peak_rss_mb": 200.0, **phase}}}
+
+
+def test_regression_beyond_threshold_is_reported():
+    baseline = _results()
+
+    assert compare_to_baseline(_results(wall_s=1.1), baseline, threshold=0.2) == []
+    assert compare_to_baseline(_results(http_requests=130), baseline, threshold=0.2) == [
+        ("panorama_load", "http_requests", 100, 130),
+    ]
+
+
+def test_noise_floor_ignores_tiny_changes():
+    baseline = {"phases": {"diff": {"wall_s": 0.01}}}
+
+    assert compare_to_baseline({"phases": {"diff": {"wall_s": 0.03}}}, baseline) == []
+
+
+def test_drop_addresses_keeps_shared_scope():
+    dataset = generate_dataset(device_groups=2, objects_per_dg=200)
+    reduced = drop_addresses(dataset, ratio=0.5)
+
+    assert reduced["scopes"]["shared"] == dataset["scopes"]["shared"]
+    assert len(reduced["scopes"]["dg-0001"]["Objects/Addresses"]) < len(
+        dataset["scopes"]["dg-0001"]["Objects/Addresses"]
+    )
+
+
+def test_panorama_load_phase_against_simulator():
+    dataset = generate_dataset(device_groups=2, objects_per_dg=50, rules_per_rulebase=5)
+
+    with PanoramaSimulator(dataset) as simulator:
+        adapter = simulated_panorama_adapter(simulator, "benchmark-smoke")
+        adapter.load()
+
+    loaded = sum(len(adapter.get_all(model_type)) for model_type in adapter.top_level if model_type not in (
+        "control_plane", "logical_group",
+    ))
+    assert loaded == dataset_size(dataset)
+    assert len(adapter.get_all("logical_group")) == 3
+
+
+def test_run_benchmark_syncs_a_tiny_profile():
+    params = {"device_groups": 2, "objects_per_dg": 200, "rules_per_rulebase": 2}
+    dataset = generate_dataset(seed=0, **params)
+    missing = dataset_size(dataset) - dataset_size(drop_addresses(dataset))
+
+    results = run_benchmark(profile="tiny", dataset_params=params)
+
+    assert list(results["phases"]) == ["panorama_load", "target_load", "diff", "sync", "finalize"]
+    assert missing > 0
+    assert results["changes"]["create"] == missing
+    # One existence check and one POST per created address, then a commit per device group
+    assert results["phases"]["sync"]["http_requests"] >= 2 * missing
+    assert results["commits"] == 2
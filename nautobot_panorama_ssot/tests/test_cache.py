@@ -0,0 +1,78 @@
+"""Tests for the on-disk adapter state cache"""
+
+from diffsync import DiffSync
+
+from nautobot_panorama_ssot.diffsync.models.base import AddressModel, ControlPlaneModel
+from nautobot_panorama_ssot.utils.benchmark import simulated_panorama_adapter
+from nautobot_panorama_ssot.utils.cache import AdapterStateCache, FreshnessPolicy
+from nautobot_panorama_ssot.utils.simulator import PanoramaSimulator
+
+
+class FakeModel:
+
+    def __init__(self, **data):
+        self.data = data
+
+    def dict(self, exclude=None, exclude_none=False):
+        return dict(self.data)
+
+
+class FakeAdapter:
+
+    def __init__(self, records):
+        self.records = records
+
+    def get_all(self, modelname):
+        return self.records.get(modelname, [])
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = AdapterStateCache("Panorama 1", cache_dir=str(tmp_path))
+    adapter = FakeAdapter({"address": [FakeModel(name="a1", logical_group="DG1")]})
+
+    assert cache.read() is None
+    assert cache.write(adapter, ("address",), config_version="v1") == 1
+
+    payload = cache.read()
+    assert payload["config_version"] == "v1"
+    assert payload["records"] == [["address", {"name": "a1", "logical_group": "DG1"}]]
+
+
+def test_freshness_policy():
+    policy = FreshnessPolicy(ttl=300, max_age=3600)
+
+    assert policy.is_fresh({"timestamp": 1000}, now=1200)
+    assert policy.needs_version_check({"timestamp": 1000}, now=2000)
+    assert not policy.needs_version_check({"timestamp": 1000}, now=9000)
+
+
+def test_cached_records_rebuild_models(tmp_path):
+    cache = AdapterStateCache("Panorama 1", cache_dir=str(tmp_path))
+    adapter = DiffSync()
+    adapter.add(ControlPlaneModel(name="pano"))
+    adapter.add(AddressModel(name="a1", logical_group="DG1", value="10.0.0.1/32", type="ip-netmask", scope="device-group"))
+    cache.write(adapter, ("control_plane", "address"))
+
+    models = {"control_plane": ControlPlaneModel, "address": AddressModel}
+    rebuilt = [models[modelname](**data) for modelname, data in cache.read()["records"]]
+
+    assert [model.get_unique_id() for model in rebuilt] == ["pano", "a1__DG1__device-group"]
+
+
+def test_writes_to_panorama_clear_the_cache(tmp_path):
+    dataset = {
+        "device_groups": ["dg-1"],
+        "scopes": {"dg-1": {"Objects/Addresses": [{"@name": "web-1", "ip-netmask": "10.0.0.1/32"}]}},
+    }
+    cache = AdapterStateCache("Panorama 1", cache_dir=str(tmp_path))
+
+    with PanoramaSimulator(dataset) as simulator:
+        # A scoped adapter does not read the cache but still invalidates it
+        adapter = simulated_panorama_adapter(simulator, "Panorama 1", state_cache=cache, device_groups=["dg-1"])
+        adapter.load()
+        cache.write(adapter, ("address",))
+
+        address = adapter.get("address", {"name": "web-1", "logical_group": "dg-1", "scope": "device-group"})
+        adapter.update_address(address, {"description": "web"})
+
+    assert cache.read() is None
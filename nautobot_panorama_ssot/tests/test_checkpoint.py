@@ -0,0 +1,144 @@
+"""Tests for resumable sync checkpoints"""
+
+import pytest
+from diffsync import Adapter
+from diffsync.exceptions import ObjectNotCreated
+
+from nautobot_panorama_ssot.diffsync.models.base import AddressModel
+from nautobot_panorama_ssot.utils import checkpoint as checkpoint_module
+from nautobot_panorama_ssot.utils.checkpoint import SyncCheckpoint, chunk_digest, pending_partitions
+
+
+class FakeElement:
+
+    def __init__(self, type, name, keys, action=None, children=()):
+        self.type = type
+        self.name = name
+        self.keys = keys
+        self.action = action
+        self.children = list(children)
+
+    def get_children(self):
+        return iter(self.children)
+
+
+class FakeDiff(FakeElement):
+
+    def __init__(self, children):
+        super().__init__("diff", "", {}, children=children)
+
+
+def test_pending_partitions_counts_changed_elements():
+    diff = FakeDiff([
+        FakeElement("control_plane", "pano", {"name": "pano"}, children=[
+            FakeElement("logical_group", "DG1", {"name": "DG1"}, action="create"),
+            FakeElement("address", "a1", {"name": "a1", "logical_group": "DG1"}, action="create"),
+            FakeElement("address", "a2", {"name": "a2", "logical_group": "DG1"}, action="update"),
+            FakeElement("address", "a3", {"name": "a3", "logical_group": "shared"}),
+            FakeElement("nat_rule", "n1", {"name": "n1", "device_group": "DG1"}, action="delete"),
+        ]),
+    ])
+
+    assert pending_partitions(diff) == {
+        ("logical_group", "DG1"): 1,
+        ("address", "DG1"): 2,
+        ("nat_rule", "DG1"): 1,
+    }
+
+
+def create_address(payload):
+    return payload
+
+
+def test_chunk_digest_depends_on_content_only():
+    chunk = [(create_address, ({"name": "a1"},), {})]
+
+    assert chunk_digest(chunk) == chunk_digest(list(chunk))
+    assert chunk_digest(chunk) != chunk_digest([(create_address, ({"name": "a2"},), {})])
+
+
+class FakeCheckpointRows:
+    """In-memory stand-in for PanoramaSyncCheckpoint rows."""
+
+    def __init__(self):
+        self.rows = set()
+
+    def filter(self, **kwargs):
+        rows = self
+
+        class QuerySet:
+            def values_list(self, *fields):
+                return [(kind, key) for _, _, kind, key in rows.rows]
+
+            def delete(self):
+                rows.rows.clear()
+
+        return QuerySet()
+
+    def get_or_create(self, control_plane, job, kind, key):
+        self.rows.add((control_plane, job, kind, key))
+
+
+class AddressSource(Adapter):
+    address = AddressModel
+    top_level = ["address"]
+
+
+class AddressTarget(Adapter):
+    """Writes addresses to `database`, failing on names in `failing`."""
+
+    address = AddressModel
+    top_level = ["address"]
+
+    def __init__(self, database, failing=()):
+        super().__init__()
+        self.database = database
+        self.failing = set(failing)
+        self.written = []
+
+    def load(self):
+        for name, logical_group in self.database:
+            self.add(self.address(name=name, logical_group=logical_group, scope="device-group", value="10.0.0.1/32", type="ip-netmask"))
+
+    def create_address(self, model):
+        if model.name in self.failing:
+            raise RuntimeError("database unavailable")
+        self.database.append((model.name, model.logical_group))
+        self.written.append(model.name)
+
+
+def source_adapter():
+    source = AddressSource()
+    for name, logical_group in (("a1", "DG1"), ("a2", "DG1"), ("b1", "DG2"), ("b2", "DG2")):
+        source.add(AddressModel(name=name, logical_group=logical_group, scope="device-group", value="10.0.0.1/32", type="ip-netmask"))
+    return source
+
+
+def test_sync_resumes_after_the_last_completed_partition(monkeypatch):
+    monkeypatch.setattr(checkpoint_module.PanoramaSyncCheckpoint, "objects", FakeCheckpointRows())
+    database = []
+
+    # First run fails on the last address of DG2
+    source, target = source_adapter(), AddressTarget(database, failing={"b2"})
+    checkpoint = SyncCheckpoint("pano", "job")
+    diff = source.diff_to(target)
+    checkpoint.track(diff, target)
+
+    with pytest.raises(ObjectNotCreated):
+        source.sync_to(target, diff=diff)
+
+    assert target.written == ["a1", "a2", "b1"]
+    assert checkpoint.completed_partitions == {("address", "DG1")}
+
+    # The resumed run skips DG1 and only creates what is left of DG2
+    source, target = source_adapter(), AddressTarget(database)
+    target.load()
+    checkpoint = SyncCheckpoint("pano", "job")
+    assert checkpoint.prune(source, target) == 4
+
+    diff = source.diff_to(target)
+    checkpoint.track(diff, target)
+    source.sync_to(target, diff=diff)
+
+    assert target.written == ["b2"]
+    assert checkpoint.completed_partitions == {("address", "DG1"), ("address", "DG2")}
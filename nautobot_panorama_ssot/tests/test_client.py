@@ -0,0 +1,81 @@
+"""Tests for PanoramaClient retries"""
+
+import pytest
+import requests
+
+from nautobot_panorama_ssot.constant import DEFAULT_RETRY_BACKOFF_MAX
+from nautobot_panorama_ssot.utils import client as client_module
+from nautobot_panorama_ssot.utils.client import PanoramaClient, PanoramaClientError, decode_json, endpoint_name
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, content=b"{}", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode()
+        self.headers = headers or {}
+
+
+def make_client(monkeypatch, outcomes):
+    monkeypatch.setattr(client_module.time, "sleep", lambda _: None)
+
+    client = PanoramaClient("https://panorama.example", "key", max_retries=2)
+    calls = []
+
+    def request(method, url, **kwargs):
+        calls.append(method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client.session.request = request
+    return client, calls
+
+
+def test_get_retried_on_transient_status(monkeypatch):
+    client, calls = make_client(monkeypatch, [FakeResponse(502), FakeResponse(200)])
+
+    assert client._request("GET", "Objects/Addresses") == {}
+    assert calls == ["GET", "GET"]
+    assert client.retry_stats["retries"] == 1
+
+
+def test_post_not_retried_when_outcome_unknown(monkeypatch):
+    client, calls = make_client(monkeypatch, [FakeResponse(502), FakeResponse(200)])
+
+    with pytest.raises(PanoramaClientError):
+        client._request("POST", "Commit")
+
+    assert calls == ["POST"]
+    assert client.retry_stats["write_retries_refused"] == 1
+
+
+def test_post_skipped_when_first_attempt_applied(monkeypatch):
+    client, calls = make_client(monkeypatch, [requests.exceptions.ReadTimeout()])
+
+    assert client._request("POST", "Objects/Addresses", applied_check=lambda: True) == {}
+    assert calls == ["POST"]
+    assert client.retry_stats["writes_already_applied"] == 1
+
+
+def test_retry_after_is_capped(monkeypatch):
+    client, calls = make_client(monkeypatch, [FakeResponse(429, headers={"Retry-After": "3600"}), FakeResponse(200)])
+    delays = []
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+
+    assert client._request("GET", "Objects/Addresses") == {}
+    assert delays == [DEFAULT_RETRY_BACKOFF_MAX]
+
+
+def test_decode_json_from_bytes():
+    assert decode_json(b"") == {}
+    assert decode_json(b'{"result": {"entry": []}}') == {"result": {"entry": []}}
+
+
+def test_endpoint_name_drops_object_names():
+    assert endpoint_name("Objects/Addresses/web-1") == "Objects/Addresses"
+    assert endpoint_name("Policies/SecurityPreRules/allow:move") == "Policies/SecurityPreRules:move"
+    assert endpoint_name("Jobs/42") == "Jobs"
+    assert endpoint_name("Commit/Validate") == "Commit/Validate"
@@ -0,0 +1,32 @@
+"""Tests for the synthetic dataset generator"""
+
+import xml.etree.ElementTree as ET
+
+from nautobot_panorama_ssot.utils.datagen import dataset_size, generate_dataset, to_xml_config
+
+
+def test_same_seed_same_dataset():
+    params = {"device_groups": 3, "objects_per_dg": 50, "seed": 7}
+
+    assert generate_dataset(**params) == generate_dataset(**params)
+    assert generate_dataset(**params) != generate_dataset(**{**params, "seed": 8})
+
+
+def test_group_nesting_and_shared_scope():
+    dataset = generate_dataset(device_groups=2, objects_per_dg=200, group_depth=3, shared_ratio=0.5)
+
+    groups = dataset["scopes"]["dg-0001"]["Objects/AddressGroups"]
+    assert {g["@name"].split("-l")[-1][0] for g in groups} == {"0", "1", "2"}
+
+    shared = len(dataset["scopes"]["shared"]["Objects/Addresses"])
+    assert shared >= len(dataset["scopes"]["dg-0001"]["Objects/Addresses"])
+
+
+def test_xml_export():
+    dataset = generate_dataset(device_groups=2, objects_per_dg=20, rules_per_rulebase=5)
+    config = ET.fromstring(ET.tostring(to_xml_config(dataset)))
+
+    assert config.find("shared/tag/entry") is not None
+    assert len(config.findall("devices/entry/device-group/entry")) == 2
+    assert len(config.findall(".//pre-rulebase/security/rules/entry")) == 15
+    assert dataset_size(dataset) > 0
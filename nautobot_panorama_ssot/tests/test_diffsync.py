@@ -66,3 +66,34 @@ def test_drift_mode(monkeypatch, adapter):
     adapter.create_address(model)
 
     assert adapter.audit.operations
+
+
+class CountingClient(MockClient):
+
+    def __init__(self):
+        super().__init__()
+        self.rule_fetches = 0
+
+    def get_security_rules(self, dg, rb):
+        self.rule_fetches += 1
+        return [{"@name": "r1"}]
+
+
+def test_rulebase_cache_fetches_once():
+    adapter = PanoramaAdapter(
+        control_plane=None,
+        base_url="https://panorama.example.local",
+        api_key="key",
+        verify_ssl=False,
+        timeout=5,
+        logger=None,
+    )
+    adapter.client = CountingClient()
+
+    adapter._get_cached_rules("DG1", "pre")
+    adapter._simulate_policy_diff("DG1")
+    assert adapter.client.rule_fetches == 2
+
+    adapter._invalidate_rulebase("DG1", "pre")
+    adapter._get_cached_rules("DG1", "pre")
+    assert adapter.client.rule_fetches == 3
@@ -0,0 +1,145 @@
+"""Tests for incremental sync fingerprints"""
+
+import contextlib
+
+from diffsync import Adapter
+from diffsync.enum import DiffSyncFlags
+from diffsync.exceptions import ObjectNotCreated
+
+from nautobot_panorama_ssot.diffsync.models.base import AddressModel
+from nautobot_panorama_ssot.utils import fingerprint as fingerprint_module
+from nautobot_panorama_ssot.utils.fingerprint import FingerprintIndex, failed_elements, fingerprint_model
+
+
+class FakeModel:
+
+    def __init__(self, model_type, name, logical_group, **attrs):
+        self.model_type = model_type
+        self.name = name
+        self.logical_group = logical_group
+        self.attrs = attrs
+
+    def get_attrs(self):
+        return dict(self.attrs)
+
+    def get_unique_id(self):
+        return f"{self.name}__{self.logical_group}"
+
+
+class FakeAdapter:
+
+    def __init__(self, models):
+        self.models = list(models)
+
+    def get_all(self, model_type):
+        return [m for m in self.models if m.model_type == model_type]
+
+    def remove(self, model):
+        self.models.remove(model)
+
+
+class FakeQuerySet(list):
+
+    def filter(self, **kwargs):
+        return self
+
+    def values_list(self, *fields):
+        return self
+
+
+def make_index(monkeypatch, stored):
+    rows = FakeQuerySet((model_type, identifier, content_hash) for (model_type, identifier), content_hash in stored.items())
+    monkeypatch.setattr(fingerprint_module.PanoramaObjectFingerprint.objects, "filter", lambda **kwargs: rows)
+    return FingerprintIndex("pano")
+
+
+def test_fingerprint_depends_on_attributes_only():
+    a = FakeModel("address", "a1", "DG1", value="10.0.0.1/32", tags=["t1"])
+
+    assert fingerprint_model(a) == fingerprint_model(FakeModel("address", "a1", "DG1", tags=["t1"], value="10.0.0.1/32"))
+    assert fingerprint_model(a) != fingerprint_model(FakeModel("address", "a1", "DG1", value="10.0.0.2/32", tags=["t1"]))
+
+
+def test_scan_groups_unchanged_names_by_type_and_logical_group(monkeypatch):
+    same = FakeModel("address", "a1", "DG1", value="10.0.0.1/32")
+    changed = FakeModel("address", "a2", "DG1", value="10.0.0.9/32")
+    new = FakeModel("address", "a3", "DG2", value="10.0.0.3/32")
+    rule = FakeModel("rule", "r1", "DG2", action="allow")
+
+    index = make_index(monkeypatch, {
+        ("address", same.get_unique_id()): fingerprint_model(same),
+        ("address", changed.get_unique_id()): "stale",
+        ("rule", rule.get_unique_id()): fingerprint_model(rule),
+    })
+
+    unchanged = index.scan(FakeAdapter([same, changed, new, rule]))
+
+    assert unchanged == {("address", "DG1"): {"a1"}, ("rule", "DG2"): {"r1"}}
+    assert len(index.current) == 4
+
+
+def test_prune_removes_only_unchanged_objects():
+    same = FakeModel("address", "a1", "DG1")
+    other_group = FakeModel("address", "a1", "DG2")
+    changed = FakeModel("address", "a2", "DG1")
+    adapter = FakeAdapter([same, other_group, changed])
+
+    removed = FingerprintIndex.prune(adapter, {("address", "DG1"): {"a1"}})
+
+    assert removed == 1
+    assert adapter.models == [other_group, changed]
+
+
+class RejectingAddress(AddressModel):
+    """Fails to create addresses named "rejected"."""
+
+    @classmethod
+    def create(cls, adapter, ids, attrs):
+        if ids["name"] == "rejected":
+            raise ObjectNotCreated("rejected by the target")
+        return super().create(adapter, ids, attrs)
+
+
+class SourceAdapter(Adapter):
+    address = AddressModel
+    top_level = ["address"]
+
+
+class TargetAdapter(Adapter):
+    address = RejectingAddress
+    top_level = ["address"]
+
+
+class FakeFingerprint:
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def test_failed_creates_keep_their_old_fingerprint(monkeypatch):
+    source = SourceAdapter()
+    for name in ("accepted", "rejected"):
+        source.add(AddressModel(name=name, logical_group="DG1", scope="device-group", value="10.0.0.1/32", type="ip-netmask"))
+    target = TargetAdapter()
+
+    diff = source.diff_to(target)
+    source.sync_to(target, flags=DiffSyncFlags.CONTINUE_ON_FAILURE, diff=diff)
+
+    rejected = source.get("address", "rejected__DG1__device-group")
+    assert failed_elements(diff, target) == {("address", rejected.get_unique_id())}
+
+    created = []
+    monkeypatch.setattr(fingerprint_module.transaction, "atomic", contextlib.nullcontext)
+    monkeypatch.setattr(fingerprint_module, "PanoramaObjectFingerprint", FakeFingerprint)
+    FakeFingerprint.objects = type("Manager", (), {
+        "filter": lambda self, **kwargs: FakeQuerySet(),
+        "bulk_update": lambda self, rows, fields, batch_size: None,
+        "bulk_create": lambda self, rows, batch_size: created.extend(rows),
+    })()
+
+    index = make_index(monkeypatch, {})
+    index.scan(source)
+
+    assert index.save(failed_elements(diff, target)) == (1, 0)
+    assert [fp.name for fp in created] == ["accepted"]
+    assert ("address", rejected.get_unique_id()) not in index.stored
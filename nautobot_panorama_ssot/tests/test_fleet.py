@@ -0,0 +1,31 @@
+"""Tests for the multi-control-plane fleet scheduler"""
+
+from nautobot_panorama_ssot.utils.fleet import FleetScheduler, run_fleet
+
+
+def test_admission_respects_budget_and_per_panorama_limit():
+    # (control plane, panorama)
+    items = [("cp1", "pano-a"), ("cp2", "pano-a"), ("cp3", "pano-b"), ("cp4", "pano-c")]
+    scheduler = FleetScheduler(items, budget=2, per_key_limit=1, key=lambda item: item[1])
+
+    assert scheduler.admit() == [("cp1", "pano-a"), ("cp3", "pano-b")]
+    assert scheduler.admit() == []
+
+    scheduler.release(("cp1", "pano-a"))
+
+    # cp2 keeps its place in the queue ahead of cp4
+    assert scheduler.admit() == [("cp2", "pano-a")]
+
+
+def test_run_fleet_waits_for_every_item():
+    scheduler = FleetScheduler(["cp1", "cp2", "cp3"], budget=2)
+    polls = {}
+
+    def finished(job_result):
+        polls[job_result] = polls.get(job_result, 0) + 1
+        return polls[job_result] > 1
+
+    completed = run_fleet(scheduler, lambda cp: f"job-{cp}", poll_interval=0, finished=finished)
+
+    assert sorted(item for item, _ in completed) == ["cp1", "cp2", "cp3"]
+    assert scheduler.done
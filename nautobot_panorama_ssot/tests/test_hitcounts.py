@@ -0,0 +1,32 @@
+"""Tests for hit count delta encoding"""
+
+from nautobot_panorama_ssot.utils.hitcounts import compute_hit_deltas
+
+
+def test_hit_deltas_from_previous_totals():
+
+    deltas = compute_hit_deltas(
+        {"r1": 100, "r2": 50},
+        [
+            {"rule-name": "r1", "hit-count": 150},
+            {"rule-name": "r2", "hit-count": 50},
+            {"rule-name": "r3", "hit-count": 7},
+        ],
+    )
+
+    assert deltas == {"r1": (50, 150), "r2": (0, 50), "r3": (0, 7)}
+
+
+def test_hit_deltas_first_sample_is_baseline():
+
+    deltas = compute_hit_deltas({}, [{"rule-name": "r1", "hit-count": 90000}])
+
+    # Lifetime hits must not land in the current analysis window
+    assert deltas == {"r1": (0, 90000)}
+
+
+def test_hit_deltas_counter_reset():
+
+    deltas = compute_hit_deltas({"r1": 500}, [{"rule-name": "r1", "hit-count": 20}])
+
+    assert deltas == {"r1": (20, 20)}
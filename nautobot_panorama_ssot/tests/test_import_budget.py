@@ -0,0 +1,53 @@
+"""Modules loaded when registering the app's jobs"""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+# Loaded on first use by a running job, never by job registration
+LAZY_MODULES = (
+    "nautobot_panorama_ssot.diffsync.adapters.panorama",
+    "nautobot_panorama_ssot.diffsync.adapters.nautobot",
+    "nautobot_panorama_ssot.diffsync.models.base",
+    "nautobot_panorama_ssot.utils.client",
+    "nautobot_panorama_ssot.utils.async_client",
+    "nautobot_panorama_ssot.utils.forward",
+    "nautobot_panorama_ssot.utils.compliance",
+    "nautobot_panorama_ssot.utils.diffsync",
+    "nautobot_panorama_ssot.utils.profiling",
+    "nautobot_panorama_ssot.utils.metrics",
+)
+
+# Runs in a fresh interpreter so modules loaded by other tests don't count
+SCRIPT = textwrap.dedent(
+    """
+    import importlib, json, sys
+
+    import nautobot
+    nautobot.setup()
+
+    # Re-import the jobs module with every non-model app module unloaded
+    keep = {"nautobot_panorama_ssot", "nautobot_panorama_ssot.models", "nautobot_panorama_ssot.constant"}
+    for name in [m for m in sys.modules if m.startswith("nautobot_panorama_ssot.") and m not in keep]:
+        del sys.modules[name]
+
+    importlib.import_module("nautobot_panorama_ssot.jobs")
+
+    print(json.dumps(sorted(m for m in sys.modules if m.startswith("nautobot_panorama_ssot."))))
+    """
+)
+
+
+def _import_jobs():
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_job_registration_does_not_load_adapters_or_clients():
+    assert not set(LAZY_MODULES) & set(_import_jobs())
@@ -0,0 +1,33 @@
+"""Tests for sync instrumentation"""
+
+from nautobot_panorama_ssot.utils.instrumentation import SyncInstrumentation
+
+
+def test_phases_and_http_summary():
+    instrumentation = SyncInstrumentation()
+
+    with instrumentation.phase("load_source_adapter"):
+        instrumentation.record_request("Objects/Addresses", 0.02, 200)
+        instrumentation.record_request("Objects/Addresses", 0.04, 503)
+
+    summary = instrumentation.summary()
+
+    assert summary["phases"]["load_source_adapter"]["queries"] == 0
+    assert summary["http"]["Objects/Addresses"] == {
+        "count": 2,
+        "errors": 1,
+        "total_s": 0.06,
+        "avg_ms": 30.0,
+        "max_ms": 40.0,
+    }
+
+
+def test_nested_scopes_count_queries_inclusively():
+    instrumentation = SyncInstrumentation()
+
+    with instrumentation.phase("execute_sync"):
+        with instrumentation.scope("NautobotAdapter.create_address"):
+            instrumentation._count_query(lambda *args: None, "SELECT 1", (), False, {})
+
+    assert instrumentation.phases["execute_sync"]["queries"] == 1
+    assert instrumentation.query_summary() == {"NautobotAdapter.create_address": 1}
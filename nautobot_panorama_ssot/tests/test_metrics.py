@@ -0,0 +1,27 @@
+"""Tests for Prometheus metrics"""
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from nautobot_panorama_ssot.utils import metrics  # noqa: E402
+
+
+def test_rendered_metrics_only_cover_this_app(monkeypatch):
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    metrics.observe_request("panorama-1", "Objects/Addresses", 0.05)
+    metrics.record_sync("prod", "panorama-1", 12.5, "success", created=3)
+
+    payload, content_type = metrics.render_metrics()
+    text = payload.decode()
+
+    assert content_type.startswith("text/plain")
+    assert 'endpoint="Objects/Addresses"' in text
+    assert any(
+        line.startswith("nautobot_panorama_ssot_synced_objects_total") and 'action="create"' in line
+        for line in text.splitlines()
+    )
+    assert all(
+        line.split()[2].startswith("nautobot_panorama_ssot") for line in text.splitlines() if line.startswith("# TYPE")
+    )
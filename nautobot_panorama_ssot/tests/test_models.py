@@ -0,0 +1,160 @@
+"""Tests for the compact DiffSync models"""
+
+import gc
+import json
+import tracemalloc
+import types
+from typing import List, Optional
+
+from diffsync import Adapter, DiffSyncModel
+
+from nautobot_panorama_ssot.diffsync.models.base import AddressModel, RuleModel
+from nautobot_panorama_ssot.utils.benchmark import simulated_panorama_adapter
+from nautobot_panorama_ssot.utils.simulator import PanoramaSimulator
+from nautobot_panorama_ssot.utils.symbols import SymbolTable, use_symbol_table
+
+
+class LegacyRuleModel(DiffSyncModel):
+    """RuleModel as it was before CompactModel."""
+
+    _modelname = "rule"
+    _identifiers = ("name", "logical_group", "rulebase", "scope")
+    _attributes = RuleModel._attributes
+
+    name: str
+    logical_group: str
+    rulebase: str
+
+    description: Optional[str] = None
+    source_zones: List[str] = []
+    destination_zones: List[str] = []
+    sources: List[str] = []
+    destinations: List[str] = []
+    services: List[str] = []
+    action: str = "allow"
+    disabled: bool = False
+    position: int = 0
+    tags: List[str] = []
+    scope: str
+
+
+def rule_payload(count):
+    """JSON as Panorama returns it: every record gets fresh string objects."""
+    return json.dumps([
+        {
+            "name": f"rule-{i}",
+            "logical_group": "dg-0001",
+            "rulebase": "pre",
+            "scope": "device-group",
+            "source_zones": ["trust"],
+            "destination_zones": ["untrust"],
+            "sources": [f"addr-{j}" for j in range(i % 50, i % 50 + 8)],
+            "destinations": [f"addr-{j}" for j in range(i % 40, i % 40 + 8)],
+            "services": ["svc-http", "svc-https", "svc-dns"],
+            "tags": ["managed", "prod"],
+            "position": i,
+        }
+        for i in range(count)
+    ])
+
+
+def bytes_per_record(model_class, count=2000):
+    """Size of a record once stored in an adapter, as loads leave it."""
+    payload = rule_payload(count)
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        adapter = Adapter()
+        for data in json.loads(payload):
+            adapter.add(model_class(**data))
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert adapter.count("rule") == count
+    return size / count
+
+
+def test_compact_records_use_at_most_half_the_memory():
+    assert bytes_per_record(RuleModel) <= 0.5 * bytes_per_record(LegacyRuleModel)
+
+
+def test_fields_set_is_copied_before_assignment():
+    first = RuleModel(name="r1", logical_group="dg-1", rulebase="pre", scope="device-group")
+    second = RuleModel(name="r2", logical_group="dg-1", rulebase="pre", scope="device-group")
+    assert first.model_fields_set is second.model_fields_set
+
+    first.description = "changed"
+
+    assert "description" in first.model_fields_set
+    assert "description" not in second.model_fields_set
+
+
+def test_adding_to_an_adapter_keeps_the_fields_set_shared():
+    adapter = Adapter()
+    first = RuleModel(name="r1", logical_group="dg-1", rulebase="pre", scope="device-group")
+    second = RuleModel(name="r2", logical_group="dg-1", rulebase="pre", scope="device-group")
+
+    adapter.add(first)
+    adapter.add(second)
+
+    assert first.adapter is adapter
+    assert first.model_fields_set is second.model_fields_set
+    assert "adapter" not in first.model_fields_set
+
+
+def fresh(value):
+    """An equal string that is a different object, as a database row yields."""
+    return "".join(list(value))
+
+
+def test_both_adapters_share_name_strings():
+    dataset = {
+        "device_groups": ["dg-1"],
+        "scopes": {
+            "dg-1": {
+                "Objects/Addresses": [
+                    {"@name": "web-1", "ip-netmask": "10.0.0.1/32", "description": "web", "tag": {"member": ["prod"]}},
+                ],
+            },
+        },
+    }
+
+    with PanoramaSimulator(dataset) as simulator, use_symbol_table(SymbolTable()) as table:
+        panorama = simulated_panorama_adapter(simulator, "pano", symbols=table)
+        panorama.load()
+
+        # Built the way NautobotAdapter builds it, from its own strings
+        nautobot = AddressModel(
+            name=fresh("web-1"),
+            logical_group=table.intern(fresh("dg-1")),
+            scope=fresh("device-group"),
+            value=fresh("10.0.0.1/32"),
+            type=fresh("ip-netmask"),
+            description=fresh("web"),
+            tags=table.intern_all([fresh("prod")]),
+        )
+
+    loaded = panorama.get("address", nautobot.get_unique_id())
+
+    assert loaded.name is nautobot.name
+    assert loaded.logical_group is nautobot.logical_group
+    assert loaded.tags[0] is nautobot.tags[0]
+    assert loaded.value is not nautobot.value
+    assert "10.0.0.1/32" not in table._symbols
+
+
+def test_adapters_keep_the_job_table_while_it_is_empty():
+    from nautobot_panorama_ssot.diffsync.adapters.nautobot import NautobotAdapter
+
+    job = types.SimpleNamespace(symbols=SymbolTable())
+    assert len(job.symbols) == 0
+
+    with PanoramaSimulator({"device_groups": [], "scopes": {}}) as simulator:
+        assert simulated_panorama_adapter(simulator, "pano", symbols=job.symbols).symbols is job.symbols
+    assert NautobotAdapter(job=job, symbols=job.symbols).symbols is job.symbols
+
+    with use_symbol_table(job.symbols):
+        assert NautobotAdapter(job=job).symbols is job.symbols
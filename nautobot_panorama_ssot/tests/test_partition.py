@@ -0,0 +1,53 @@
+"""Tests for the device-group-partitioned diff"""
+
+import pytest
+from diffsync import DiffSync
+
+from nautobot_panorama_ssot.diffsync.models.base import AddressModel, ControlPlaneModel, LogicalGroupModel
+from nautobot_panorama_ssot.utils.partition import PartitionedDiffMixin
+
+
+class Adapter(PartitionedDiffMixin, DiffSync):
+    control_plane = ControlPlaneModel
+    logical_group = LogicalGroupModel
+    address = AddressModel
+
+    top_level = ["control_plane", "logical_group", "address"]
+
+
+def build(name, values):
+    adapter = Adapter(name=name)
+    adapter.add(ControlPlaneModel(name="pano"))
+
+    for dg in ("shared", "DG1", "DG2"):
+        adapter.add(LogicalGroupModel(name=dg, virtual_system="vsys1", scope="device-group"))
+        for i in range(3):
+            value = values.get((dg, i), f"10.0.0.{i}/32")
+            if value is None:
+                continue
+            adapter.add(AddressModel(
+                name=f"a{i}",
+                logical_group=dg,
+                value=value,
+                type="ip-netmask",
+                scope="device-group",
+                tags=["t1"],
+            ))
+
+    return adapter
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_partitioned_diff_matches_serial_diff(workers):
+    source = build("source", {("DG1", 0): "10.9.9.9/32", ("DG2", 1): None})
+    target = build("target", {("shared", 2): None})
+
+    serial = source.diff_to(target).summary()
+
+    source.partitioned_diff = True
+    source.partition_workers = workers
+    progress = []
+    partitioned = source.diff_to(target, callback=lambda *args: progress.append(args))
+
+    assert partitioned.summary() == serial
+    assert progress and progress[-1][0] == "diff"
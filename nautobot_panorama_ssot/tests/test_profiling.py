@@ -0,0 +1,26 @@
+"""Tests for job run profiling"""
+
+import marshal
+
+from nautobot_panorama_ssot.constant import PROFILER_CPROFILE
+from nautobot_panorama_ssot.utils.profiling import RunProfiler
+
+
+def busy():
+    return sum(i * i for i in range(10000))
+
+
+def test_cprofile_sections_are_combined():
+    profiler = RunProfiler(PROFILER_CPROFILE)
+
+    profiled = profiler.wrap(busy)
+    profiled()
+    with profiler.section():
+        profiled()
+
+    files = dict(profiler.artifacts())
+    stats = marshal.loads(files["panorama-sync.pstats"])
+
+    calls = [value[1] for (filename, line, func), value in stats.items() if func == "busy"]
+    assert calls == [2]
+    assert b"busy" in files["panorama-sync.txt"]
@@ -0,0 +1,63 @@
+"""Tests for client flow control"""
+
+from nautobot_panorama_ssot.utils import ratelimit as ratelimit_module
+from nautobot_panorama_ssot.utils.ratelimit import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def use_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit_module.time, "monotonic", clock)
+    return clock
+
+
+def test_aimd_halves_on_overload_and_grows_back(monkeypatch):
+    clock = use_clock(monkeypatch)
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, latency_target=1.0)
+
+    limiter.record(0.1, 503)
+    assert limiter.current_limit == 4
+
+    clock.now += 5
+    limiter.record(2.0, 200)
+    assert limiter.current_limit == 2
+
+    for _ in range(20):
+        limiter.record(0.1, 200)
+    assert 2 < limiter.current_limit <= 8
+
+
+def test_aimd_halves_once_per_round_trip(monkeypatch):
+    clock = use_clock(monkeypatch)
+    limiter = AdaptiveConcurrencyLimiter(max_limit=64)
+
+    # A burst of 429s for requests that were all in flight together
+    for _ in range(10):
+        limiter.record(0.5, 429)
+        clock.now += 0.01
+    assert limiter.current_limit == 32
+    assert limiter.decreases == 1
+
+    # A request sent after that decrease can cut the limit again
+    clock.now += 1
+    limiter.record(0.5, 429)
+    assert limiter.current_limit == 16
+
+
+def test_aimd_respects_floor(monkeypatch):
+    clock = use_clock(monkeypatch)
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=2)
+
+    for _ in range(10):
+        limiter.record(0.1, 429)
+        clock.now += 1
+
+    assert limiter.current_limit == 2
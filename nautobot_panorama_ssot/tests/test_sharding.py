@@ -0,0 +1,22 @@
+"""Tests for device-group sharding"""
+
+from types import SimpleNamespace
+
+from nautobot.extras.choices import JobResultStatusChoices
+
+from nautobot_panorama_ssot.utils.sharding import plan_shards, shard_status
+
+
+def test_shared_scope_is_its_own_first_shard():
+    shards = plan_shards(["dg-3", "shared", "dg-1", "dg-2"], shard_size=2)
+
+    assert shards == [["shared"], ["dg-1", "dg-2"], ["dg-3"]]
+
+
+def test_shard_status():
+    ok = SimpleNamespace(status=JobResultStatusChoices.STATUS_SUCCESS)
+    failed = SimpleNamespace(status=JobResultStatusChoices.STATUS_FAILURE)
+
+    assert shard_status([ok, ok]) == "success"
+    assert shard_status([ok, failed]) == "partial"
+    assert shard_status([failed]) == "failed"
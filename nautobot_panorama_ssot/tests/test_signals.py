@@ -0,0 +1,81 @@
+"""Tests for the database-ready bootstrap"""
+
+import contextlib
+
+from nautobot_panorama_ssot import signals as signals_module
+
+
+class FakeQuerySet:
+
+    def __init__(self, manager, filters):
+        self.manager = manager
+        self.filters = filters
+
+    def exists(self):
+        self.manager.queries += 1
+        return any(all(row.get(k) == v for k, v in self.filters.items()) for row in self.manager.rows)
+
+
+class FakeManager:
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.queries = 0
+
+    def filter(self, **filters):
+        return FakeQuerySet(self, filters)
+
+    def exists(self):
+        self.queries += 1
+        return bool(self.rows)
+
+    def get_or_create(self, **fields):
+        self.queries += 1
+        self.rows.append(fields)
+        return fields, True
+
+
+class FakeApps:
+
+    def __init__(self, **managers):
+        self.managers = managers
+        self.requested = []
+
+    def get_model(self, app_label, model_name):
+        self.requested.append(model_name)
+        return type(model_name, (), {"objects": self.managers[model_name]})
+
+
+def run_bootstrap(monkeypatch, markers, configs=()):
+    calls = []
+    monkeypatch.setattr(signals_module.transaction, "atomic", contextlib.nullcontext)
+    monkeypatch.setattr(signals_module, "_ensure_sync_tag", lambda apps: calls.append("tag"))
+    monkeypatch.setattr(signals_module, "_create_default_config", lambda apps: calls.append("config"))
+
+    apps = FakeApps(
+        PanoramaBootstrapMarker=FakeManager(markers),
+        SSOTPanoramaConfig=FakeManager(configs),
+    )
+    signals_module.nautobot_database_ready_callback(sender=None, apps=apps)
+    return apps, calls
+
+
+def test_marker_short_circuits_to_one_query(monkeypatch):
+    apps, calls = run_bootstrap(monkeypatch, [{"version": signals_module.BOOTSTRAP_VERSION}])
+
+    assert calls == []
+    assert apps.requested == ["PanoramaBootstrapMarker"]
+    assert apps.managers["PanoramaBootstrapMarker"].queries == 1
+
+
+def test_bumped_version_reruns_bootstrap(monkeypatch):
+    monkeypatch.setattr(signals_module, "BOOTSTRAP_VERSION", "2")
+
+    apps, calls = run_bootstrap(monkeypatch, [{"version": "1"}], configs=[{"name": "existing"}])
+
+    assert calls == ["tag"]
+    assert {"version": "2"} in apps.managers["PanoramaBootstrapMarker"].rows
+
+    # The next start finds the new marker
+    apps, calls = run_bootstrap(monkeypatch, apps.managers["PanoramaBootstrapMarker"].rows)
+    assert calls == []
@@ -0,0 +1,167 @@
+"""Tests for the local Panorama simulator"""
+
+import types
+
+import pytest
+
+from nautobot_panorama_ssot.diffsync.models.base import AddressModel
+from nautobot_panorama_ssot.utils import async_client as async_client_module
+from nautobot_panorama_ssot.utils.async_client import AsyncPanoramaClient, run_sync
+from nautobot_panorama_ssot.utils.benchmark import simulated_panorama_adapter
+from nautobot_panorama_ssot.utils.client import PanoramaClient
+from nautobot_panorama_ssot.utils.simulator import PanoramaSimulator
+
+DATASET = {
+    "device_groups": ["dg-1"],
+    "scopes": {
+        "dg-1": {
+            "Objects/Addresses": [{"@name": "web-1", "ip-netmask": "10.0.0.1/32"}],
+            "Policies/SecurityPreRules": [{"@name": "allow-web"}, {"@name": "deny-all"}],
+        },
+    },
+}
+
+
+@pytest.fixture
+def simulator():
+    with PanoramaSimulator(DATASET, commit_duration=0, validate_duration=0) as sim:
+        yield sim
+
+
+@pytest.fixture
+def client(simulator):
+    return PanoramaClient(simulator.base_url, simulator.api_key, verify_ssl=False)
+
+
+def test_load_and_reorder(client, simulator):
+    assert [a["name"] for a in client.get_address_objects("dg-1")] == ["web-1"]
+
+    client.move_rule_by_position("deny-all", "dg-1", "pre", 0)
+
+    assert client.get_rule_order("dg-1", "pre") == ["deny-all", "allow-web"]
+    assert simulator.total_requests == 3
+
+
+def test_commit_job_completes(client):
+    assert client.commit_device_group("dg-1")
+    assert client.validate_device_group("dg-1") is True
+
+
+def test_hit_counts_resolve_shared_location():
+    dataset = dict(DATASET, hit_counts={
+        "shared": [{"rule-name": "global", "hit-count": 3}],
+        "dg-1": [{"rule-name": "allow-web", "hit-count": 5}],
+    })
+
+    with PanoramaSimulator(dataset) as simulator:
+        client = PanoramaClient(simulator.base_url, simulator.api_key, verify_ssl=False)
+
+        assert client.get_rule_hit_counts("shared") == [{"rule-name": "global", "hit-count": 3}]
+        assert client.get_rule_hit_counts("dg-1") == [{"rule-name": "allow-web", "hit-count": 5}]
+
+
+def test_async_commit_returns_job_ids(simulator):
+    async_client = AsyncPanoramaClient(simulator.base_url, simulator.api_key, verify_ssl=False)
+
+    async def commit():
+        async with async_client:
+            return await async_client.commit_all(["dg-1", "shared"])
+
+    job_ids = run_sync(commit())
+
+    assert len(set(job_ids)) == 2
+    assert all(simulator.state.job_status(job_id)["result"] == "OK" for job_id in job_ids)
+
+
+def test_adapter_writes_go_through_the_async_queue(simulator, client):
+    async_client = AsyncPanoramaClient(simulator.base_url, simulator.api_key, verify_ssl=False)
+    adapter = simulated_panorama_adapter(simulator, "pano", async_client=async_client)
+    adapter.load()
+
+    web = adapter.get("address", {"name": "web-1", "logical_group": "dg-1", "scope": "device-group"})
+    adapter.create_address(AddressModel(
+        name="web-2", logical_group="dg-1", value="10.0.0.2/32", type="ip-netmask", scope="device-group",
+    ))
+    adapter.delete_address(web)
+
+    # Nothing is sent until finalize drains the queue
+    assert [a["name"] for a in client.get_address_objects("dg-1")] == ["web-1"]
+
+    adapter._run_async(async_client.execute_batch)
+
+    assert [a["name"] for a in client.get_address_objects("dg-1")] == ["web-2"]
+    assert adapter.touched_device_groups == {"dg-1"}
+
+
+def test_async_client_reports_each_request_to_the_observer(simulator):
+    seen = []
+    async_client = AsyncPanoramaClient(simulator.base_url, simulator.api_key, verify_ssl=False)
+    async_client.observer = types.SimpleNamespace(
+        record_request=lambda endpoint, latency, status: seen.append((endpoint, status)),
+    )
+
+    async def fetch():
+        async with async_client:
+            await async_client.get_address_objects("dg-1")
+            await async_client.get_config_version()
+
+    run_sync(fetch())
+
+    assert sorted(seen) == [("Objects/Addresses", 200), ("api", 200), ("api", 200)]
+
+
+def test_async_client_exports_request_and_commit_metrics(simulator, monkeypatch):
+    requests, commits = [], []
+    monkeypatch.setattr(async_client_module.metrics, "observe_request", lambda *args: requests.append(args[:2]))
+    monkeypatch.setattr(async_client_module.metrics, "observe_commit", lambda *args: commits.append(args[:2]))
+    async_client = AsyncPanoramaClient(simulator.base_url, simulator.api_key, verify_ssl=False)
+
+    async def commit():
+        async with async_client:
+            return await async_client.commit_device_group("dg-1")
+
+    run_sync(commit())
+
+    assert async_client.metrics_label == "127.0.0.1"
+    assert ("127.0.0.1", "Commit") in requests
+    assert commits == [("127.0.0.1", "dg-1")]
+
+
+def test_async_client_retries_and_rate_limits():
+    with PanoramaSimulator(DATASET, error_rate=0.5, seed=1) as simulator:
+        async_client = AsyncPanoramaClient(
+            simulator.base_url,
+            simulator.api_key,
+            verify_ssl=False,
+            rate_limit=1000,
+            max_retries=10,
+            backoff_factor=0,
+        )
+
+        async def fetch():
+            async with async_client:
+                return await async_client.gather([async_client.get_address_objects("dg-1") for _ in range(5)])
+
+        results = run_sync(fetch())
+
+    assert all([a["name"] for a in addresses] == ["web-1"] for addresses in results)
+    assert async_client.retry_stats["retries"] > 0
+    assert async_client.rate_limiter is not None
+
+
+def test_config_version_tracks_commits(client):
+    assert client.get_config_version() is None
+
+    client.commit_device_group("dg-1")
+    committed = client.get_config_version()
+    assert committed
+
+    client._request(
+        "DELETE",
+        "Objects/Addresses/web-1",
+        params=client.resolve_location("dg-1"),
+    )
+    assert client.get_config_version() is None
+
+    client.commit_device_group("dg-1")
+    assert client.get_config_version() not in (None, committed)
@@ -0,0 +1,98 @@
+"""Tests for unchanged device group reuse"""
+
+import json
+import types
+
+import pytest
+
+from nautobot_panorama_ssot.diffsync.adapters import panorama as panorama_module
+from nautobot_panorama_ssot.utils.benchmark import simulated_panorama_adapter
+from nautobot_panorama_ssot.utils.datagen import dataset_size, generate_dataset
+from nautobot_panorama_ssot.utils.fingerprint import FingerprintIndex
+from nautobot_panorama_ssot.utils.simulator import PanoramaSimulator
+
+
+@pytest.fixture
+def simulator():
+    dataset = generate_dataset(device_groups=2, objects_per_dg=20, rules_per_rulebase=3)
+    with PanoramaSimulator(dataset, commit_duration=0, validate_duration=0) as sim:
+        sim.dataset = dataset
+        yield sim
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    """
+    In-memory stand-in for PanoramaDeviceGroupState rows.
+    """
+    states = {}
+
+    def save(control_plane, versions, snapshot, keep=None):
+        for dg, records in snapshot.items():
+            states[dg] = types.SimpleNamespace(
+                config_version=versions[dg],
+                records=json.loads(json.dumps(records)),
+            )
+
+    monkeypatch.setattr(panorama_module, "load_device_group_states", lambda control_plane: dict(states))
+    monkeypatch.setattr(panorama_module, "save_device_group_states", save)
+    return states
+
+
+def load(simulator):
+    adapter = simulated_panorama_adapter(simulator, "state-test", skip_unchanged_device_groups=True)
+    adapter.load()
+    return adapter
+
+
+def loaded_objects(adapter):
+    return sum(
+        len(adapter.get_all(model_type))
+        for model_type in adapter.top_level
+        if model_type not in ("control_plane", "logical_group")
+    )
+
+
+def address_fetches(simulator):
+    return sum(
+        count
+        for (method, route), count in simulator.request_counts.items()
+        if method == "GET" and route.endswith("Objects/Addresses")
+    )
+
+
+def test_prune_then_save_then_restore_keeps_every_object(simulator, stored):
+    first = load(simulator)
+    unchanged = {
+        ("address", address.logical_group): {address.name}
+        for address in first.get_all("address")
+    }
+    assert FingerprintIndex.prune(first, unchanged) > 0
+    first.save_device_group_state()
+
+    fetched = address_fetches(simulator)
+    second = load(simulator)
+
+    assert address_fetches(simulator) == fetched
+    assert loaded_objects(second) == dataset_size(simulator.dataset)
+
+
+def test_only_changed_device_groups_reload(simulator, stored):
+    client = simulated_panorama_adapter(simulator, "state-test").client
+    load(simulator).save_device_group_state()
+
+    # A commit changes no device group's config
+    client.commit_device_group("dg-0001")
+    fetched = address_fetches(simulator)
+    load(simulator).save_device_group_state()
+    assert address_fetches(simulator) == fetched
+
+    client._request(
+        "DELETE",
+        f"Objects/Addresses/{simulator.dataset['scopes']['dg-0001']['Objects/Addresses'][0]['@name']}",
+        params=client.resolve_location("dg-0001"),
+    )
+    adapter = load(simulator)
+    assert address_fetches(simulator) == fetched + 1
+    assert adapter._reloaded_device_groups == {"dg-0001"}
+    assert loaded_objects(adapter) == dataset_size(simulator.dataset) - 1
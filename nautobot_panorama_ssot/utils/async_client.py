@@ -0,0 +1,549 @@
+"""
+Asyncio Panorama REST Client
+
+Same method surface as PanoramaClient, built on a pooled httpx.AsyncClient
+so hundreds of requests can be in flight on a single thread. Requests go
+through the same rate limit and retry policy as PanoramaClient. Use
+`run_sync` to drive it from synchronous code such as adapter loads or
+batch execution inside a job.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_ASYNC_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_BACKOFF_MAX,
+    IDEMPOTENT_METHODS,
+    PANORAMA_API_PATH,
+    RETRYABLE_STATUS_CODES,
+)
+from nautobot_panorama_ssot.utils.client import (
+    OBJECT_PATHS,
+    PENDING_CHANGES_CMD,
+    SHOW_JOBS_CMD,
+    PanoramaClientError,
+    _retry_after,
+    config_digest,
+    config_version_from,
+    decode_json,
+    device_group_xpath,
+    endpoint_name,
+    extract_entries,
+    rulebase_path,
+)
+from nautobot_panorama_ssot.utils import metrics
+from nautobot_panorama_ssot.utils.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    """
+    return asyncio.run(coro)
+
+
+class AsyncPanoramaClient:
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        api_version: str = "11.1",
+        verify_ssl: bool = True,
+        timeout: int = 30,
+        max_concurrency: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+    ):
+        if httpx is None:
+            raise ImportError("AsyncPanoramaClient requires the 'httpx' package")
+
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.api_version = api_version
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency or DEFAULT_ASYNC_CONCURRENCY
+
+        # Flow control and retries as in PanoramaClient
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_stats = Counter()
+
+        # Optional per-request hook: observer.record_request(endpoint, latency, status)
+        self.observer = None
+        self.metrics_label = urlparse(self.base_url).hostname or self.base_url
+
+        self._client = None
+        self._semaphore = None
+        self._batch = []
+
+    # ===========================================================
+    # Session Lifecycle
+    # ===========================================================
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def open(self):
+
+        if self._client is not None:
+            return
+
+        self._client = httpx.AsyncClient(
+            verify=self.verify_ssl,
+            timeout=self.timeout,
+            headers={
+                "X-PAN-KEY": self.api_key,
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        # Bound to the running loop, so created here rather than in __init__
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+
+        if self._client is not None:
+            await self._client.aclose()
+
+        self._client = None
+        self._semaphore = None
+
+    # ===========================================================
+    # REST Core
+    # ===========================================================
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}/restapi/v{self.api_version}/{path.lstrip('/')}"
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(DEFAULT_RETRY_BACKOFF_MAX, self.backoff_factor * 2 ** attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def _send(self, method: str, url: str, applied_check=None, endpoint=None, **kwargs):
+        """
+        Send one HTTP call, retrying transient failures with the policy
+        of PanoramaClient._send. `applied_check` is a coroutine function.
+        """
+        await self.open()
+        method = method.upper()
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+
+        while True:
+
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+
+            self.retry_stats["requests"] += 1
+            response = None
+            error = None
+
+            async with self._semaphore:
+                start = time.monotonic()
+                try:
+                    response = await self._client.request(method, url, **kwargs)
+                except (httpx.ConnectError, httpx.TimeoutException) as exc:
+                    error = exc
+                latency = time.monotonic() - start
+                status = response.status_code if response is not None else None
+
+            metrics.observe_request(self.metrics_label, endpoint or url, latency)
+            if self.observer:
+                self.observer.record_request(endpoint or url, latency, status)
+
+            if response is not None:
+
+                # A retried DELETE may find the first attempt already removed it
+                if attempt and method == "DELETE" and response.status_code == 404:
+                    self.retry_stats["writes_already_applied"] += 1
+                    return None
+
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+
+                unsent = response.status_code == 429
+                delay = _retry_after(response)
+
+            else:
+                unsent = isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+                delay = None
+
+            if attempt >= self.max_retries:
+                self.retry_stats["retries_exhausted"] += 1
+                if error is not None:
+                    raise error
+                return response
+
+            if not (idempotent or unsent):
+                if applied_check is None:
+                    self.retry_stats["write_retries_refused"] += 1
+                    logger.warning("Not retrying %s %s: outcome unknown", method, url)
+                    if error is not None:
+                        raise error
+                    return response
+                if await applied_check():
+                    self.retry_stats["writes_already_applied"] += 1
+                    return None
+
+            attempt += 1
+            self.retry_stats["retries"] += 1
+
+            delay = self._backoff(attempt - 1) if delay is None else delay
+            logger.info(
+                "Retrying %s %s in %.1fs (attempt %s/%s): %s",
+                method,
+                url,
+                delay,
+                attempt,
+                self.max_retries,
+                error or response.status_code,
+            )
+            await asyncio.sleep(delay)
+
+    async def _request(self, method: str, path: str, applied_check=None, **kwargs):
+
+        url = self._url(path)
+
+        response = await self._send(
+            method,
+            url,
+            applied_check=applied_check,
+            endpoint=endpoint_name(path),
+            **kwargs,
+        )
+
+        if response is None:
+            return {}
+
+        if response.status_code not in (200, 201):
+            raise PanoramaClientError(
+                f"{method} {url} -> {response.status_code}: {response.text}"
+            )
+
+        return decode_json(response.content)
+
+    async def _xml_request(self, params: Dict[str, Any]) -> bytes:
+
+        url = f"{self.base_url}{PANORAMA_API_PATH}"
+
+        response = await self._send("GET", url, endpoint="api", params=params)
+
+        if response.status_code != 200:
+            raise PanoramaClientError(
+                f"GET {url} -> {response.status_code}: {response.text}"
+            )
+
+        return response.content
+
+    async def gather(self, calls):
+        """
+        Await many coroutines concurrently, preserving order.
+        """
+        return await asyncio.gather(*calls)
+
+    # ===========================================================
+    # Load Operations
+    # ===========================================================
+
+    async def _list(self, path: str, device_group: str) -> List[Dict[str, Any]]:
+        return extract_entries(
+            await self._request("GET", path, params=self.resolve_location(device_group))
+        )
+
+    async def get_device_groups(self):
+        return extract_entries(
+            await self._request("GET", "Panorama/DeviceGroups", params={"location": "panorama"})
+        )
+
+    async def get_tags(self, device_group):
+        return await self._list(OBJECT_PATHS["tags"], device_group)
+
+    async def get_address_objects(self, device_group):
+        return await self._list(OBJECT_PATHS["addresses"], device_group)
+
+    async def get_address_groups(self, device_group):
+        return await self._list(OBJECT_PATHS["address_groups"], device_group)
+
+    async def get_service_objects(self, device_group):
+        return await self._list(OBJECT_PATHS["services"], device_group)
+
+    async def get_service_groups(self, device_group):
+        return await self._list(OBJECT_PATHS["service_groups"], device_group)
+
+    async def get_application_objects(self, device_group):
+        return await self._list(OBJECT_PATHS["applications"], device_group)
+
+    async def get_application_groups(self, device_group):
+        return await self._list(OBJECT_PATHS["application_groups"], device_group)
+
+    async def get_security_rules(self, device_group, rulebase="pre"):
+        return await self._list(rulebase_path("Security", rulebase), device_group)
+
+    async def get_nat_rules(self, device_group, rulebase="pre"):
+        return await self._list(rulebase_path("Nat", rulebase), device_group)
+
+    # ===========================================================
+    # Config Versions
+    # ===========================================================
+
+    async def _op(self, cmd: str) -> bytes:
+        return await self._xml_request({"type": "op", "cmd": cmd})
+
+    async def get_config_version(self) -> Optional[str]:
+
+        pending_changes, jobs = await asyncio.gather(
+            self._op(PENDING_CHANGES_CMD),
+            self._op(SHOW_JOBS_CMD),
+        )
+
+        return config_version_from(pending_changes, jobs)
+
+    async def get_device_group_version(self, device_group: str) -> str:
+
+        return config_digest(await self._xml_request({
+            "type": "config",
+            "action": "get",
+            "xpath": device_group_xpath(device_group),
+        }))
+
+    # ===========================================================
+    # Batch Execution
+    # ===========================================================
+
+    def queue(self, func, *args, **kwargs):
+        self._batch.append((func, args, kwargs))
+
+    def barrier(self):
+        """
+        Writes queued after this start only once earlier ones finished,
+        e.g. group members before the group.
+        """
+        if self._batch and self._batch[-1] is not None:
+            self._batch.append(None)
+
+    async def execute_batch(self, chunk_size=500):
+
+        while self._batch:
+            head = self._batch[:chunk_size]
+            end = head.index(None) if None in head else len(head)
+            chunk = head[:end]
+            # Drop the barrier itself along with the chunk before it
+            self._batch = self._batch[end + (end < len(head)):]
+
+            await asyncio.gather(*(
+                func(*args, **kwargs) for func, args, kwargs in chunk
+            ))
+
+    # ===========================================================
+    # Cross-Scope Resolution
+    # ===========================================================
+
+    def resolve_location(self, logical_group: str) -> Dict[str, str]:
+
+        if logical_group == "shared":
+            return {"location": "shared"}
+
+        return {
+            "location": "device-group",
+            "device-group": logical_group,
+        }
+
+    async def resolve_write_scope(self, object_type: str, model):
+
+        exists = await self.object_exists(object_type, model.name, model.logical_group)
+
+        if exists == "shared":
+            logger.info(f"{model.name} exists in shared — reusing shared scope")
+            return {"location": "shared"}
+
+        return self.resolve_location(model.logical_group)
+
+    # ===========================================================
+    # Reference Check
+    # ===========================================================
+
+    async def is_object_in_use(self, model):
+        return False
+
+    async def object_exists(self, object_type: str, name: str, logical_group: str) -> Optional[str]:
+
+        path = f"Objects/{object_type}/{name}"
+
+        try:
+            await self._request("GET", path, params=self.resolve_location(logical_group))
+            return "device-group"
+        except Exception:
+            pass
+
+        try:
+            await self._request("GET", path, params={"location": "shared"})
+            return "shared"
+        except Exception:
+            pass
+
+        return None
+
+    # ===========================================================
+    # CRUD Example (Address)
+    # ===========================================================
+
+    async def create_address(self, model, scope):
+
+        path = "Objects/Addresses"
+        payload = {
+            "entry": {
+                "@name": model.name,
+                model.type: model.value,
+                "description": model.description,
+            }
+        }
+
+        async def applied():
+            try:
+                await self._request("GET", f"{path}/{model.name}", params=scope)
+                return True
+            except PanoramaClientError:
+                return False
+
+        await self._request("POST", path, params=scope, json=payload, applied_check=applied)
+
+    async def update_address(self, model, diffs):
+
+        scope = self.resolve_location(model.logical_group)
+        path = f"Objects/Addresses/{model.name}"
+
+        await self._request("PUT", path, params=scope, json={"entry": diffs})
+
+    async def delete_address(self, model):
+
+        scope = self.resolve_location(model.logical_group)
+        await self._request("DELETE", f"Objects/Addresses/{model.name}", params=scope)
+
+    # ===========================================================
+    # Rule Ordering
+    # ===========================================================
+
+    async def get_rule_order(self, logical_group, rulebase):
+
+        rules = await self.get_security_rules(logical_group, rulebase)
+        return [r.get("@name") for r in rules]
+
+    async def move_rule_by_position(self, rule_name, logical_group, rulebase, position):
+
+        path = f"{rulebase_path('Security', rulebase)}/{rule_name}:move"
+        payload = {"where": "before", "destination": position}
+
+        scope = self.resolve_location(logical_group)
+        await self._request("POST", path, params=scope, json=payload)
+
+    # ===========================================================
+    # Commit
+    # ===========================================================
+
+    async def commit_device_group(self, device_group):
+
+        start = time.monotonic()
+
+        response = await self._request(
+            "POST",
+            "Commit",
+            json={"device-group": device_group}
+        )
+
+        job_id = response.get("job")
+
+        if job_id:
+            await self._wait_for_job(job_id)
+
+        metrics.observe_commit(self.metrics_label, device_group, time.monotonic() - start)
+
+        return job_id
+
+    async def commit_all(self, device_groups):
+        return await asyncio.gather(*(self.commit_device_group(dg) for dg in device_groups))
+
+    async def snapshot_config(self, device_group):
+        return await self._request("GET", f"Config/Snapshot/{device_group}")
+
+    async def rollback_config(self, snapshot):
+        await self._request("POST", "Config/Rollback", json=snapshot)
+
+    async def _wait_for_job(self, job_id, timeout=600, interval=5):
+
+        start = time.time()
+
+        while time.time() - start < timeout:
+
+            result = await self._request("GET", f"Jobs/{job_id}")
+
+            if result.get("status") == "FIN":
+                if result.get("result") != "OK":
+                    raise PanoramaClientError(f"Commit failed: {result}")
+                return
+
+            await asyncio.sleep(interval)
+
+        raise PanoramaClientError("Commit job timeout")
+
+    async def validate_device_group(self, device_group):
+
+        response = await self._request(
+            "POST",
+            "Commit/Validate",
+            json={"device-group": device_group}
+        )
+
+        job_id = response.get("job")
+
+        if not job_id:
+            return False
+
+        start = time.time()
+
+        while time.time() - start < 600:
+
+            result = await self._request("GET", f"Jobs/{job_id}")
+
+            if result.get("status") == "FIN":
+                return result.get("result") == "OK"
+
+            await asyncio.sleep(5)
+
+        raise PanoramaClientError("Validation job timeout")
+
+    async def get_rule_hit_counts(self, device_group):
+
+        response = await self._request(
+            "GET",
+            "Policies/HitCount",
+            params=self.resolve_location(device_group)
+        )
+
+        return response.get("result", [])
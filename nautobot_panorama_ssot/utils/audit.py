@@ -0,0 +1,216 @@
+"""
+Streaming drift audit.
+
+DriftAudit buffers records and flushes them in batches to one or more
+sinks, so a drift-only run over a large estate keeps memory flat and
+everything flushed so far survives a crashed job. Only running
+aggregates and a short tail of recent records stay in memory.
+
+JsonLinesSink appends each batch to a JSON-lines file (gzip-compressed
+when the path ends in .gz), which the sync job attaches to its result.
+DriftRecordSink bulk-inserts each batch as PanoramaDriftRecord rows.
+"""
+
+import datetime
+import gzip
+import json
+import os
+import tempfile
+from collections import Counter, deque
+
+from django.conf import settings
+from django.utils.text import slugify
+
+from nautobot_panorama_ssot.constant import DEFAULT_AUDIT_BATCH_SIZE, DEFAULT_AUDIT_TAIL
+from nautobot_panorama_ssot.models import PanoramaDriftRecord
+
+
+def get_audit_dir():
+    config = settings.PLUGINS_CONFIG.get("nautobot_panorama_ssot", {})
+    return config.get("drift_audit_dir") or os.path.join(
+        tempfile.gettempdir(), "nautobot_panorama_ssot", "audit"
+    )
+
+
+def audit_path(control_plane_name, run_id):
+    """
+    Location of a run's JSON-lines audit file.
+    """
+    return os.path.join(get_audit_dir(), f"{slugify(control_plane_name)}-{run_id}.jsonl.gz")
+
+
+# ===========================================================
+# Sinks
+# ===========================================================
+
+class JsonLinesSink:
+    """
+    Append-only JSON-lines file. Every batch is flushed to disk, so a
+    file left behind by a crashed run is readable up to its last batch.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        if path.endswith(".gz"):
+            self._handle = gzip.open(path, "at", encoding="utf-8")
+        else:
+            self._handle = open(path, "a", encoding="utf-8")
+
+    def write(self, records):
+        for record in records:
+            self._handle.write(json.dumps(record, default=str, separators=(",", ":")))
+            self._handle.write("\n")
+        self._handle.flush()
+
+    def close(self):
+        if not self._handle.closed:
+            self._handle.close()
+
+    def read(self):
+        """
+        Iterate over the records written so far.
+        """
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class DriftRecordSink:
+    """
+    PanoramaDriftRecord rows for one control plane and run.
+    """
+
+    def __init__(self, control_plane_name, run):
+        self.control_plane = control_plane_name
+        self.run = run
+        self.written = 0
+
+    def _row(self, record):
+        recorded = datetime.datetime.fromisoformat(record["timestamp"])
+        if recorded.tzinfo is None:
+            recorded = recorded.replace(tzinfo=datetime.timezone.utc)
+
+        return PanoramaDriftRecord(
+            control_plane=self.control_plane,
+            logical_group=record["scope"] or "",
+            object_type=record["type"],
+            name=record["name"],
+            action=record["action"],
+            run=self.run,
+            recorded=recorded,
+            extra=record.get("extra") or {},
+        )
+
+    def write(self, records):
+        PanoramaDriftRecord.objects.bulk_create([self._row(record) for record in records], batch_size=1000)
+        self.written += len(records)
+
+    def close(self):
+        pass
+
+
+# ===========================================================
+# Audit
+# ===========================================================
+
+class DriftAudit:
+
+    def __init__(self, sinks=(), batch_size=DEFAULT_AUDIT_BATCH_SIZE, tail=DEFAULT_AUDIT_TAIL):
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.rule_impacts = {}
+
+        self.total = 0
+        self.by_action = Counter()
+        self.by_type = Counter()
+        self.by_scope = Counter()
+
+        self._buffer = []
+        self._tail = deque(maxlen=tail)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    def record(self, action, object_type, name, scope, extra=None):
+
+        entry = {
+            "action": action,
+            "type": object_type,
+            "name": name,
+            "scope": scope,
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+        }
+        if extra:
+            entry["extra"] = extra
+
+        self.total += 1
+        self.by_action[action] += 1
+        self.by_type[(action, object_type)] += 1
+        self.by_scope[scope] += 1
+
+        self._tail.append(entry)
+
+        if self.sinks:
+            self._buffer.append(entry)
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+
+    def record_rule_impact(self, rule_name, object_name):
+        self.rule_impacts.setdefault(rule_name, []).append(object_name)
+
+    # -----------------------------------------------------------
+    # Sinks
+    # -----------------------------------------------------------
+
+    def flush(self):
+
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        for sink in self.sinks:
+            sink.write(batch)
+
+    def close(self):
+        """
+        Flush what is buffered and close every sink. Safe to call twice.
+        """
+        try:
+            self.flush()
+        finally:
+            for sink in self.sinks:
+                sink.close()
+
+    # -----------------------------------------------------------
+    # Results
+    # -----------------------------------------------------------
+
+    def summary(self):
+        return Counter(self.by_action)
+
+    def detailed_summary(self):
+        return {
+            "total": self.total,
+            "actions": dict(self.by_action),
+            "types": {f"{action}:{object_type}": count for (action, object_type), count in self.by_type.items()},
+            "scopes": dict(self.by_scope),
+        }
+
+    @property
+    def operations(self):
+        """
+        The most recent records; the full history is in the sinks.
+        """
+        return list(self._tail)
+
+    def export(self):
+        return self.operations
+
+    def log_summary(self, logger, top=10):
+        logger.info("Drift audit: %s records %s", self.total, dict(self.by_action))
+        for scope, count in self.by_scope.most_common(top):
+            logger.info("  drift %s: %s", scope, count)
@@ -0,0 +1,286 @@
+"""
+End-to-end sync benchmarks.
+
+Runs the load -> diff -> sync -> finalize pipeline against a generated
+dataset served by PanoramaSimulator, and records per phase:
+
+- wall time
+- HTTP requests received by the simulators
+- peak process RSS
+
+Both sides of the run are PanoramaAdapters: the full dataset is synced
+into a simulated Panorama missing some addresses. NautobotAdapter loads
+and writes are not part of the suite, so no database is needed.
+
+Results are plain JSON so they can be kept as baselines and compared on
+later runs; `compare_to_baseline` reports every metric that regressed
+beyond a threshold.
+"""
+
+import copy
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import threading
+import time
+import types
+from contextlib import ExitStack, contextmanager
+
+from nautobot_panorama_ssot.diffsync.adapters.panorama import PanoramaAdapter
+from nautobot_panorama_ssot.utils.client import OBJECT_PATHS
+from nautobot_panorama_ssot.utils.datagen import dataset_size, generate_dataset
+from nautobot_panorama_ssot.utils.simulator import SHARED_SCOPE, PanoramaSimulator
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_PROFILES = {
+    "small": {"device_groups": 5, "objects_per_dg": 200, "rules_per_rulebase": 20},
+    "medium": {"device_groups": 25, "objects_per_dg": 2000, "rules_per_rulebase": 100},
+    "large": {"device_groups": 100, "objects_per_dg": 10000, "rules_per_rulebase": 250},
+}
+
+METRICS = ("wall_s", "http_requests", "peak_rss_mb")
+
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+# Absolute changes below these never count as regressions (timer/RSS noise)
+NOISE_FLOOR = {"wall_s": 0.05, "peak_rss_mb": 5.0}
+
+# Share of device-group addresses missing from the target Panorama, so
+# the sync has creates to push
+DEFAULT_DROP_RATIO = 0.05
+
+
+# ===========================================================
+# Measurement
+# ===========================================================
+
+def _current_rss_mb():
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is KiB on Linux; a process-lifetime peak, not current
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class RSSSampler:
+    """
+    Background thread tracking the peak RSS between start() and stop().
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _current_rss_mb())
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self.peak = _current_rss_mb()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss_mb())
+        return self.peak
+
+
+class PhaseRecorder:
+    """
+    Collects METRICS for each named phase of one benchmark run.
+    """
+
+    def __init__(self, *simulators):
+        self.simulators = simulators
+        self.phases = {}
+
+    def _http_requests(self):
+        return sum(simulator.total_requests for simulator in self.simulators)
+
+    @contextmanager
+    def phase(self, name):
+
+        sampler = RSSSampler()
+        http_before = self._http_requests()
+
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            peak = sampler.stop()
+
+            self.phases[name] = {
+                "wall_s": round(wall, 4),
+                "http_requests": self._http_requests() - http_before,
+                "peak_rss_mb": round(peak, 1),
+            }
+            logger.info("Benchmark phase %s: %s", name, self.phases[name])
+
+
+# ===========================================================
+# Scenario
+# ===========================================================
+
+def drop_addresses(dataset, ratio=DEFAULT_DROP_RATIO, seed=0):
+    """
+    Copy of `dataset` missing `ratio` of each device group's addresses.
+    """
+    rng = random.Random(seed)
+    mutated = copy.deepcopy(dataset)
+    path = OBJECT_PATHS["addresses"]
+
+    for scope, collections in mutated["scopes"].items():
+        if scope == SHARED_SCOPE or path not in collections:
+            continue
+        addresses = collections[path]
+        dropped = set(rng.sample(range(len(addresses)), int(len(addresses) * ratio)))
+        collections[path] = [a for i, a in enumerate(addresses) if i not in dropped]
+
+    return mutated
+
+
+def simulated_panorama_adapter(simulator, name, **options):
+    """
+    PanoramaAdapter talking to `simulator`, with the Forward analytics
+    checks off.
+    """
+    return PanoramaAdapter(
+        control_plane=types.SimpleNamespace(name=name, external_integration=None),
+        base_url=simulator.base_url,
+        api_key=simulator.api_key,
+        verify_ssl=False,
+        timeout=60,
+        logger=logger,
+        enable_compliance_checks=False,
+        enable_blast_radius=False,
+        enable_risk_scoring=False,
+        enable_rule_optimizer=False,
+        **options,
+    )
+
+
+def run_benchmark(profile="small", dataset_params=None, simulator_options=None, seed=0):
+    """
+    Sync one dataset into a Panorama missing some of its addresses and
+    return the results.
+
+    Both adapters load from their own simulator; the target then gets
+    the missing addresses through the adapter CRUD path and finishes
+    with the batched writes and commits that finalize performs. Forward
+    analytics and the Nautobot side are not part of the run.
+    """
+    params = dict(BENCHMARK_PROFILES[profile] if dataset_params is None else dataset_params)
+    params.setdefault("seed", seed)
+    simulator_options = {"commit_duration": 0, "validate_duration": 0, **(simulator_options or {})}
+
+    generate_start = time.perf_counter()
+    dataset = generate_dataset(**params)
+    reduced = drop_addresses(dataset, seed=seed)
+    generate_time = time.perf_counter() - generate_start
+
+    results = {
+        "profile": profile,
+        "dataset": params,
+        "dataset_size": dataset_size(dataset),
+        "generate_s": round(generate_time, 3),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "phases": {},
+    }
+
+    with ExitStack() as stack:
+        source_simulator = stack.enter_context(PanoramaSimulator(dataset, seed=seed, **simulator_options))
+        target_simulator = stack.enter_context(PanoramaSimulator(reduced, seed=seed, **simulator_options))
+
+        recorder = PhaseRecorder(source_simulator, target_simulator)
+        source = simulated_panorama_adapter(source_simulator, f"benchmark-{profile}")
+        target = simulated_panorama_adapter(target_simulator, f"benchmark-{profile}")
+
+        with recorder.phase("panorama_load"):
+            source.load()
+        with recorder.phase("target_load"):
+            target.load()
+        with recorder.phase("diff"):
+            diff = source.diff_to(target)
+        with recorder.phase("sync"):
+            source.sync_to(target, diff=diff)
+        with recorder.phase("finalize"):
+            target.client.execute_batch()
+            commits = target.client.commit_all(sorted(target.touched_device_groups))
+
+        results["phases"].update(recorder.phases)
+        results["changes"] = diff.summary()
+        results["commits"] = len(commits)
+
+    return results
+
+
+# ===========================================================
+# Baselines
+# ===========================================================
+
+def baseline_path(baseline_dir, profile):
+    return os.path.join(baseline_dir, f"{profile}.json")
+
+
+def load_baseline(baseline_dir, profile):
+
+    try:
+        with open(baseline_path(baseline_dir, profile), encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(baseline_dir, results):
+
+    os.makedirs(baseline_dir, exist_ok=True)
+    path = baseline_path(baseline_dir, results["profile"])
+
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+    return path
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """
+    [(phase, metric, baseline_value, current_value), ...] for every
+    metric more than `threshold` (relative) above the baseline.
+    """
+    regressions = []
+
+    for phase, current in results["phases"].items():
+        previous = baseline.get("phases", {}).get(phase)
+        if not previous:
+            continue
+
+        for metric in METRICS:
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            if new - old <= NOISE_FLOOR.get(metric, 0):
+                continue
+            if new > old * (1 + threshold):
+                regressions.append((phase, metric, old, new))
+
+    return regressions
@@ -0,0 +1,147 @@
+"""
+On-disk cache of the last loaded PanoramaAdapter state.
+
+One file per control plane holds every loaded DiffSync record together
+with the load timestamp and the control plane's config version. Records
+are packed with msgpack when it is installed and gzip-compressed JSON
+otherwise. A FreshnessPolicy decides whether a cached state may be
+reused or Panorama has to be read again.
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import time
+
+from django.conf import settings
+from django.utils.text import slugify
+
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_STATE_CACHE_MAX_AGE,
+    DEFAULT_STATE_CACHE_TTL,
+)
+from nautobot_panorama_ssot.utils.partition import model_record
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+def get_cache_dir():
+    config = settings.PLUGINS_CONFIG.get("nautobot_panorama_ssot", {})
+    return config.get("panorama_state_cache_dir") or os.path.join(
+        tempfile.gettempdir(), "nautobot_panorama_ssot"
+    )
+
+
+class FreshnessPolicy:
+    """
+    Cached state younger than `ttl` seconds is reused as-is. State up to
+    `max_age` seconds old is reused only if the config version still
+    matches. Anything older is refetched.
+    """
+
+    def __init__(self, ttl=DEFAULT_STATE_CACHE_TTL, max_age=DEFAULT_STATE_CACHE_MAX_AGE):
+        self.ttl = ttl
+        self.max_age = max_age
+
+    def age(self, payload, now=None):
+        return (now or time.time()) - payload["timestamp"]
+
+    def is_fresh(self, payload, now=None):
+        return self.age(payload, now) <= self.ttl
+
+    def needs_version_check(self, payload, now=None):
+        return self.ttl < self.age(payload, now) <= self.max_age
+
+
+class AdapterStateCache:
+    """
+    Cache file for one control plane.
+    """
+
+    def __init__(self, control_plane, cache_dir=None):
+        self.control_plane = control_plane
+        self.cache_dir = cache_dir or get_cache_dir()
+
+        extension = "msgpack" if msgpack else "json.gz"
+        self.path = os.path.join(self.cache_dir, f"{slugify(control_plane)}.{extension}")
+
+    # -----------------------------------------------------------
+    # Encoding
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def _dumps(payload):
+        if msgpack:
+            return msgpack.packb(payload, use_bin_type=True)
+        return gzip.compress(json.dumps(payload, separators=(",", ":")).encode())
+
+    @staticmethod
+    def _loads(data):
+        if msgpack:
+            return msgpack.unpackb(data, raw=False)
+        return json.loads(gzip.decompress(data))
+
+    # -----------------------------------------------------------
+    # Read / Write
+    # -----------------------------------------------------------
+
+    def read(self):
+        """
+        Cached payload, or None if missing, unreadable or outdated.
+        """
+        try:
+            with open(self.path, "rb") as handle:
+                payload = self._loads(handle.read())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Discarding unreadable state cache %s: %s", self.path, exc)
+            return None
+
+        if payload.get("format_version") != CACHE_FORMAT_VERSION:
+            return None
+
+        return payload
+
+    def write(self, adapter, model_types, config_version=None):
+        """
+        Serialize every record of `model_types` in `adapter`.
+        """
+        payload = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "control_plane": self.control_plane,
+            "timestamp": time.time(),
+            "config_version": config_version,
+            "records": [
+                [modelname, model_record(model)]
+                for modelname in model_types
+                for model in adapter.get_all(modelname)
+            ],
+        }
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write-then-rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(self._dumps(payload))
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return len(payload["records"])
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,182 @@
+"""
+Resumable sync checkpoints.
+
+Two kinds of progress are stored as PanoramaSyncCheckpoint rows:
+
+- partitions: a (model_type, logical_group) whose diff entries were all
+  applied to the target adapter during the sync
+- chunks: a PanoramaClient.execute_batch chunk whose writes succeeded,
+  keyed by a digest of its content
+
+A run started with resume prunes completed partitions from both
+adapters before the diff and skips applied chunks, so it continues
+where the failed run stopped. A successful run clears its checkpoints.
+"""
+
+import hashlib
+import json
+from collections import Counter
+
+from nautobot_panorama_ssot.models import PanoramaSyncCheckpoint
+from nautobot_panorama_ssot.utils.partition import PARTITION_MODEL_TYPES
+
+KIND_PARTITION = "partition"
+KIND_CHUNK = "chunk"
+
+# Containers are never pruned; their diff is cheap and children need them
+_PRUNABLE_MODEL_TYPES = tuple(m for m in PARTITION_MODEL_TYPES if m != "logical_group")
+
+
+def _model_logical_group(model):
+    return getattr(model, "logical_group", None) or getattr(model, "device_group", "")
+
+
+def _element_partition(element):
+    if element.type == "logical_group":
+        return element.type, element.keys.get("name", element.name)
+    return element.type, element.keys.get("logical_group") or element.keys.get("device_group", "")
+
+
+def partition_key(model_type, logical_group):
+    return f"{model_type}:{logical_group}"
+
+
+def chunk_digest(chunk):
+    """
+    Stable digest of a batch chunk of (func, args, kwargs) writes.
+    """
+    payload = json.dumps(
+        [(getattr(func, "__name__", str(func)), args, kwargs) for func, args, kwargs in chunk],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def pending_partitions(diff):
+    """
+    Counter of changed elements per (model_type, logical_group).
+    """
+    pending = Counter()
+    stack = list(diff.get_children())
+
+    while stack:
+        element = stack.pop()
+        if element.action and element.type in PARTITION_MODEL_TYPES:
+            pending[_element_partition(element)] += 1
+        stack.extend(element.get_children())
+
+    return pending
+
+
+class SyncCheckpoint:
+    """
+    Stored progress of one sync job class on one control plane.
+    """
+
+    def __init__(self, control_plane, job):
+        self.control_plane = control_plane
+        self.job = job
+        self.pending = Counter()
+
+        self._done = {KIND_PARTITION: set(), KIND_CHUNK: set()}
+        for kind, key in self._queryset().values_list("kind", "key"):
+            self._done.setdefault(kind, set()).add(key)
+
+    def _queryset(self):
+        return PanoramaSyncCheckpoint.objects.filter(control_plane=self.control_plane, job=self.job)
+
+    # -----------------------------------------------------------
+    # State
+    # -----------------------------------------------------------
+
+    def is_done(self, kind, key):
+        return key in self._done[kind]
+
+    def mark(self, kind, key):
+
+        if key in self._done[kind]:
+            return
+
+        PanoramaSyncCheckpoint.objects.get_or_create(
+            control_plane=self.control_plane,
+            job=self.job,
+            kind=kind,
+            key=key,
+        )
+
+        self._done[kind].add(key)
+
+    def clear(self):
+        """
+        Forget all progress, e.g. after a successful run.
+        """
+        self._queryset().delete()
+        self._done = {KIND_PARTITION: set(), KIND_CHUNK: set()}
+        self.pending = Counter()
+
+    @property
+    def completed_partitions(self):
+        return {tuple(key.split(":", 1)) for key in self._done[KIND_PARTITION]}
+
+    @property
+    def applied_chunks(self):
+        return len(self._done[KIND_CHUNK])
+
+    # -----------------------------------------------------------
+    # Batch Chunks
+    # -----------------------------------------------------------
+
+    def chunk_applied(self, chunk):
+        return self.is_done(KIND_CHUNK, chunk_digest(chunk))
+
+    def mark_chunk(self, chunk):
+        self.mark(KIND_CHUNK, chunk_digest(chunk))
+
+    # -----------------------------------------------------------
+    # Partitions
+    # -----------------------------------------------------------
+
+    def prune(self, *adapters):
+        """
+        Remove objects of completed partitions from the adapters.
+        """
+        completed = self.completed_partitions
+        removed = 0
+
+        for adapter in adapters:
+            for model_type in _PRUNABLE_MODEL_TYPES:
+                if not hasattr(adapter, model_type):
+                    continue
+                for model in list(adapter.get_all(model_type)):
+                    if (model_type, _model_logical_group(model)) in completed:
+                        adapter.remove(model)
+                        removed += 1
+
+        return removed
+
+    def track(self, diff, adapter):
+        """
+        Mark partitions complete as the sync applies the last of their
+        changes from `diff` to `adapter`.
+        """
+
+        self.pending = pending_partitions(diff)
+        adapter.write_listeners = [*getattr(adapter, "write_listeners", ()), self.applied]
+
+        return adapter
+
+    def applied(self, action, model):
+        """
+        Write listener: count down the partition of a written model.
+        """
+
+        model_type = model.get_type()
+        logical_group = model.name if model_type == "logical_group" else _model_logical_group(model)
+        partition = (model_type, logical_group)
+
+        if partition in self.pending:
+            self.pending[partition] -= 1
+            if self.pending[partition] <= 0:
+                del self.pending[partition]
+                self.mark(KIND_PARTITION, partition_key(*partition))
@@ -10,14 +10,165 @@ Supports:
 - Commit scoping
 """
 
+import hashlib
+import json
 import logging
+import random
 import requests
+import threading
 import time
+import xml.etree.ElementTree as ET
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_BACKOFF_MAX,
+    IDEMPOTENT_METHODS,
+    PANORAMA_API_PATH,
+    RETRYABLE_STATUS_CODES,
+)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from nautobot_panorama_ssot.utils import metrics
+from nautobot_panorama_ssot.utils.ratelimit import (
+    AdaptiveConcurrencyLimiter,
+    TokenBucket,
+)
 
 logger = logging.getLogger(__name__)
 
+# REST collections backing the PanoramaAdapter load helpers
+OBJECT_PATHS = {
+    "tags": "Objects/Tags",
+    "addresses": "Objects/Addresses",
+    "address_groups": "Objects/AddressGroups",
+    "services": "Objects/Services",
+    "service_groups": "Objects/ServiceGroups",
+    "applications": "Objects/Applications",
+    "application_groups": "Objects/ApplicationGroups",
+}
+
+
+# XML API op commands behind get_config_version
+PENDING_CHANGES_CMD = "<check><pending-changes></pending-changes></check>"
+SHOW_JOBS_CMD = "<show><jobs><all></all></jobs></show>"
+
+
+def device_group_xpath(device_group: str) -> str:
+    """XML API xpath of a device group's (or shared) config subtree."""
+    if device_group == "shared":
+        return "/config/shared"
+
+    return (
+        "/config/devices/entry[@name='localhost.localdomain']"
+        f"/device-group/entry[@name='{device_group}']"
+    )
+
+
+def config_digest(content: bytes) -> str:
+    """Version of a config subtree: a digest of its XML."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def rulebase_path(kind: str, rulebase: str) -> str:
+    """Policies/SecurityPreRules, Policies/NatPostRules, ..."""
+    return f"Policies/{kind}{rulebase.capitalize()}Rules"
+
+
+def extract_entries(response) -> List[Dict[str, Any]]:
+    """
+    Entries of a REST list response, with `name` mirrored from `@name`.
+    """
+    result = response.get("result") or {}
+    entries = result.get("entry", []) if isinstance(result, dict) else []
+
+    if isinstance(entries, dict):
+        entries = [entries]
+
+    for entry in entries:
+        if "name" not in entry and "@name" in entry:
+            entry["name"] = entry["@name"]
+
+    return entries
+
+
+def endpoint_name(path: str) -> str:
+    """
+    Path with object names and job ids dropped, for per-endpoint stats:
+    Objects/Addresses/web-1 -> Objects/Addresses, Jobs/42 -> Jobs.
+    """
+    path, _, action = path.lstrip("/").partition(":")
+    segments = path.split("/")
+    depth = 1 if segments[0] == "Jobs" else 2
+    name = "/".join(segments[:depth])
+    return f"{name}:{action}" if action else name
+
+
+def decode_json(content: bytes):
+    """
+    Decode a JSON response body straight from bytes, with orjson when
+    installed and the stdlib otherwise.
+    """
+    if not content:
+        return {}
+
+    if orjson:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def config_version_from(pending_changes: bytes, jobs: bytes) -> Optional[str]:
+    """
+    Config version from `check pending-changes` and `show jobs all`
+    responses; see PanoramaClient.get_config_version.
+    """
+    if ET.fromstring(pending_changes).findtext("result", "").strip() == "yes":
+        return None
+
+    commits = [
+        int(job.findtext("id"))
+        for job in ET.fromstring(jobs).iter("job")
+        if job.findtext("type") == "Commit"
+        and job.findtext("status") == "FIN"
+        and job.findtext("result") == "OK"
+    ]
+
+    return f"commit-{max(commits)}" if commits else None
+
+
+def _not_sent(exc) -> bool:
+    """
+    True if the request failed before any bytes reached Panorama.
+    """
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _retry_after(response) -> Optional[float]:
+    """
+    Retry-After in seconds, capped at DEFAULT_RETRY_BACKOFF_MAX so one
+    response cannot stall a sync.
+    """
+    value = response.headers.get("Retry-After")
+    try:
+        return min(max(float(value), 0.0), DEFAULT_RETRY_BACKOFF_MAX)
+    except (TypeError, ValueError):
+        return None
+
 
 class PanoramaClientError(Exception):
     pass
@@ -33,13 +184,32 @@ class PanoramaClient:
         verify_ssl: bool = True,
         timeout: int = 30,
         max_workers: int = 10,
+        rate_limit: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
 #        drift_only: bool = False,
 #        simulation_mode: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.api_version = api_version
-        self.max_workers = max_workers
+        self.max_workers = max_concurrency or max_workers
+
+        # Flow control: requests/second ceiling + AIMD in-flight ceiling
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self.concurrency = AdaptiveConcurrencyLimiter(max_limit=self.max_workers)
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_stats = Counter()
+        self._stats_lock = threading.Lock()
+
+        # Optional per-request hook: observer.record_request(endpoint, latency, status)
+        self.observer = None
+        # Optional SyncCheckpoint recording applied batch chunks
+        self.checkpoint = None
+        self.metrics_label = urlparse(self.base_url).hostname or self.base_url
 #        self.drift_only = drift_only
 #        self.simulation_mode = simulation_mode
 
@@ -51,6 +221,16 @@ class PanoramaClient:
             "Accept": "application/json",
         })
 
+        # One pooled connection per batch worker; retries are handled in
+        # _send so they are counted and pass through flow control.
+        pool = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=0,
+        )
+        self.session.mount("https://", pool)
+        self.session.mount("http://", pool)
+
         self._batch = []
 
     # ===========================================================
@@ -60,23 +240,214 @@ class PanoramaClient:
     def _url(self, path: str) -> str:
         return f"{self.base_url}/restapi/v{self.api_version}/{path.lstrip('/')}"
 
-    def _request(self, method: str, path: str, **kwargs):
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.retry_stats[key] += 1
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(DEFAULT_RETRY_BACKOFF_MAX, self.backoff_factor * 2 ** attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _send(self, method: str, url: str, applied_check=None, endpoint=None, **kwargs):
+        """
+        Send one HTTP call, retrying transient failures.
+
+        Idempotent methods are retried on connection errors, timeouts and
+        RETRYABLE_STATUS_CODES. Other methods (creates, moves, commits)
+        are retried only when Panorama cannot have acted on the first
+        attempt (connection refused, 429), or when `applied_check()`
+        confirms the write did not land.
+
+        Returns the response, or None if a retried write turned out to
+        have been applied already.
+        """
+        method = method.upper()
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+
+        while True:
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            self._count("requests")
+            response = None
+            error = None
+
+            with self.concurrency.slot():
+                start = time.monotonic()
+                try:
+                    response = self.session.request(
+                        method,
+                        url,
+                        timeout=self.timeout,
+                        **kwargs,
+                    )
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                    error = exc
+                latency = time.monotonic() - start
+                status = response.status_code if response is not None else None
+                self.concurrency.record(latency, status)
+
+            metrics.observe_request(self.metrics_label, endpoint or url, latency)
+            if self.observer:
+                self.observer.record_request(endpoint or url, latency, status)
+
+            if response is not None:
+
+                # A retried DELETE may find the first attempt already removed it
+                if attempt and method == "DELETE" and response.status_code == 404:
+                    self._count("writes_already_applied")
+                    return None
+
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+
+                unsent = response.status_code == 429
+                delay = _retry_after(response)
+
+            else:
+                unsent = _not_sent(error)
+                delay = None
+
+            if attempt >= self.max_retries:
+                self._count("retries_exhausted")
+                if error is not None:
+                    raise error
+                return response
+
+            if not (idempotent or unsent):
+                if applied_check is None:
+                    self._count("write_retries_refused")
+                    logger.warning("Not retrying %s %s: outcome unknown", method, url)
+                    if error is not None:
+                        raise error
+                    return response
+                if applied_check():
+                    self._count("writes_already_applied")
+                    return None
+
+            attempt += 1
+            self._count("retries")
+
+            delay = self._backoff(attempt - 1) if delay is None else delay
+            logger.info(
+                "Retrying %s %s in %.1fs (attempt %s/%s): %s",
+                method,
+                url,
+                delay,
+                attempt,
+                self.max_retries,
+                error or response.status_code,
+            )
+            time.sleep(delay)
+
+    def _request(self, method: str, path: str, applied_check=None, **kwargs):
 
         url = self._url(path)
 
-        response = self.session.request(
+        response = self._send(
             method,
             url,
-            timeout=self.timeout,
+            applied_check=applied_check,
+            endpoint=endpoint_name(path),
             **kwargs,
         )
 
+        if response is None:
+            return {}
+
         if response.status_code not in (200, 201):
             raise PanoramaClientError(
                 f"{method} {url} -> {response.status_code}: {response.text}"
             )
 
-        return response.json() if response.text else {}
+        return decode_json(response.content)
+
+    def _xml_request(self, params: Dict[str, Any]) -> bytes:
+
+        url = f"{self.base_url}{PANORAMA_API_PATH}"
+
+        response = self._send("GET", url, endpoint="api", params=params)
+
+        if response.status_code != 200:
+            raise PanoramaClientError(
+                f"GET {url} -> {response.status_code}: {response.text}"
+            )
+
+        return response.content
+
+    # ===========================================================
+    # Load Operations
+    # ===========================================================
+
+    def _list(self, path: str, device_group: str) -> List[Dict[str, Any]]:
+        return extract_entries(
+            self._request("GET", path, params=self.resolve_location(device_group))
+        )
+
+    def get_device_groups(self):
+        return extract_entries(
+            self._request("GET", "Panorama/DeviceGroups", params={"location": "panorama"})
+        )
+
+    def get_tags(self, device_group):
+        return self._list(OBJECT_PATHS["tags"], device_group)
+
+    def get_address_objects(self, device_group):
+        return self._list(OBJECT_PATHS["addresses"], device_group)
+
+    def get_address_groups(self, device_group):
+        return self._list(OBJECT_PATHS["address_groups"], device_group)
+
+    def get_service_objects(self, device_group):
+        return self._list(OBJECT_PATHS["services"], device_group)
+
+    def get_service_groups(self, device_group):
+        return self._list(OBJECT_PATHS["service_groups"], device_group)
+
+    def get_application_objects(self, device_group):
+        return self._list(OBJECT_PATHS["applications"], device_group)
+
+    def get_application_groups(self, device_group):
+        return self._list(OBJECT_PATHS["application_groups"], device_group)
+
+    def get_security_rules(self, device_group, rulebase="pre"):
+        return self._list(rulebase_path("Security", rulebase), device_group)
+
+    def get_nat_rules(self, device_group, rulebase="pre"):
+        return self._list(rulebase_path("Nat", rulebase), device_group)
+
+    # ===========================================================
+    # Config Versions
+    # ===========================================================
+
+    def _op(self, cmd: str) -> bytes:
+        return self._xml_request({"type": "op", "cmd": cmd})
+
+    def get_config_version(self) -> Optional[str]:
+        """
+        Cheap control-plane config version: the id of the latest
+        successful commit. None while the candidate config has
+        uncommitted changes, since loads read the candidate config.
+        """
+
+        return config_version_from(
+            self._op(PENDING_CHANGES_CMD),
+            self._op(SHOW_JOBS_CMD),
+        )
+
+    def get_device_group_version(self, device_group: str) -> str:
+        """
+        Version of one device group: a digest of its candidate config
+        subtree, so commits elsewhere leave it unchanged.
+        """
+
+        return config_digest(self._xml_request({
+            "type": "config",
+            "action": "get",
+            "xpath": device_group_xpath(device_group),
+        }))
 
     # ===========================================================
     # Batch Execution (20k+ safe)
@@ -91,6 +462,11 @@ class PanoramaClient:
             chunk = self._batch[:chunk_size]
             self._batch = self._batch[chunk_size:]
 
+            # Chunks applied by an interrupted earlier run are skipped on resume
+            if self.checkpoint and self.checkpoint.chunk_applied(chunk):
+                logger.info("Skipping %s writes applied by a previous run", len(chunk))
+                continue
+
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 futures = [
                     executor.submit(func, *args, **kwargs)
@@ -100,6 +476,9 @@ class PanoramaClient:
                 for f in futures:
                     f.result()
 
+            if self.checkpoint:
+                self.checkpoint.mark_chunk(chunk)
+
     # ===========================================================
     # Cross-Scope Resolution
     # ===========================================================
@@ -175,12 +554,19 @@ class PanoramaClient:
         payload = {
             "entry": {
                 "@name": model.name,
-                model.address_type: model.value,
+                model.type: model.value,
                 "description": model.description,
             }
         }
 
-        self._request("POST", path, params=scope, json=payload)
+        def applied():
+            try:
+                self._request("GET", f"{path}/{model.name}", params=scope)
+                return True
+            except PanoramaClientError:
+                return False
+
+        self._request("POST", path, params=scope, json=payload, applied_check=applied)
 
     def update_address(self, model, diffs):
 
@@ -219,6 +605,8 @@ class PanoramaClient:
 
     def commit_device_group(self, device_group):
 
+        start = time.monotonic()
+
         response = self._request(
             "POST",
             "Commit",
@@ -230,6 +618,10 @@ class PanoramaClient:
         if job_id:
             self._wait_for_job(job_id)
 
+        metrics.observe_commit(self.metrics_label, device_group, time.monotonic() - start)
+
+        return job_id
+
         # Previous config
 #        path = "Commit"
 #        payload = {"device-group": device_group}
@@ -244,8 +636,7 @@ class PanoramaClient:
                 for dg in device_groups
             ]
     
-            for f in futures:
-                f.result()
+            return [f.result() for f in futures]
 
     # ===========================================================
     # Commit - Rollback
@@ -316,8 +707,8 @@ class PanoramaClient:
     
         response = self._request(
             "GET",
-            f"Policies/HitCount",
-            params={"device-group": device_group}
+            "Policies/HitCount",
+            params=self.resolve_location(device_group)
         )
     
         return response.get("result", [])
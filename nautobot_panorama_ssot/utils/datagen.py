@@ -0,0 +1,393 @@
+"""
+Synthetic Panorama dataset generator.
+
+Builds reproducible (seeded) Panorama configurations of any size for
+performance work. The output is the dataset layout served by
+PanoramaSimulator, with entries shaped the way the PanoramaAdapter
+`_load_*` helpers consume them, and can also be exported as a Panorama
+XML config.
+
+    python -m nautobot_panorama_ssot.utils.datagen --device-groups 50 \
+        --objects-per-dg 2000 --output-dir /tmp/panorama-50x2000
+"""
+
+import argparse
+import json
+import os
+import random
+import xml.etree.ElementTree as ET
+
+from nautobot_panorama_ssot.utils.client import OBJECT_PATHS, rulebase_path
+from nautobot_panorama_ssot.utils.simulator import SHARED_SCOPE, scope_to_xml
+
+# Share of a scope's objects per collection
+OBJECT_MIX = (
+    ("addresses", 0.50),
+    ("address_groups", 0.10),
+    ("services", 0.20),
+    ("service_groups", 0.05),
+    ("applications", 0.10),
+    ("application_groups", 0.05),
+)
+
+TAG_COLORS = ("color1", "color2", "color3", "color5", "color6", "color13", "color15")
+ADDRESS_TYPES = ("ip-netmask", "ip-range", "fqdn")
+APP_CATEGORIES = (
+    ("business-systems", "database", "client-server"),
+    ("collaboration", "email", "browser-based"),
+    ("networking", "infrastructure", "network-protocol"),
+    ("general-internet", "file-sharing", "peer-to-peer"),
+)
+
+MAX_GROUP_MEMBERS = 8
+NAT_RULE_SHARE = 5  # one NAT rule per this many security rules
+
+
+def _split(total):
+    """
+    {collection: count} for `total` objects following OBJECT_MIX.
+    """
+    counts = {name: int(total * share) for name, share in OBJECT_MIX}
+    counts["addresses"] += total - sum(counts.values())
+    return counts
+
+
+class DatasetGenerator:
+    """
+    One generated configuration. All randomness flows from `seed`, so
+    the same parameters always produce the same dataset.
+    """
+
+    def __init__(
+        self,
+        device_groups=10,
+        objects_per_dg=100,
+        group_depth=2,
+        rules_per_rulebase=25,
+        tag_count=20,
+        shared_ratio=0.2,
+        seed=0,
+    ):
+        self.device_groups = [f"dg-{i:04d}" for i in range(1, device_groups + 1)]
+        self.objects_per_dg = objects_per_dg
+        self.group_depth = max(group_depth, 1)
+        self.rules_per_rulebase = rules_per_rulebase
+        self.tag_count = tag_count
+        self.shared_ratio = min(max(shared_ratio, 0.0), 1.0)
+        self.rng = random.Random(seed)
+
+        self.tags = [f"tag-{i:04d}" for i in range(tag_count)]
+
+        # Shared-scope names per collection, referenceable from every DG
+        self._shared_names = {}
+
+    # -----------------------------------------------------------
+    # Helpers
+    # -----------------------------------------------------------
+
+    def _pick_tags(self):
+        if not self.tags:
+            return []
+        return sorted(self.rng.sample(self.tags, self.rng.randint(0, min(2, len(self.tags)))))
+
+    def _sample(self, pool, low=1, high=MAX_GROUP_MEMBERS):
+        if not pool:
+            return []
+        return self.rng.sample(pool, min(len(pool), self.rng.randint(low, high)))
+
+    def _visible(self, names, collection):
+        return names.get(collection, []) + self._shared_names.get(collection, [])
+
+    def _ip(self):
+        return f"10.{self.rng.randint(0, 255)}.{self.rng.randint(0, 255)}.{self.rng.randint(1, 254)}"
+
+    # -----------------------------------------------------------
+    # Objects
+    # -----------------------------------------------------------
+
+    def _address(self, name):
+
+        address_type = self.rng.choice(ADDRESS_TYPES)
+        if address_type == "ip-netmask":
+            value = f"{self._ip()}/{self.rng.choice((24, 28, 32))}"
+        elif address_type == "ip-range":
+            start = self._ip()
+            value = f"{start}-{start.rsplit('.', 1)[0]}.254"
+        else:
+            value = f"{name}.example.com"
+
+        return {
+            "@name": name,
+            "type": address_type,
+            "value": value,
+            "description": "",
+            "tag": self._pick_tags(),
+        }
+
+    def _service(self, name):
+        port = self.rng.randint(1, 65535)
+        return {
+            "@name": name,
+            "protocol": self.rng.choice(("tcp", "udp")),
+            "port": str(port) if self.rng.random() < 0.8 else f"{port}-{min(port + 100, 65535)}",
+            "description": "",
+            "tag": self._pick_tags(),
+        }
+
+    def _application(self, name):
+        category, subcategory, technology = self.rng.choice(APP_CATEGORIES)
+        return {
+            "@name": name,
+            "category": category,
+            "subcategory": subcategory,
+            "technology": technology,
+            "risk": self.rng.randint(1, 5),
+            "description": "",
+            "tag": self._pick_tags(),
+        }
+
+    def _groups(self, prefix, count, leaves, member_key):
+        """
+        `count` groups spread over `group_depth` nesting levels; level 0
+        holds leaves, level N holds groups from level N-1.
+        """
+        entries = []
+        previous = leaves
+
+        for level in range(self.group_depth):
+            level_count = count // self.group_depth + (1 if level < count % self.group_depth else 0)
+            names = [f"{prefix}-l{level}-{i:06d}" for i in range(level_count)]
+
+            for name in names:
+                entries.append({
+                    "@name": name,
+                    "description": "",
+                    member_key: self._sample(previous),
+                    "tag": self._pick_tags(),
+                })
+
+            previous = names or previous
+
+        return entries
+
+    def _objects(self, scope, total):
+
+        counts = _split(total)
+        collections = {}
+        names = {}
+
+        def add(key, entries):
+            collections[OBJECT_PATHS[key]] = entries
+            names[key] = [e["@name"] for e in entries]
+
+        add("addresses", [self._address(f"addr-{scope}-{i:06d}") for i in range(counts["addresses"])])
+        add("services", [self._service(f"svc-{scope}-{i:06d}") for i in range(counts["services"])])
+        add("applications", [self._application(f"app-{scope}-{i:06d}") for i in range(counts["applications"])])
+
+        add("address_groups", self._groups(
+            f"ag-{scope}", counts["address_groups"], self._visible(names, "addresses"), "static",
+        ))
+        add("service_groups", self._groups(
+            f"sg-{scope}", counts["service_groups"], self._visible(names, "services"), "members",
+        ))
+        add("application_groups", self._groups(
+            f"apg-{scope}", counts["application_groups"], self._visible(names, "applications"), "members",
+        ))
+
+        return collections, names
+
+    # -----------------------------------------------------------
+    # Rules
+    # -----------------------------------------------------------
+
+    def _security_rule(self, name, pools):
+        addresses, services, applications = pools
+        return {
+            "@name": name,
+            "action": self.rng.choice(("allow", "allow", "allow", "deny", "drop")),
+            "description": "",
+            "source": {"member": self._sample(addresses, 1, 4) or ["any"]},
+            "destination": {"member": self._sample(addresses, 1, 4) or ["any"]},
+            "service": {"member": self._sample(services, 1, 3) or ["application-default"]},
+            "application": {"member": self._sample(applications, 1, 3) or ["any"]},
+            "tag": {"member": self._pick_tags()},
+        }
+
+    def _nat_rule(self, name, addresses):
+        return {
+            "@name": name,
+            "description": "",
+            "from_zones": ["trust"],
+            "to_zones": ["untrust"],
+            "sources": self._sample(addresses, 1, 2),
+            "destinations": self._sample(addresses, 1, 2),
+            "services": ["any"],
+            "source_translation": self._ip() if self.rng.random() < 0.5 else None,
+            "tags": self._pick_tags(),
+        }
+
+    def _rules(self, scope, names):
+
+        collections = {}
+        nat_count = max(self.rules_per_rulebase // NAT_RULE_SHARE, 1) if self.rules_per_rulebase else 0
+
+        # Reference pools are built once per scope; shared can be large
+        addresses = self._visible(names, "addresses")
+        pools = (
+            addresses + self._visible(names, "address_groups"),
+            self._visible(names, "services") + self._visible(names, "service_groups"),
+            self._visible(names, "applications") + self._visible(names, "application_groups"),
+        )
+
+        for rulebase in ("pre", "post"):
+            collections[rulebase_path("Security", rulebase)] = [
+                self._security_rule(f"sec-{rulebase}-{scope}-{i:05d}", pools)
+                for i in range(self.rules_per_rulebase)
+            ]
+            collections[rulebase_path("Nat", rulebase)] = [
+                self._nat_rule(f"nat-{rulebase}-{scope}-{i:05d}", addresses)
+                for i in range(nat_count)
+            ]
+
+        return collections
+
+    # -----------------------------------------------------------
+    # Dataset
+    # -----------------------------------------------------------
+
+    def generate(self):
+        """
+        Dataset in the PanoramaSimulator layout.
+        """
+        total = len(self.device_groups) * self.objects_per_dg
+        shared_total = int(total * self.shared_ratio)
+        per_dg = max(self.objects_per_dg - shared_total // max(len(self.device_groups), 1), 0)
+
+        scopes = {}
+
+        self._shared_names = {}
+        shared, self._shared_names = self._objects(SHARED_SCOPE, shared_total)
+        shared[OBJECT_PATHS["tags"]] = [
+            {"@name": tag, "color": self.rng.choice(TAG_COLORS)} for tag in self.tags
+        ]
+        shared.update(self._rules(SHARED_SCOPE, {}))
+        scopes[SHARED_SCOPE] = shared
+
+        hit_counts = {}
+
+        for dg in self.device_groups:
+            collections, names = self._objects(dg, per_dg)
+            collections.update(self._rules(dg, names))
+            scopes[dg] = collections
+
+            hit_counts[dg] = [
+                {"rule-name": rule["@name"], "hit-count": int(self.rng.paretovariate(1.2) * 10) - 10}
+                for rulebase in ("pre", "post")
+                for rule in collections[rulebase_path("Security", rulebase)]
+            ]
+
+        return {
+            "device_groups": list(self.device_groups),
+            "scopes": scopes,
+            "hit_counts": hit_counts,
+        }
+
+
+def generate_dataset(**params):
+    return DatasetGenerator(**params).generate()
+
+
+def dataset_size(dataset):
+    """
+    Total number of objects and rules across every scope.
+    """
+    return sum(
+        len(entries)
+        for collections in dataset["scopes"].values()
+        for entries in collections.values()
+    )
+
+
+# ===========================================================
+# XML Export
+# ===========================================================
+
+def _native_entry(path, entry):
+    """
+    Address entries are stored as type/value; XML uses <ip-netmask> etc.
+    """
+    if path != OBJECT_PATHS["addresses"]:
+        return entry
+
+    native = {k: v for k, v in entry.items() if k not in ("type", "value")}
+    native[entry["type"]] = entry["value"]
+    return native
+
+
+def to_xml_config(dataset):
+    """
+    Panorama running-config style <config> element for the dataset.
+    """
+    config = ET.Element("config", version="11.1.0")
+
+    def scope_element(scope):
+        collections = {
+            path: [_native_entry(path, e) for e in entries]
+            for path, entries in dataset["scopes"].get(scope, {}).items()
+        }
+        return scope_to_xml(scope, collections)
+
+    shared = scope_element(SHARED_SCOPE)
+    shared.tag = "shared"
+    shared.attrib.clear()
+    config.append(shared)
+
+    devices = ET.SubElement(config, "devices")
+    localhost = ET.SubElement(devices, "entry", name="localhost.localdomain")
+    device_group = ET.SubElement(localhost, "device-group")
+
+    for dg in dataset["device_groups"]:
+        device_group.append(scope_element(dg))
+
+    return config
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic Panorama dataset")
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--device-groups", type=int, default=10)
+    parser.add_argument("--objects-per-dg", type=int, default=100)
+    parser.add_argument("--group-depth", type=int, default=2, help="Nesting levels of address/service groups")
+    parser.add_argument("--rules-per-rulebase", type=int, default=25)
+    parser.add_argument("--tag-count", type=int, default=20)
+    parser.add_argument("--shared-ratio", type=float, default=0.2, help="Share of objects in the shared scope")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dataset = generate_dataset(
+        device_groups=args.device_groups,
+        objects_per_dg=args.objects_per_dg,
+        group_depth=args.group_depth,
+        rules_per_rulebase=args.rules_per_rulebase,
+        tag_count=args.tag_count,
+        shared_ratio=args.shared_ratio,
+        seed=args.seed,
+    )
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    with open(os.path.join(args.output_dir, "dataset.json"), "w", encoding="utf-8") as handle:
+        json.dump(dataset, handle, separators=(",", ":"))
+
+    ET.ElementTree(to_xml_config(dataset)).write(
+        os.path.join(args.output_dir, "config.xml"),
+        encoding="utf-8",
+        xml_declaration=True,
+    )
+
+    print(f"Wrote {dataset_size(dataset)} objects and rules to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
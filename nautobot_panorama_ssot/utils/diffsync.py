@@ -230,30 +230,6 @@ def get_default_custom_fields(cf_contenttype: ContentType, excluded_cfs: Optiona
     return default_cfs
 
 
-class DriftAudit:
-
-    def __init__(self):
-        self.operations = []
-        self.rule_impacts = {}
-
-    def record(self, action, object_type, name, scope):
-        self.operations.append({
-            "action": action,
-            "type": object_type,
-            "name": name,
-            "scope": scope,
-        })
-
-    def record_rule_impact(self, rule_name, object_name):
-        self.rule_impacts.setdefault(rule_name, []).append(object_name)
-
-    def summary(self):
-        from collections import Counter
-        return Counter(op["action"] for op in self.operations)
-
-    def export(self):
-        return self.operations
-
 class DependencyGraph:
 
     def __init__(self):
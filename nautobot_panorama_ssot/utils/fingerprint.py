@@ -0,0 +1,199 @@
+"""
+Per-object content fingerprints for incremental sync.
+
+After a sync the hash of every source model's attributes is stored,
+except for objects the target failed to apply. On the next run, source objects whose hash still matches are
+removed from the source adapter and skipped by the target load, so the
+diff only covers objects that actually changed. The target adapter
+still lists the names in each logical group (a name-only query) so
+objects deleted from Panorama are found.
+"""
+
+import hashlib
+import json
+from collections import defaultdict
+
+from diffsync.enum import DiffSyncActions, DiffSyncStatus
+from django.db import transaction
+from django.utils import timezone
+
+from nautobot_panorama_ssot.models import PanoramaObjectFingerprint
+
+# Object types tracked by fingerprint; containers are always diffed.
+FINGERPRINT_MODEL_TYPES = (
+    "tag",
+    "address",
+    "address_group",
+    "service",
+    "service_group",
+    "application",
+    "application_group",
+    "rule",
+    "nat_rule",
+)
+
+
+def fingerprint_model(model):
+    """
+    Stable hash of a DiffSync model's `_attributes`.
+    """
+    payload = json.dumps(model.get_attrs(), sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _model_logical_group(model):
+    return getattr(model, "logical_group", None) or getattr(model, "device_group", "")
+
+
+def failed_elements(diff, adapter):
+    """
+    {(model_type, identifier)} of changed diff elements that `adapter`
+    did not apply, judged from its models after the sync.
+    """
+    failed = set()
+    stack = list(diff.get_children())
+
+    while stack:
+        element = stack.pop()
+        stack.extend(element.get_children())
+
+        if not element.action or element.type not in FINGERPRINT_MODEL_TYPES:
+            continue
+
+        identifier = getattr(adapter, element.type).create_unique_id(**element.keys)
+        model = adapter.get_or_none(element.type, identifier)
+
+        if element.action == DiffSyncActions.DELETE:
+            applied = model is None
+        else:
+            applied = model is not None and model.get_status()[0] == DiffSyncStatus.SUCCESS
+
+        if not applied:
+            failed.add((element.type, identifier))
+
+    return failed
+
+
+class FingerprintIndex:
+    """
+    Stored fingerprints for one control plane.
+    """
+
+    def __init__(self, control_plane, logical_groups=None):
+        self.control_plane = control_plane
+
+        # A sharded run only owns the fingerprints of its logical groups
+        stored = PanoramaObjectFingerprint.objects.filter(control_plane=control_plane)
+        if logical_groups is not None:
+            stored = stored.filter(logical_group__in=logical_groups)
+
+        self.stored = {
+            (model_type, identifier): content_hash
+            for model_type, identifier, content_hash in stored.values_list("model_type", "identifier", "content_hash")
+        }
+        self.current = {}
+
+    def scan(self, adapter):
+        """
+        Hash every tracked object in the loaded source adapter.
+
+        Returns the unchanged objects as
+        {(model_type, logical_group): {name, ...}}.
+        """
+        unchanged = defaultdict(set)
+
+        for model_type in FINGERPRINT_MODEL_TYPES:
+            for model in adapter.get_all(model_type):
+                identifier = model.get_unique_id()
+                content_hash = fingerprint_model(model)
+
+                self.current[(model_type, identifier)] = (
+                    _model_logical_group(model),
+                    model.name,
+                    content_hash,
+                )
+
+                if self.stored.get((model_type, identifier)) == content_hash:
+                    unchanged[(model_type, _model_logical_group(model))].add(model.name)
+
+        return dict(unchanged)
+
+    @staticmethod
+    def prune(adapter, unchanged):
+        """
+        Remove unchanged objects from the source adapter.
+        """
+        removed = 0
+
+        for model_type in {model_type for model_type, _ in unchanged}:
+            for model in list(adapter.get_all(model_type)):
+                if model.name in unchanged.get((model_type, _model_logical_group(model)), ()):
+                    adapter.remove(model)
+                    removed += 1
+
+        return removed
+
+    def save(self, failed=()):
+        """
+        Persist fingerprints of the last scan after a non-dry-run sync.
+        Objects in `failed` keep their stored fingerprint so the next
+        run diffs them again.
+        """
+        failed = set(failed)
+        changed = {
+            key: value
+            for key, value in self.current.items()
+            if self.stored.get(key) != value[2] and key not in failed
+        }
+        vanished = set(self.stored) - set(self.current) - failed
+
+        with transaction.atomic():
+
+            existing = {
+                (fp.model_type, fp.identifier): fp
+                for fp in PanoramaObjectFingerprint.objects.filter(
+                    control_plane=self.control_plane,
+                    model_type__in={key[0] for key in changed},
+                    identifier__in={key[1] for key in changed},
+                )
+            }
+
+            now = timezone.now()
+            to_update = []
+            to_create = []
+
+            for (model_type, identifier), (logical_group, name, content_hash) in changed.items():
+                fp = existing.get((model_type, identifier))
+                if fp:
+                    fp.content_hash = content_hash
+                    fp.last_synced = now
+                    to_update.append(fp)
+                else:
+                    to_create.append(
+                        PanoramaObjectFingerprint(
+                            control_plane=self.control_plane,
+                            model_type=model_type,
+                            logical_group=logical_group,
+                            name=name,
+                            identifier=identifier,
+                            content_hash=content_hash,
+                        )
+                    )
+
+            PanoramaObjectFingerprint.objects.bulk_update(
+                to_update, ["content_hash", "last_synced"], batch_size=1000
+            )
+            PanoramaObjectFingerprint.objects.bulk_create(to_create, batch_size=1000)
+
+            for model_type in {key[0] for key in vanished}:
+                PanoramaObjectFingerprint.objects.filter(
+                    control_plane=self.control_plane,
+                    model_type=model_type,
+                    identifier__in=[key[1] for key in vanished if key[0] == model_type],
+                ).delete()
+
+        self.stored.update({key: value[2] for key, value in changed.items()})
+        for key in vanished:
+            self.stored.pop(key, None)
+
+        return len(changed), len(vanished)
@@ -0,0 +1,148 @@
+"""
+Concurrent sync of several Panorama control planes.
+
+A fleet job enqueues one child sync job per control plane and admits
+them through a FleetScheduler: at most `budget` child jobs run at once
+across the fleet, and at most `per_panorama` against the same Panorama
+(external integration). Control planes waiting for a slot keep their
+requested order. Finished children are summarised from their
+PanoramaSyncLogs.
+"""
+
+import time
+from collections import Counter, deque
+
+from nautobot.extras.choices import JobResultStatusChoices
+
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_FLEET_BUDGET,
+    DEFAULT_FLEET_TIMEOUT,
+    DEFAULT_PER_PANORAMA_LIMIT,
+)
+from nautobot_panorama_ssot.models import PanoramaSyncLog
+
+FLEET_POLL_INTERVAL = 5
+
+
+class FleetScheduler:
+    """
+    Admission control over a global budget and a per-key limit.
+    """
+
+    def __init__(self, items, budget=DEFAULT_FLEET_BUDGET, per_key_limit=DEFAULT_PER_PANORAMA_LIMIT, key=None):
+        self.queue = deque(items)
+        self.budget = max(1, budget)
+        self.per_key_limit = max(1, per_key_limit)
+        self.key = key or (lambda item: item)
+
+        self.running = []
+        self.per_key = Counter()
+
+    @property
+    def done(self):
+        return not self.queue and not self.running
+
+    def admit(self):
+        """
+        Items that may start now, in queue order.
+        """
+
+        admitted = []
+        waiting = deque()
+
+        while self.queue and len(self.running) < self.budget:
+            item = self.queue.popleft()
+            key = self.key(item)
+
+            if self.per_key[key] >= self.per_key_limit:
+                waiting.append(item)
+                continue
+
+            self.per_key[key] += 1
+            self.running.append(item)
+            admitted.append(item)
+
+        waiting.extend(self.queue)
+        self.queue = waiting
+
+        return admitted
+
+    def release(self, item):
+        self.running.remove(item)
+        self.per_key[self.key(item)] -= 1
+
+
+def _finished(job_result):
+    job_result.refresh_from_db(fields=["status"])
+    return job_result.status in JobResultStatusChoices.READY_STATES
+
+
+def run_fleet(
+    scheduler,
+    dispatch,
+    timeout=DEFAULT_FLEET_TIMEOUT,
+    poll_interval=FLEET_POLL_INTERVAL,
+    finished=_finished,
+):
+    """
+    Dispatch every scheduled item as it is admitted and wait for all of
+    them. Returns [(item, job_result), ...] in completion order.
+    """
+
+    deadline = time.monotonic() + timeout
+    running = {}
+    completed = []
+
+    while not scheduler.done:
+
+        for item in scheduler.admit():
+            running[id(item)] = (item, dispatch(item))
+
+        for key, (item, job_result) in list(running.items()):
+            if finished(job_result):
+                scheduler.release(item)
+                completed.append(running.pop(key))
+
+        if scheduler.done:
+            break
+
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{len(running)} fleet job(s) still running after {timeout}s")
+
+        time.sleep(poll_interval)
+
+    return completed
+
+
+def fleet_summary(completed):
+    """
+    {"control_planes": {name: {...}}, "totals": {...}} for finished
+    [(control_plane, job_result), ...].
+    """
+
+    logs = {
+        log.job_result_id: log
+        for log in PanoramaSyncLog.objects.filter(job_result__in=[jr for _, jr in completed])
+    }
+
+    rows = {}
+    totals = Counter()
+
+    for control_plane, job_result in completed:
+        log = logs.get(job_result.pk)
+
+        row = {
+            "job_result": str(job_result.pk),
+            "status": job_result.status,
+            "created": log.objects_created if log else 0,
+            "updated": log.objects_updated if log else 0,
+            "deleted": log.objects_deleted if log else 0,
+            "duration": log.duration if log else None,
+        }
+        rows[control_plane.name] = row
+
+        totals[job_result.status] += 1
+        for field in ("created", "updated", "deleted"):
+            totals[field] += row[field]
+
+    return {"control_planes": rows, "totals": dict(totals)}
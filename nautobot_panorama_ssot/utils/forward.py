@@ -2,6 +2,8 @@ import requests
 import time
 from typing import Dict, Any, List, Optional
 
+from nautobot_panorama_ssot.utils import metrics
+
 
 class ForwardClient:
     """
@@ -55,6 +57,7 @@ class ForwardClient:
     # ============================================================
 
     def run_nqe(self, query: str) -> List[Dict[str, Any]]:
+        metrics.count_nqe_call()
         payload = {"query": query}
         resp = self.session.post(f"{self.base_url}/nqe", json=payload)
         resp.raise_for_status()
@@ -0,0 +1,276 @@
+"""
+Rule hit count time-series storage.
+
+Panorama only exposes cumulative hit counters. The collector job stores
+the increments between polls (delta encoding) and periodically rolls
+old samples up into hourly and daily buckets, so reorder and unused-rule
+analysis can run over weeks of history without calling Panorama.
+"""
+
+import datetime
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Max, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_HIT_COUNT_WINDOW_DAYS,
+    HIT_COUNT_DAILY_RETENTION_DAYS,
+    HIT_COUNT_HOURLY_RETENTION_DAYS,
+    HIT_COUNT_RAW_RETENTION_HOURS,
+    HIT_COUNT_RESOLUTION_DAILY,
+    HIT_COUNT_RESOLUTION_HOURLY,
+    HIT_COUNT_RESOLUTION_RAW,
+)
+from nautobot_panorama_ssot.models import PanoramaRuleHitCount
+
+
+# ===========================================================
+# Delta Encoding
+# ===========================================================
+
+def compute_hit_deltas(previous_totals, hit_counts):
+    """
+    Convert cumulative Panorama counters into increments.
+
+    previous_totals = {"rule-a": 120, ...}
+    hit_counts = [{"rule-name": "rule-a", "hit-count": 150}, ...]
+
+    Returns {rule_name: (delta, total)}. A rule without a previous
+    total gets a baseline sample with delta 0, since its counter holds
+    hits from before collection started. A counter lower than the
+    previous total means it was reset, so the whole value is the delta.
+    """
+
+    deltas = {}
+
+    for entry in hit_counts:
+        name = entry.get("rule-name")
+        if not name:
+            continue
+
+        total = int(entry.get("hit-count", 0) or 0)
+        previous = previous_totals.get(name)
+
+        if previous is None:
+            delta = 0
+        elif total < previous:
+            delta = total
+        else:
+            delta = total - previous
+
+        deltas[name] = (delta, total)
+
+    return deltas
+
+
+def _latest_totals(control_plane, device_group):
+    """
+    {rule_name: hit_total} of each rule's most recent sample.
+    """
+    samples = PanoramaRuleHitCount.objects.filter(
+        control_plane=control_plane,
+        device_group=device_group,
+    )
+
+    latest = (
+        samples
+        .filter(rule_name=OuterRef("rule_name"))
+        .order_by("-bucket_start")
+        .values("hit_total")[:1]
+    )
+
+    rows = (
+        samples
+        .order_by()
+        .values("rule_name")
+        .distinct()
+        .annotate(latest_total=Subquery(latest))
+        .values_list("rule_name", "latest_total")
+    )
+
+    return dict(rows)
+
+
+def record_hit_counts(control_plane, device_group, hit_counts, timestamp=None):
+    """
+    Store one raw, delta-encoded sample per rule. Returns rows written.
+    """
+    timestamp = timestamp or timezone.now()
+    deltas = compute_hit_deltas(
+        _latest_totals(control_plane, device_group),
+        hit_counts,
+    )
+
+    rows = [
+        PanoramaRuleHitCount(
+            control_plane=control_plane,
+            device_group=device_group,
+            rule_name=rule_name,
+            resolution=HIT_COUNT_RESOLUTION_RAW,
+            bucket_start=timestamp,
+            hit_delta=delta,
+            hit_total=total,
+        )
+        for rule_name, (delta, total) in deltas.items()
+    ]
+
+    PanoramaRuleHitCount.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+# ===========================================================
+# Downsampling
+# ===========================================================
+
+def _rollup(source, target, trunc, cutoff):
+
+    old = PanoramaRuleHitCount.objects.filter(
+        resolution=source,
+        bucket_start__lt=cutoff,
+    )
+
+    buckets = (
+        old
+        .annotate(bucket=trunc("bucket_start"))
+        .values("control_plane", "device_group", "rule_name", "bucket")
+        .annotate(delta=Sum("hit_delta"), total=Max("hit_total"))
+    )
+
+    rolled = {
+        (b["control_plane"], b["device_group"], b["rule_name"], b["bucket"]): b
+        for b in buckets
+    }
+
+    if not rolled:
+        return 0
+
+    with transaction.atomic():
+
+        existing = PanoramaRuleHitCount.objects.filter(
+            resolution=target,
+            bucket_start__in={key[3] for key in rolled},
+        )
+
+        to_update = []
+        for row in existing:
+            key = (row.control_plane, row.device_group, row.rule_name, row.bucket_start)
+            bucket = rolled.pop(key, None)
+            if bucket:
+                row.hit_delta += bucket["delta"]
+                row.hit_total = max(row.hit_total, bucket["total"])
+                to_update.append(row)
+
+        PanoramaRuleHitCount.objects.bulk_update(
+            to_update, ["hit_delta", "hit_total"], batch_size=1000
+        )
+
+        PanoramaRuleHitCount.objects.bulk_create(
+            [
+                PanoramaRuleHitCount(
+                    control_plane=cp,
+                    device_group=dg,
+                    rule_name=rule_name,
+                    resolution=target,
+                    bucket_start=bucket_start,
+                    hit_delta=b["delta"],
+                    hit_total=b["total"],
+                )
+                for (cp, dg, rule_name, bucket_start), b in rolled.items()
+            ],
+            batch_size=1000,
+        )
+
+        deleted, _ = old.delete()
+
+    return deleted
+
+
+def downsample_hit_counts(now=None):
+    """
+    Roll aged raw samples into hourly buckets, aged hourly buckets into
+    daily buckets, and drop daily buckets past retention.
+    """
+    now = now or timezone.now()
+
+    hourly_cutoff = (
+        now - datetime.timedelta(hours=HIT_COUNT_RAW_RETENTION_HOURS)
+    ).replace(minute=0, second=0, microsecond=0)
+
+    daily_cutoff = (
+        now - datetime.timedelta(days=HIT_COUNT_HOURLY_RETENTION_DAYS)
+    ).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    stats = {
+        HIT_COUNT_RESOLUTION_HOURLY: _rollup(
+            HIT_COUNT_RESOLUTION_RAW, HIT_COUNT_RESOLUTION_HOURLY, TruncHour, hourly_cutoff
+        ),
+        HIT_COUNT_RESOLUTION_DAILY: _rollup(
+            HIT_COUNT_RESOLUTION_HOURLY, HIT_COUNT_RESOLUTION_DAILY, TruncDay, daily_cutoff
+        ),
+    }
+
+    expired, _ = PanoramaRuleHitCount.objects.filter(
+        resolution=HIT_COUNT_RESOLUTION_DAILY,
+        bucket_start__lt=now - datetime.timedelta(days=HIT_COUNT_DAILY_RETENTION_DAYS),
+    ).delete()
+    stats["expired"] = expired
+
+    return stats
+
+
+# ===========================================================
+# Queries
+# ===========================================================
+
+def get_stored_hit_counts(control_plane, device_group, days=DEFAULT_HIT_COUNT_WINDOW_DAYS):
+    """
+    Hits per rule over the last `days`, in the same shape as
+    PanoramaClient.get_rule_hit_counts so the analysis helpers in
+    utils.diffsync can consume it unchanged.
+    """
+    since = timezone.now() - datetime.timedelta(days=days)
+
+    rows = (
+        PanoramaRuleHitCount.objects
+        .filter(
+            control_plane=control_plane,
+            device_group=device_group,
+            bucket_start__gte=since,
+        )
+        .values("rule_name")
+        .annotate(hits=Sum("hit_delta"))
+    )
+
+    return [
+        {"rule-name": r["rule_name"], "hit-count": r["hits"] or 0}
+        for r in rows
+    ]
+
+
+def get_hit_count_trend(control_plane, device_group, days=DEFAULT_HIT_COUNT_WINDOW_DAYS):
+    """
+    Daily hit totals per rule: {rule_name: [(date, hits), ...]}.
+    """
+    since = timezone.now() - datetime.timedelta(days=days)
+
+    rows = (
+        PanoramaRuleHitCount.objects
+        .filter(
+            control_plane=control_plane,
+            device_group=device_group,
+            bucket_start__gte=since,
+        )
+        .annotate(day=TruncDay("bucket_start"))
+        .values("rule_name", "day")
+        .annotate(hits=Sum("hit_delta"))
+        .order_by("rule_name", "day")
+    )
+
+    trend = defaultdict(list)
+    for r in rows:
+        trend[r["rule_name"]].append((r["day"].date(), r["hits"] or 0))
+
+    return dict(trend)
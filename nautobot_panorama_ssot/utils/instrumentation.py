@@ -0,0 +1,214 @@
+"""
+Per-run performance instrumentation for sync jobs.
+
+SyncInstrumentation collects, for one job run:
+
+- wall time and DB queries per job phase (load, diff, sync, ...)
+- HTTP call count, errors and latency per PanoramaClient endpoint
+- DB queries per NautobotAdapter method
+- loaded object counts per model type
+
+Queries are counted with a Django execute wrapper, so no SQL is kept in
+memory. The collected profile is stored on PanoramaSyncLog and written
+to the job log.
+"""
+
+import functools
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.db import connection
+
+# Adapter methods counted separately in query_counts
+INSTRUMENTED_METHOD_PREFIXES = ("load", "create_", "update_", "delete_")
+
+
+class SyncInstrumentation:
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.http = defaultdict(lambda: {"count": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0})
+        self.queries = Counter()
+        self.object_counts = {}
+
+        self._scopes = threading.local()
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------------
+    # Query Counting
+    # -----------------------------------------------------------
+
+    def _stack(self):
+        if not hasattr(self._scopes, "stack"):
+            self._scopes.stack = []
+        return self._scopes.stack
+
+    def _count_query(self, execute, sql, params, many, context):
+        # Nested scopes each see the query, so phase totals are inclusive
+        for name in self._stack():
+            self.queries[name] += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def capture_queries(self):
+        """
+        Count queries issued on this thread's connection.
+        """
+        with connection.execute_wrapper(self._count_query):
+            yield
+
+    @contextmanager
+    def scope(self, name):
+        stack = self._stack()
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    # -----------------------------------------------------------
+    # Phases
+    # -----------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name):
+
+        start = time.perf_counter()
+        try:
+            with self.scope(name):
+                yield
+        finally:
+            self.phases[name] = {
+                "wall_s": round(time.perf_counter() - start, 4),
+                "queries": self.queries[name],
+            }
+
+    def wrap(self, name, func, after=None):
+        """
+        `func` run as phase `name`; `after()` runs once it succeeds.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                result = func(*args, **kwargs)
+            if after:
+                after()
+            return result
+
+        return wrapper
+
+    def instrument_adapter(self, adapter, prefixes=INSTRUMENTED_METHOD_PREFIXES):
+        """
+        Count queries of each load/CRUD method of `adapter` separately.
+        """
+
+        label = type(adapter).__name__
+
+        for attr in dir(type(adapter)):
+            if not attr.startswith(prefixes) or not callable(getattr(type(adapter), attr, None)):
+                continue
+
+            method = getattr(adapter, attr)
+
+            def scoped(*args, _method=method, _name=f"{label}.{attr}", **kwargs):
+                with self.scope(_name):
+                    return _method(*args, **kwargs)
+
+            setattr(adapter, attr, functools.wraps(method)(scoped))
+
+        return adapter
+
+    # -----------------------------------------------------------
+    # HTTP
+    # -----------------------------------------------------------
+
+    def record_request(self, endpoint, latency, status_code=None):
+        """
+        PanoramaClient observer hook, called once per HTTP attempt.
+        """
+        with self._lock:
+            stats = self.http[endpoint]
+            stats["count"] += 1
+            stats["total_s"] += latency
+            stats["max_s"] = max(stats["max_s"], latency)
+            if status_code is None or status_code >= 400:
+                stats["errors"] += 1
+
+    # -----------------------------------------------------------
+    # Objects
+    # -----------------------------------------------------------
+
+    def count_objects(self, label, adapter):
+
+        if adapter is None:
+            return
+
+        self.object_counts[label] = {
+            modelname: len(adapter.get_all(modelname))
+            for modelname in sorted(adapter.store.get_all_model_names())
+        }
+
+    # -----------------------------------------------------------
+    # Summary
+    # -----------------------------------------------------------
+
+    @property
+    def duration(self):
+        return round(time.perf_counter() - self.started, 4)
+
+    def http_summary(self):
+        return {
+            endpoint: {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "total_s": round(stats["total_s"], 4),
+                "avg_ms": round(stats["total_s"] / stats["count"] * 1000, 2) if stats["count"] else 0,
+                "max_ms": round(stats["max_s"] * 1000, 2),
+            }
+            for endpoint, stats in sorted(self.http.items())
+        }
+
+    def query_summary(self):
+        # Phases are already reported with their own query totals
+        return {name: count for name, count in sorted(self.queries.items()) if name not in self.phases}
+
+    def summary(self):
+        return {
+            "duration": self.duration,
+            "phases": dict(self.phases),
+            "http": self.http_summary(),
+            "queries": self.query_summary(),
+            "objects": dict(self.object_counts),
+        }
+
+    def log_summary(self, logger, top=5):
+        """
+        Phase table plus the slowest endpoints and busiest methods.
+        """
+
+        logger.info("Sync performance: %.2fs total", self.duration)
+
+        for name, metrics in self.phases.items():
+            logger.info("  phase %s: %.2fs, %s queries", name, metrics["wall_s"], metrics["queries"])
+
+        http = sorted(self.http_summary().items(), key=lambda item: item[1]["total_s"], reverse=True)
+        for endpoint, stats in http[:top]:
+            logger.info(
+                "  http %s: %s calls, %s errors, avg %.1fms, max %.1fms",
+                endpoint,
+                stats["count"],
+                stats["errors"],
+                stats["avg_ms"],
+                stats["max_ms"],
+            )
+
+        queries = sorted(self.query_summary().items(), key=lambda item: item[1], reverse=True)
+        for name, count in queries[:top]:
+            logger.info("  queries %s: %s", name, count)
+
+        for label, counts in self.object_counts.items():
+            logger.info("  objects %s: %s", label, counts)
@@ -0,0 +1,133 @@
+"""
+Prometheus metrics for Panorama SSoT operations.
+
+Metrics are updated in-process wherever the event happens (client
+requests, commits, NQE calls, finished syncs) and exposed by the
+`api/metrics/` endpoint. When PROMETHEUS_MULTIPROC_DIR is set, as for
+Celery workers and multi-process web servers, prometheus_client writes
+each process's samples to that directory and the endpoint aggregates
+them with a MultiProcessCollector.
+
+All helpers are no-ops when prometheus_client is not installed.
+"""
+
+import os
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+    from prometheus_client import multiprocess
+except ImportError:
+    prometheus_client = None
+
+NAMESPACE = "nautobot_panorama_ssot"
+
+REQUEST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+COMMIT_BUCKETS = (5, 10, 30, 60, 120, 300, 600, 900)
+
+if prometheus_client:
+
+    REQUEST_LATENCY = Histogram(
+        "panorama_request_latency_seconds",
+        "Panorama REST/XML API request latency by endpoint",
+        ["panorama", "endpoint"],
+        namespace=NAMESPACE,
+        buckets=REQUEST_BUCKETS,
+    )
+
+    SYNCED_OBJECTS = Counter(
+        "synced_objects",
+        "Objects created, updated or deleted by sync jobs",
+        ["control_plane", "action"],
+        namespace=NAMESPACE,
+    )
+
+    COMMIT_DURATION = Histogram(
+        "panorama_commit_duration_seconds",
+        "Time from commit request to finished commit job per device group",
+        ["panorama", "device_group"],
+        namespace=NAMESPACE,
+        buckets=COMMIT_BUCKETS,
+    )
+
+    NQE_CALLS = Counter(
+        "forward_nqe_calls",
+        "Forward Networks NQE queries issued",
+        namespace=NAMESPACE,
+    )
+
+    LAST_SYNC_DURATION = Gauge(
+        "last_sync_duration_seconds",
+        "Duration of the most recent sync per SSOTPanoramaConfig",
+        ["config", "status"],
+        namespace=NAMESPACE,
+        multiprocess_mode="mostrecent",
+    )
+
+
+# ===========================================================
+# Recording
+# ===========================================================
+
+def observe_request(panorama, endpoint, latency):
+    if prometheus_client:
+        REQUEST_LATENCY.labels(panorama=panorama, endpoint=endpoint).observe(latency)
+
+
+def observe_commit(panorama, device_group, duration):
+    if prometheus_client:
+        COMMIT_DURATION.labels(panorama=panorama, device_group=device_group).observe(duration)
+
+
+def count_nqe_call():
+    if prometheus_client:
+        NQE_CALLS.inc()
+
+
+def record_sync(config_name, control_plane, duration, status, created=0, updated=0, deleted=0):
+    if not prometheus_client:
+        return
+
+    for action, count in (("create", created), ("update", updated), ("delete", deleted)):
+        if count:
+            SYNCED_OBJECTS.labels(control_plane=control_plane, action=action).inc(count)
+
+    LAST_SYNC_DURATION.labels(config=config_name, status=status).set(duration)
+
+
+# ===========================================================
+# Exposition
+# ===========================================================
+
+class _AppCollector:
+    """
+    Only this app's metric families from another collector; the default
+    registry and multiprocess directory also hold Nautobot's own.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def collect(self):
+        for family in self.source.collect():
+            if family.name.startswith(NAMESPACE):
+                yield family
+
+
+def render_metrics():
+    """
+    (payload, content_type) in the Prometheus text format, or None if
+    prometheus_client is not installed.
+    """
+    if not prometheus_client:
+        return None
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        source = multiprocess.MultiProcessCollector(None)
+    else:
+        source = prometheus_client.REGISTRY
+
+    registry = CollectorRegistry(auto_describe=False)
+    registry.register(_AppCollector(source))
+
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
@@ -0,0 +1,202 @@
+"""
+Device-group-partitioned diff calculation.
+
+Device groups only share the "shared" scope, so the diff of each
+LogicalGroupModel subtree can be computed independently. The shared
+scope is diffed first, the remaining device groups are diffed in
+worker processes, and the partial diffs are merged in that order so
+shared objects are still synced before the device groups using them.
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from diffsync import DiffSync
+from diffsync.diff import Diff
+from diffsync.enum import DiffSyncFlags
+
+logger = logging.getLogger(__name__)
+
+SHARED_SCOPE = "shared"
+
+# Model types diffed inside a partition, in sync order
+PARTITION_MODEL_TYPES = (
+    "logical_group",
+    "tag",
+    "address",
+    "address_group",
+    "service",
+    "service_group",
+    "application",
+    "application_group",
+    "nat_rule",
+    "rule",
+)
+
+# Pydantic fields that point back at the adapter and must not be shipped,
+# plus DiffSync flags (always the class default here, and not JSON-safe)
+_EXCLUDED_FIELDS = {"adapter", "diffsync", "model_flags"}
+
+
+def model_record(model):
+    """
+    Field values that rebuild `model` with `type(model)(**record)`.
+
+    Unset values are left out: child list fields such as
+    ControlPlaneModel.virtual_systems default to None, which pydantic
+    rejects when passed back explicitly.
+    """
+    return model.dict(exclude=_EXCLUDED_FIELDS, exclude_none=True)
+
+
+class _PartitionAdapter(DiffSync):
+    """
+    Bare adapter holding one partition's records inside a worker.
+    """
+
+    def __init__(self, name, models, top_level):
+        super().__init__(name=name)
+        self.top_level = list(top_level)
+        for modelname, model_cls in models.items():
+            setattr(self, modelname, model_cls)
+
+    def load_records(self, records):
+        for modelname, data in records:
+            self.add(getattr(self, modelname)(**data))
+
+
+def _partition_key(modelname, model):
+
+    if modelname == "logical_group":
+        return model.name
+
+    return getattr(model, "logical_group", None) or getattr(model, "device_group", SHARED_SCOPE)
+
+
+def split_by_logical_group(adapter, model_types=PARTITION_MODEL_TYPES):
+    """
+    {logical_group: [(modelname, data), ...]} for one adapter.
+    """
+    partitions = defaultdict(list)
+
+    for modelname in model_types:
+        if not hasattr(adapter, modelname):
+            continue
+        for model in adapter.get_all(modelname):
+            partitions[_partition_key(modelname, model)].append((modelname, model_record(model)))
+
+    return partitions
+
+
+def _diff_partition(models, top_level, source_name, target_name, source_records, target_records, flags):
+
+    source = _PartitionAdapter(source_name, models, top_level)
+    target = _PartitionAdapter(target_name, models, top_level)
+
+    source.load_records(source_records)
+    target.load_records(target_records)
+
+    return source.diff_to(target, flags=flags)
+
+
+def _merge(merged, partial, callback=None, total=0):
+
+    for element in partial.get_children():
+        merged.add(element)
+
+    merged.models_processed += getattr(partial, "models_processed", 0)
+
+    if callback:
+        callback("diff", merged.models_processed, total)
+
+
+def _can_fork():
+    # Daemonic processes (e.g. some worker pools) may not spawn children
+    return not multiprocessing.current_process().daemon
+
+
+def partitioned_diff(source, target, flags=DiffSyncFlags.NONE, max_workers=None, callback=None):
+    """
+    Diff `source` to `target` one logical group at a time and merge the
+    results into a single Diff usable by `sync_to(..., diff=...)`.
+
+    `callback(stage, current, total)` is called after each partition,
+    as DiffSync calls it during a serial diff.
+    """
+
+    model_types = [m for m in PARTITION_MODEL_TYPES if hasattr(source, m)]
+    models = {m: getattr(source, m) for m in model_types + ["control_plane"] if hasattr(source, m)}
+
+    source_parts = split_by_logical_group(source, model_types)
+    target_parts = split_by_logical_group(target, model_types)
+
+    names = sorted((set(source_parts) | set(target_parts)) - {SHARED_SCOPE})
+
+    def args(scope, top_level=model_types):
+        return (
+            models,
+            top_level,
+            source.name,
+            target.name,
+            source_parts.get(scope, []),
+            target_parts.get(scope, []),
+            flags,
+        )
+
+    merged = Diff()
+    progress = {"callback": callback, "total": len(source) + len(target)}
+
+    # Control planes
+    _merge(merged, _diff_partition(
+        models,
+        ["control_plane"],
+        source.name,
+        target.name,
+        [("control_plane", model_record(m)) for m in source.get_all("control_plane")],
+        [("control_plane", model_record(m)) for m in target.get_all("control_plane")],
+        flags,
+    ), **progress)
+
+    # Shared scope first
+    _merge(merged, _diff_partition(*args(SHARED_SCOPE)), **progress)
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    if max_workers > 1 and len(names) > 1 and _can_fork():
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            futures = [executor.submit(_diff_partition, *args(dg)) for dg in names]
+            for f in futures:
+                _merge(merged, f.result(), **progress)
+    else:
+        for dg in names:
+            _merge(merged, _diff_partition(*args(dg)), **progress)
+
+    merged.complete()
+    return merged
+
+
+class PartitionedDiffMixin:
+    """
+    Adapter mixin routing `diff_to` through `partitioned_diff` when
+    `partitioned_diff` is enabled on the source adapter.
+    """
+
+    partitioned_diff = False
+    partition_workers = None
+
+    def diff_to(self, target, diff_class=Diff, flags=DiffSyncFlags.NONE, callback=None):
+
+        if self.partitioned_diff:
+            logger.info("Calculating partitioned diff by logical group")
+            return partitioned_diff(
+                self,
+                target,
+                flags=flags,
+                max_workers=self.partition_workers,
+                callback=callback,
+            )
+
+        return super().diff_to(target, diff_class=diff_class, flags=flags, callback=callback)
@@ -0,0 +1,122 @@
+"""
+Opt-in profiling of sync job runs.
+
+RunProfiler wraps either cProfile (deterministic) or pyinstrument
+(sampling, when installed) and may be switched on and off around
+several sections, e.g. only the diff and execute phases; samples from
+all sections are combined. Nothing is imported or wrapped unless a job
+asks for a profile.
+"""
+
+import cProfile
+import functools
+import io
+import marshal
+import pstats
+from contextlib import contextmanager
+
+try:
+    import pyinstrument
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:
+    pyinstrument = None
+
+from nautobot_panorama_ssot.constant import PROFILER_PYINSTRUMENT
+
+DEFAULT_SAMPLING_INTERVAL = 0.001
+
+
+class RunProfiler:
+
+    def __init__(self, kind, interval=DEFAULT_SAMPLING_INTERVAL):
+
+        if kind == PROFILER_PYINSTRUMENT and pyinstrument is None:
+            raise ImportError("pyinstrument profiling requires the 'pyinstrument' package")
+
+        self.kind = kind
+
+        if kind == PROFILER_PYINSTRUMENT:
+            self._profiler = pyinstrument.Profiler(interval=interval)
+        else:
+            self._profiler = cProfile.Profile()
+
+        self._depth = 0
+
+    # -----------------------------------------------------------
+    # Sections
+    # -----------------------------------------------------------
+
+    @contextmanager
+    def section(self):
+        """
+        Profile the enclosed block. Nested sections are no-ops.
+        """
+
+        self._depth += 1
+        if self._depth == 1:
+            self._start()
+        try:
+            yield
+        finally:
+            if self._depth == 1:
+                self._stop()
+            self._depth -= 1
+
+    def wrap(self, func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.section():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def _start(self):
+        if self.kind == PROFILER_PYINSTRUMENT:
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def _stop(self):
+        if self.kind == PROFILER_PYINSTRUMENT:
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+    # -----------------------------------------------------------
+    # Output
+    # -----------------------------------------------------------
+
+    def summary(self, limit=25):
+        """
+        Text report of the hottest call paths/functions.
+        """
+
+        if self.kind == PROFILER_PYINSTRUMENT:
+            return self._profiler.output_text(unicode=False, color=False)
+
+        stream = io.StringIO()
+        pstats.Stats(self._profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+    def artifacts(self, prefix="panorama-sync"):
+        """
+        [(filename, bytes), ...] to attach to the job result.
+
+        pyinstrument yields an HTML flamegraph and a speedscope JSON
+        profile; cProfile yields a pstats dump (snakeviz, gprof2dot,
+        pstats) and the text summary.
+        """
+
+        if self.kind == PROFILER_PYINSTRUMENT:
+            session = self._profiler.last_session
+            return [
+                (f"{prefix}.html", self._profiler.output_html().encode()),
+                (f"{prefix}.speedscope.json", SpeedscopeRenderer().render(session).encode()),
+            ]
+
+        self._profiler.create_stats()
+        return [
+            (f"{prefix}.pstats", marshal.dumps(self._profiler.stats)),
+            (f"{prefix}.txt", self.summary().encode()),
+        ]
@@ -0,0 +1,115 @@
+"""
+Client-side flow control for PanoramaClient.
+
+TokenBucket caps the request rate. AdaptiveConcurrencyLimiter caps the
+number of in-flight requests and moves that cap with AIMD: it grows by
+one slot per window of fast, successful responses and halves when
+Panorama answers 429/503 or responds slower than the latency target.
+It halves at most once per round trip: overload signals from requests
+sent before the last decrease are ignored.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+
+from nautobot_panorama_ssot.constant import (
+    DEFAULT_LATENCY_TARGET,
+    OVERLOAD_STATUS_CODES,
+)
+
+
+class TokenBucket:
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(rate, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def _take(self):
+        """
+        Take a token; 0 on success, otherwise seconds until one is due.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """
+        Block until a token is available.
+        """
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        acquire() for AsyncPanoramaClient, without blocking the event loop.
+        """
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+
+    def __init__(self, max_limit, min_limit=1, initial=None, latency_target=DEFAULT_LATENCY_TARGET):
+        self.max_limit = max(int(max_limit), 1)
+        self.min_limit = max(min(int(min_limit), self.max_limit), 1)
+        self.limit = float(initial or self.max_limit)
+        self.latency_target = latency_target
+
+        self.in_flight = 0
+        self.decreases = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    @property
+    def current_limit(self):
+        return int(self.limit)
+
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            while self.in_flight >= self.current_limit:
+                self._cond.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify()
+
+    def record(self, latency, status_code=None):
+        """
+        Feed one response into the AIMD controller.
+        """
+        now = time.monotonic()
+
+        with self._cond:
+            if status_code in OVERLOAD_STATUS_CODES or latency > self.latency_target:
+                # Sent before the last decrease: already accounted for
+                if now - latency >= self._last_decrease:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self.decreases += 1
+                    self._last_decrease = now
+            else:
+                # +1 slot per `limit` successful responses
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
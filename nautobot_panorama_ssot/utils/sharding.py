@@ -0,0 +1,139 @@
+"""
+Device-group sharding of Panorama -> Nautobot syncs.
+
+A coordinator job splits a control plane into shards of device groups,
+enqueues one child sync job per shard on the Celery queue and waits for
+them. The shared scope is its own first shard and must finish before
+the device-group shards are dispatched, since their objects reference
+shared ones. The child PanoramaSyncLogs are then rolled up into one.
+"""
+
+import time
+
+from django.utils import timezone
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import Job as JobModel
+from nautobot.extras.models import JobResult
+
+from nautobot_panorama_ssot.constant import DEFAULT_SHARD_SIZE, DEFAULT_SHARD_TIMEOUT
+from nautobot_panorama_ssot.models import PanoramaSyncLog
+
+SHARED_SCOPE = "shared"
+
+SHARD_POLL_INTERVAL = 5
+
+
+def plan_shards(device_groups, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    [["shared"], [dg, ...], ...]; shared always comes first and alone.
+    """
+
+    names = sorted(dg for dg in set(device_groups) if dg != SHARED_SCOPE)
+    shard_size = max(1, shard_size)
+
+    return [[SHARED_SCOPE]] + [names[i:i + shard_size] for i in range(0, len(names), shard_size)]
+
+
+def enqueue_child_job(job_class, user, job_kwargs, task_queue=None):
+    """
+    Enqueue `job_class` with `job_kwargs` and return its JobResult.
+    """
+
+    job_model = JobModel.objects.get_for_class_path(job_class.class_path)
+
+    return JobResult.enqueue_job(
+        job_model,
+        user,
+        task_queue=task_queue,
+        **job_class.serialize_data(job_kwargs),
+    )
+
+
+def wait_for_shards(job_results, timeout=DEFAULT_SHARD_TIMEOUT, poll_interval=SHARD_POLL_INTERVAL):
+    """
+    Block until every JobResult is finished. Raises TimeoutError with
+    the results still running after `timeout` seconds.
+    """
+
+    deadline = time.monotonic() + timeout
+    pending = list(job_results)
+
+    while pending:
+        for job_result in pending:
+            job_result.refresh_from_db(fields=["status"])
+
+        pending = [jr for jr in pending if jr.status not in JobResultStatusChoices.READY_STATES]
+        if not pending:
+            return
+
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{len(pending)} shard job(s) still running after {timeout}s")
+
+        time.sleep(poll_interval)
+
+
+def shard_status(job_results):
+    """
+    Overall PanoramaSyncLog status of finished shard JobResults.
+    """
+
+    succeeded = sum(jr.status == JobResultStatusChoices.STATUS_SUCCESS for jr in job_results)
+
+    if succeeded == len(job_results):
+        return "success"
+    return "partial" if succeeded else "failed"
+
+
+def aggregate_sync_logs(config, shards, job_result=None, started=None):
+    """
+    One PanoramaSyncLog for a sharded run from the shard jobs' own logs.
+
+    `shards` is [(device_groups, JobResult), ...] in dispatch order.
+    """
+
+    logs = {
+        log.job_result_id: log
+        for log in PanoramaSyncLog.objects.filter(job_result__in=[jr for _, jr in shards])
+    }
+
+    per_shard = {}
+    http_stats = {}
+    errors = []
+
+    for device_groups, shard_result in shards:
+        log = logs.get(shard_result.pk)
+        label = ",".join(device_groups)
+
+        per_shard[label] = {
+            "job_result": str(shard_result.pk),
+            "status": shard_result.status,
+            "wall_s": log.duration if log else None,
+        }
+
+        if log is None:
+            continue
+
+        if log.error_message:
+            errors.append(f"{label}: {log.error_message}")
+
+        for endpoint, stats in (log.http_stats or {}).items():
+            total = http_stats.setdefault(endpoint, {"count": 0, "errors": 0, "total_s": 0.0})
+            for key in total:
+                total[key] += stats.get(key, 0)
+
+    results = [jr for _, jr in shards]
+    finished = timezone.now()
+
+    return PanoramaSyncLog.objects.create(
+        connection=config,
+        job_result=job_result,
+        sync_end=finished,
+        status=shard_status(results),
+        error_message="\n".join(errors),
+        objects_created=sum(log.objects_created for log in logs.values()),
+        objects_updated=sum(log.objects_updated for log in logs.values()),
+        objects_deleted=sum(log.objects_deleted for log in logs.values()),
+        duration=(finished - started).total_seconds() if started else None,
+        phase_timings={"shards": per_shard},
+        http_stats=http_stats,
+    )
@@ -0,0 +1,639 @@
+"""
+Local Panorama REST API simulator.
+
+Serves the endpoints PanoramaClient uses (Objects, Policies, Commit,
+Jobs, HitCount, config snapshots and the XML config and op API) from an
+in-memory dataset, so load, sync and commit paths can be exercised and
+benchmarked without a real Panorama.
+
+Dataset layout:
+
+    {
+        "device_groups": ["dg-1", ...],
+        "scopes": {"shared": {"Objects/Addresses": [entry, ...], ...}, "dg-1": {...}},
+        "hit_counts": {"dg-1": [{"rule-name": ..., "hit-count": ...}, ...]},
+    }
+
+Latency, error rate and commit/validate job durations are configurable;
+random behaviour is seeded so runs are reproducible.
+
+    python -m nautobot_panorama_ssot.utils.simulator --dataset dataset.json --port 8443
+"""
+
+import argparse
+import copy
+import gzip
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from nautobot_panorama_ssot.constant import PANORAMA_API_PATH
+from nautobot_panorama_ssot.utils.client import (
+    OBJECT_PATHS,
+    PENDING_CHANGES_CMD,
+    SHOW_JOBS_CMD,
+    rulebase_path,
+)
+
+logger = logging.getLogger(__name__)
+
+SHARED_SCOPE = "shared"
+
+# REST collection -> element path inside a device-group / shared XML config
+XML_PATHS = {
+    OBJECT_PATHS["tags"]: "tag",
+    OBJECT_PATHS["addresses"]: "address",
+    OBJECT_PATHS["address_groups"]: "address-group",
+    OBJECT_PATHS["services"]: "service",
+    OBJECT_PATHS["service_groups"]: "service-group",
+    OBJECT_PATHS["applications"]: "application",
+    OBJECT_PATHS["application_groups"]: "application-group",
+    rulebase_path("Security", "pre"): "pre-rulebase/security/rules",
+    rulebase_path("Security", "post"): "post-rulebase/security/rules",
+    rulebase_path("Nat", "pre"): "pre-rulebase/nat/rules",
+    rulebase_path("Nat", "post"): "post-rulebase/nat/rules",
+}
+
+COLLECTIONS = tuple(XML_PATHS)
+
+_REST_PATH = re.compile(r"^/restapi/v[\d.]+/(?P<path>.+)$")
+_XPATH_DG = re.compile(r"device-group/entry\[@name='(?P<dg>[^']+)'\]")
+
+# Bodies larger than this are gzip-encoded when the client accepts it
+_GZIP_MIN_SIZE = 1024
+
+
+# ===========================================================
+# XML Rendering
+# ===========================================================
+
+def _append_value(parent, key, value):
+
+    if isinstance(value, dict) and "member" in value:
+        value = value["member"]
+
+    element = ET.SubElement(parent, key)
+
+    if isinstance(value, list):
+        for member in value:
+            ET.SubElement(element, "member").text = str(member)
+    elif isinstance(value, dict):
+        for child_key, child_value in value.items():
+            if not child_key.startswith("@"):
+                _append_value(element, child_key, child_value)
+    elif value is not None:
+        element.text = str(value)
+
+
+def _append_entry(parent, entry):
+
+    element = ET.SubElement(parent, "entry", name=entry.get("@name") or entry["name"])
+
+    for key, value in entry.items():
+        if key == "name" or key.startswith("@"):
+            continue
+        _append_value(element, key, value)
+
+
+def scope_to_xml(scope_name, collections):
+    """
+    <entry name="..."> element holding one scope's objects and rules.
+    """
+    root = ET.Element("entry", name=scope_name)
+
+    for path, xml_path in XML_PATHS.items():
+        entries = collections.get(path)
+        if not entries:
+            continue
+
+        node = root
+        for tag in xml_path.split("/"):
+            child = node.find(tag)
+            node = child if child is not None else ET.SubElement(node, tag)
+
+        for entry in entries:
+            _append_entry(node, entry)
+
+    return root
+
+
+# ===========================================================
+# State
+# ===========================================================
+
+class SimulatorState:
+    """
+    Mutable Panorama configuration plus running jobs and snapshots.
+    """
+
+    def __init__(self, dataset, commit_duration=2.0, validate_duration=1.0, commit_failure_rate=0.0, seed=0):
+        self.device_groups = list(dataset.get("device_groups", []))
+        self.hit_counts = copy.deepcopy(dataset.get("hit_counts", {}))
+
+        # {scope: {collection: {name: entry}}}, insertion order is rule order
+        self.scopes = {}
+        for scope in [SHARED_SCOPE] + self.device_groups:
+            collections = dataset.get("scopes", {}).get(scope, {})
+            self.scopes[scope] = {
+                path: {(e.get("@name") or e["name"]): dict(e) for e in collections.get(path, [])}
+                for path in COLLECTIONS
+            }
+
+        self.commit_duration = commit_duration
+        self.validate_duration = validate_duration
+        self.commit_failure_rate = commit_failure_rate
+
+        self.jobs = {}
+        self.snapshots = {}
+        # uncommitted candidate changes, reported by check pending-changes
+        self.pending = False
+        self._ids = itertools.count(1)
+        self._rng = random.Random(seed)
+        self.lock = threading.RLock()
+
+    # -----------------------------------------------------------
+    # Objects
+    # -----------------------------------------------------------
+
+    def collection(self, scope, path):
+        if scope not in self.scopes or path not in COLLECTIONS:
+            return None
+        return self.scopes[scope][path]
+
+    def move(self, scope, path, name, where, destination=None):
+        """
+        Reorder a rulebase: where is top, bottom, before or after a
+        named rule, or before an integer position.
+        """
+        rules = self.scopes[scope][path]
+        entry = rules.pop(name)
+        names = list(rules)
+
+        if where == "top":
+            index = 0
+        elif isinstance(destination, int):
+            index = min(max(destination, 0), len(names))
+        elif where == "bottom" or destination not in rules:
+            index = len(names)
+        else:
+            index = names.index(destination) + (1 if where == "after" else 0)
+
+        names.insert(index, name)
+        reordered = {n: rules.get(n, entry) for n in names}
+        rules.clear()
+        rules.update(reordered)
+        self.pending = True
+
+    def to_xml(self, scope):
+        collections = {path: list(entries.values()) for path, entries in self.scopes[scope].items()}
+        return ET.tostring(scope_to_xml(scope, collections))
+
+    # -----------------------------------------------------------
+    # Jobs
+    # -----------------------------------------------------------
+
+    def start_job(self, kind, device_group):
+
+        job_id = str(next(self._ids))
+        duration = self.commit_duration if kind == "commit" else self.validate_duration
+        failed = self._rng.random() < self.commit_failure_rate
+
+        self.jobs[job_id] = {
+            "id": job_id,
+            "type": kind,
+            "device-group": device_group,
+            "done_at": time.monotonic() + duration,
+            "result": "FAIL" if failed else "OK",
+        }
+
+        if kind == "commit" and not failed:
+            self.pending = False
+
+        return job_id
+
+    def job_status(self, job_id):
+
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+
+        if time.monotonic() < job["done_at"]:
+            return {"id": job_id, "status": "ACT", "result": "PEND"}
+
+        return {"id": job_id, "status": "FIN", "result": job["result"]}
+
+    def jobs_to_xml(self):
+
+        root = ET.Element("result")
+        for job_id, job in self.jobs.items():
+            status = self.job_status(job_id)
+            element = ET.SubElement(root, "job")
+            ET.SubElement(element, "id").text = job_id
+            ET.SubElement(element, "type").text = job["type"].capitalize()
+            ET.SubElement(element, "status").text = status["status"]
+            ET.SubElement(element, "result").text = status["result"]
+
+        return ET.tostring(root)
+
+    # -----------------------------------------------------------
+    # Snapshots
+    # -----------------------------------------------------------
+
+    def snapshot(self, device_group):
+        snapshot_id = str(next(self._ids))
+        self.snapshots[snapshot_id] = (device_group, copy.deepcopy(self.scopes.get(device_group, {})))
+        return {"id": snapshot_id, "device-group": device_group}
+
+    def rollback(self, snapshot_id):
+        device_group, collections = self.snapshots[snapshot_id]
+        self.scopes[device_group] = copy.deepcopy(collections)
+        self.pending = True
+
+
+# ===========================================================
+# HTTP Handler
+# ===========================================================
+
+def _list_response(entries):
+    return {
+        "@status": "success",
+        "@code": "19",
+        "result": {
+            "@total-count": str(len(entries)),
+            "@count": str(len(entries)),
+            "entry": entries,
+        },
+    }
+
+
+def _scope_from_params(params):
+    if params.get("location") == "device-group":
+        return params.get("device-group")
+    return SHARED_SCOPE
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    server_version = "PanoramaSimulator/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # -----------------------------------------------------------
+    # Plumbing
+    # -----------------------------------------------------------
+
+    def log_message(self, fmt, *args):
+        logger.debug(fmt, *args)
+
+    @property
+    def simulator(self):
+        return self.server.simulator
+
+    def _params(self):
+        return {k: v[-1] for k, v in parse_qs(urlparse(self.path).query).items()}
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _send(self, status, body, content_type="application/json"):
+
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+
+        headers = {"Content-Type": content_type}
+
+        if len(body) > _GZIP_MIN_SIZE and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, {"@status": "error", "message": message})
+
+    def _dispatch(self, method):
+
+        sim = self.simulator
+        route = urlparse(self.path).path
+        sim.record(method, route)
+
+        if sim.api_key and self.headers.get("X-PAN-KEY") != sim.api_key:
+            return self._error(403, "Invalid credentials")
+
+        sim.delay()
+
+        if sim.inject_error():
+            return self._error(sim.error_status, "Simulated failure")
+
+        if route == PANORAMA_API_PATH:
+            return self._xml_api()
+
+        match = _REST_PATH.match(route)
+        if not match:
+            return self._error(404, f"Unknown endpoint {route}")
+
+        try:
+            with sim.state.lock:
+                self._rest(method, match.group("path"))
+        except (KeyError, ValueError) as exc:
+            self._error(400, f"Bad request: {exc}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    # -----------------------------------------------------------
+    # REST API
+    # -----------------------------------------------------------
+
+    def _rest(self, method, path):
+
+        state = self.simulator.state
+        params = self._params()
+
+        if path == "Panorama/DeviceGroups" and method == "GET":
+            return self._send(200, _list_response([{"@name": dg} for dg in state.device_groups]))
+
+        if path == "Policies/HitCount" and method == "GET":
+            return self._send(200, {"result": state.hit_counts.get(_scope_from_params(params), [])})
+
+        if path in ("Commit", "Commit/Validate") and method == "POST":
+            kind = "commit" if path == "Commit" else "validate"
+            job_id = state.start_job(kind, self._body().get("device-group"))
+            return self._send(200, {"job": job_id})
+
+        if path.startswith("Jobs/") and method == "GET":
+            status = state.job_status(path.split("/", 1)[1])
+            if status is None:
+                return self._error(404, "No such job")
+            return self._send(200, status)
+
+        if path.startswith("Config/Snapshot/") and method == "GET":
+            device_group = path.split("/", 2)[2]
+            if device_group not in state.scopes:
+                return self._error(404, "No such device group")
+            return self._send(200, state.snapshot(device_group))
+
+        if path == "Config/Rollback" and method == "POST":
+            snapshot_id = self._body().get("id")
+            if snapshot_id not in state.snapshots:
+                return self._error(404, "No such snapshot")
+            state.rollback(snapshot_id)
+            return self._send(200, {"@status": "success"})
+
+        return self._objects(method, path, params)
+
+    def _objects(self, method, path, params):
+
+        state = self.simulator.state
+        scope = _scope_from_params(params)
+
+        path, _, action = path.partition(":")
+        collection_path, name = path, params.get("name", "")
+        if collection_path not in COLLECTIONS and "/" in path:
+            collection_path, name = path.rsplit("/", 1)
+
+        entries = state.collection(scope, collection_path)
+        if entries is None:
+            return self._error(404, f"Unknown collection or location {path}")
+
+        if action == "move" and method == "POST":
+            if name not in entries:
+                return self._error(404, f"{name} not found")
+            body = self._body()
+            state.move(scope, collection_path, name, body.get("where", "bottom"), body.get("destination"))
+            return self._send(200, {"@status": "success"})
+
+        if method == "GET":
+            if not name:
+                return self._send(200, _list_response(list(entries.values())))
+            if name not in entries:
+                return self._error(404, f"{name} not found")
+            return self._send(200, _list_response([entries[name]]))
+
+        if method == "POST":
+            entry = self._body()["entry"]
+            name = entry.get("@name") or entry["name"]
+            if name in entries:
+                return self._error(409, f"{name} already exists")
+            entries[name] = entry
+            state.pending = True
+            return self._send(201, {"@status": "success"})
+
+        if method == "PUT":
+            if name not in entries:
+                return self._error(404, f"{name} not found")
+            entries[name].update(self._body()["entry"])
+            state.pending = True
+            return self._send(200, {"@status": "success"})
+
+        if method == "DELETE":
+            if entries.pop(name, None) is None:
+                return self._error(404, f"{name} not found")
+            state.pending = True
+            return self._send(200, {"@status": "success"})
+
+        return self._error(405, f"{method} not allowed on {path}")
+
+    # -----------------------------------------------------------
+    # XML API
+    # -----------------------------------------------------------
+
+    def _xml_api(self):
+
+        params = self._params()
+        state = self.simulator.state
+
+        if params.get("type") == "op":
+            return self._xml_op(params.get("cmd", ""))
+
+        if params.get("type") != "config" or params.get("action") not in ("get", "show"):
+            return self._error(400, "Only config get/show and op commands are simulated")
+
+        match = _XPATH_DG.search(params.get("xpath", ""))
+        scope = match.group("dg") if match else SHARED_SCOPE
+
+        with state.lock:
+            if scope not in state.scopes:
+                return self._error(404, f"No such device group {scope}")
+            body = state.to_xml(scope)
+
+        self._send(200, b'<response status="success"><result>' + body + b"</result></response>", "application/xml")
+
+    def _xml_op(self, cmd):
+
+        state = self.simulator.state
+
+        with state.lock:
+            if cmd == PENDING_CHANGES_CMD:
+                result = b"<result>" + (b"yes" if state.pending else b"no") + b"</result>"
+            elif cmd == SHOW_JOBS_CMD:
+                result = state.jobs_to_xml()
+            else:
+                return self._error(400, f"Unsupported op command {cmd}")
+
+        self._send(200, b'<response status="success">' + result + b"</response>", "application/xml")
+
+
+# ===========================================================
+# Server
+# ===========================================================
+
+class PanoramaSimulator:
+    """
+    Threaded HTTP server wrapping a SimulatorState.
+
+        with PanoramaSimulator(dataset, latency=0.02) as sim:
+            client = PanoramaClient(sim.base_url, sim.api_key, verify_ssl=False)
+    """
+
+    def __init__(
+        self,
+        dataset,
+        host="127.0.0.1",
+        port=0,
+        api_key="simulator",
+        latency=0.0,
+        latency_jitter=0.0,
+        error_rate=0.0,
+        error_status=503,
+        commit_duration=2.0,
+        validate_duration=1.0,
+        commit_failure_rate=0.0,
+        seed=0,
+    ):
+        self.api_key = api_key
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+        self.state = SimulatorState(
+            dataset,
+            commit_duration=commit_duration,
+            validate_duration=validate_duration,
+            commit_failure_rate=commit_failure_rate,
+            seed=seed,
+        )
+
+        self.request_counts = Counter()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.simulator = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def total_requests(self):
+        return sum(self.request_counts.values())
+
+    def record(self, method, route):
+        with self._rng_lock:
+            self.request_counts[(method, route)] += 1
+
+    def delay(self):
+        if not (self.latency or self.latency_jitter):
+            return
+        with self._rng_lock:
+            jitter = self._rng.uniform(0, self.latency_jitter)
+        time.sleep(self.latency + jitter)
+
+    def inject_error(self):
+        if not self.error_rate:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < self.error_rate
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Serve a simulated Panorama REST API")
+    parser.add_argument("--dataset", required=True, help="Dataset JSON file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--api-key", default="simulator")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed per-request latency (seconds)")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Extra uniform random latency (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--commit-duration", type=float, default=2.0)
+    parser.add_argument("--validate-duration", type=float, default=1.0)
+    parser.add_argument("--commit-failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with open(args.dataset, encoding="utf-8") as handle:
+        dataset = json.load(handle)
+
+    simulator = PanoramaSimulator(
+        dataset,
+        host=args.host,
+        port=args.port,
+        api_key=args.api_key,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        commit_duration=args.commit_duration,
+        validate_duration=args.validate_duration,
+        commit_failure_rate=args.commit_failure_rate,
+        seed=args.seed,
+    )
+
+    print(f"Simulated Panorama listening on {simulator.base_url}")
+    try:
+        simulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Per-device-group state persisted between runs.
+
+PanoramaAdapter records each device group's config version (a digest
+of its candidate config subtree) with the records it loaded. While a
+device group's version has not moved since the previous successful
+run, it is rebuilt from the stored records instead of being fetched
+from Panorama again; commits to other device groups do not affect it.
+"""
+
+from django.db import transaction
+
+from nautobot_panorama_ssot.models import PanoramaDeviceGroupState
+from nautobot_panorama_ssot.utils.partition import (
+    PARTITION_MODEL_TYPES,
+    split_by_logical_group,
+)
+
+# The logical group itself is always rebuilt by PanoramaAdapter.load
+STATE_MODEL_TYPES = tuple(m for m in PARTITION_MODEL_TYPES if m != "logical_group")
+
+
+def load_device_group_states(control_plane):
+    """
+    {device_group: PanoramaDeviceGroupState} for one control plane.
+    """
+    return {
+        state.device_group: state
+        for state in PanoramaDeviceGroupState.objects.filter(control_plane=control_plane)
+    }
+
+
+def snapshot_device_group_records(adapter, device_groups):
+    """
+    {device_group: records} as loaded, before anything prunes the adapter.
+    """
+
+    records = split_by_logical_group(adapter, STATE_MODEL_TYPES)
+
+    return {dg: records.get(dg, []) for dg in device_groups}
+
+
+def save_device_group_states(control_plane, versions, snapshot, keep=None):
+    """
+    Store snapshotted records under their device group's version from
+    `versions` and, with `keep`, drop states of device groups not in it.
+    """
+
+    with transaction.atomic():
+
+        for dg, records in snapshot.items():
+            if not versions.get(dg):
+                continue
+            PanoramaDeviceGroupState.objects.update_or_create(
+                control_plane=control_plane,
+                device_group=dg,
+                defaults={
+                    "config_version": versions[dg],
+                    "records": records,
+                },
+            )
+
+        if keep is not None:
+            PanoramaDeviceGroupState.objects.filter(
+                control_plane=control_plane,
+            ).exclude(
+                device_group__in=list(keep),
+            ).delete()
@@ -0,0 +1,67 @@
+"""
+Per-job symbol table for identifier strings.
+
+Logical group, tag, zone and member names are loaded once by
+PanoramaAdapter and again by NautobotAdapter. Routing them through one
+table per job makes both adapters share a single string object per
+identifier, and the table is released together with the job.
+"""
+
+import contextvars
+import sys
+from contextlib import contextmanager
+
+_active_table = contextvars.ContextVar("panorama_symbol_table", default=None)
+
+
+class SymbolTable:
+
+    def __init__(self):
+        self._symbols = {}
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def intern(self, value):
+        if not isinstance(value, str):
+            return value
+        return self._symbols.setdefault(value, value)
+
+    def intern_all(self, values):
+        return tuple(self.intern(v) for v in values)
+
+
+def get_symbol_table():
+    return _active_table.get()
+
+
+def resolve_symbol_table(symbols=None):
+    """
+    `symbols` if given, else the active job table, else a new table.
+    Tested against None: an empty table is falsy.
+    """
+    if symbols is not None:
+        return symbols
+
+    table = _active_table.get()
+    return table if table is not None else SymbolTable()
+
+
+def intern_symbol(value):
+    """
+    Intern through the active job table, or the interpreter pool when
+    no job table is active.
+    """
+    table = _active_table.get()
+    if table is not None:
+        return table.intern(value)
+    return sys.intern(value)
+
+
+@contextmanager
+def use_symbol_table(table):
+    token = _active_table.set(table)
+    try:
+        yield table
+    finally:
+        _active_table.reset(token)
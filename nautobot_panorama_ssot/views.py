@@ -70,6 +70,8 @@ class SSOTPanoramaConfigUIViewSet(
                     "default_status",
                     "job_enabled",
                     "enable_sync_to_panorama",
+                    "max_requests_per_second",
+                    "max_concurrency",
                 ],
             ),
         ]